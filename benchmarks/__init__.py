@@ -0,0 +1 @@
+"""NLPiper Benchmarks."""
@@ -0,0 +1,54 @@
+"""Run the benchmark suite.
+
+Example:
+    $ python -m benchmarks --size 500 --output results.json
+    $ python -m benchmarks --baseline results.json --tolerance 0.2
+"""
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from benchmarks.corpora import CORPORA
+from benchmarks.suite import CASES, DOCUMENT_CLASSES, compare, run_suite
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description="Benchmark the NLPiper transformers.")
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), help="Cases to run, by default all of them.")
+    parser.add_argument('--corpora', nargs='+', choices=list(CORPORA), default=list(CORPORA),
+                        help="Corpora to run the cases on, by default all of them.")
+    parser.add_argument('--size', type=int, default=500, help="Documents per corpus, by default 500.")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs of each case, the best is kept.")
+    parser.add_argument('--document', choices=list(DOCUMENT_CLASSES), default='document',
+                        help="Document class of the processed documents, by default `document`.")
+    parser.add_argument('--output', help="Path of the JSON file where the results are written.")
+    parser.add_argument('--baseline', help="Path of the JSON results of a previous run to compare against.")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="Relative throughput drop, or peak memory growth, reported as a regression.")
+    args = parser.parse_args(argv)
+
+    corpora = {name: CORPORA[name](args.size) for name in args.corpora}
+    results = run_suite(corpora, args.cases, args.repeat, DOCUMENT_CLASSES[args.document])
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+
+        for case, corpus, metric, before, after in regressions:
+            print(f"REGRESSION {case} [{corpus}] {metric}: {before:.1f} -> {after:.1f}")
+
+        if regressions:
+            return 1
+
+        print("No regressions against the baseline")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Synthetic Corpora Module.
+
+Deterministic corpora shaped like the texts NLPiper is used on, generated from a seed so every run, and every
+machine, benchmarks the same documents.
+"""
+import random
+from typing import Callable, Dict, List
+
+_WORDS = (
+    "the of and to in is that for it as was with be by on not he this are or his from at which but have an they "
+    "you were her she there one all we their has been would will more if no out so said what up its about into "
+    "than them can only other new some could time these two may then do first any my now such like our over "
+    "document pipeline token language model text process clean number email address website running quickly"
+).split()
+
+_ACCENTED = (
+    "coração ação informação São Paulo não está também então café crème brûlée déjà vu naïve façade garçon "
+    "élève Málaga año niño mañana pingüino über Straße Ærøskøbing Łódź Øresund señor acción educación "
+    "português francês espanhol árvore pão mãe irmã avô avó cônjuge órgão fácil difícil útil"
+).split()
+
+_TAGS = ('p', 'div', 'span', 'b', 'i', 'em', 'strong', 'li', 'td', 'h2')
+
+
+def _sentence(rng: random.Random, words: List[str], n_words: int) -> str:
+    sentence = ' '.join(rng.choice(words) for _ in range(n_words))
+    return sentence[0].upper() + sentence[1:] + rng.choice('...!?,;')
+
+
+def short_texts(n: int, seed: int = 0) -> List[str]:
+    """Social media like posts, with mentions, hashtags, urls, emails and numbers."""
+    rng = random.Random(seed)
+    texts = []
+    for i in range(n):
+        parts = [_sentence(rng, _WORDS, rng.randint(5, 20))]
+        if rng.random() < 0.4:
+            parts.append(f"https://example.com/{rng.choice(_WORDS)}/{i}?ref={rng.randint(0, 999)}")
+        if rng.random() < 0.2:
+            parts.append(f"{rng.choice(_WORDS)}.{i}@mail.example.org")
+        if rng.random() < 0.5:
+            parts.append(f"#{rng.choice(_WORDS)} @{rng.choice(_WORDS)}{rng.randint(1, 99)}")
+        if rng.random() < 0.5:
+            parts.append(f"{rng.randint(1, 10000)} {rng.choice(_WORDS)} {rng.random() * 100:.2f}%")
+        texts.append(' '.join(parts))
+
+    return texts
+
+
+def long_texts(n: int, seed: int = 0) -> List[str]:
+    """Article like documents, a few paragraphs of several sentences each."""
+    rng = random.Random(seed)
+    return ['\n\n'.join(' '.join(_sentence(rng, _WORDS, rng.randint(8, 30)) for _ in range(rng.randint(4, 10)))
+                        for _ in range(rng.randint(3, 6)))
+            for _ in range(n)]
+
+
+def markup_texts(n: int, seed: int = 0) -> List[str]:
+    """HTML pages with nested tags, attributes, entities and scripts."""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n):
+        body = []
+        for _ in range(rng.randint(5, 15)):
+            tag = rng.choice(_TAGS)
+            text = _sentence(rng, _WORDS, rng.randint(4, 15)).replace(' and ', ' &amp; ')
+            body.append(f'<{tag} class="c{rng.randint(0, 9)}">{text} <a href="/{rng.choice(_WORDS)}">'
+                        f'{rng.choice(_WORDS)}</a></{tag}>')
+        texts.append('<html><head><title>%s</title><script>var x = %d;</script></head><body>%s</body></html>'
+                     % (rng.choice(_WORDS), rng.randint(0, 99), '\n'.join(body)))
+
+    return texts
+
+
+def accented_texts(n: int, seed: int = 0) -> List[str]:
+    """Texts where most words have diacritics, mixed with plain words."""
+    rng = random.Random(seed)
+    words = _ACCENTED * 3 + _WORDS
+    return [' '.join(_sentence(rng, words, rng.randint(6, 25)) for _ in range(rng.randint(1, 4))) for _ in range(n)]
+
+
+CORPORA: Dict[str, Callable[[int, int], List[str]]] = {
+    'short': short_texts,
+    'long': long_texts,
+    'markup': markup_texts,
+    'accents': accented_texts,
+}
@@ -0,0 +1,72 @@
+"""Import Time Benchmark.
+
+Each scenario runs in a new interpreter, so it measures the cold start of a short lived program: the time spent
+importing NLPiper and creating a transformer, and the modules it loaded, e.g. the optional backends.
+
+Example:
+    $ python -m benchmarks.imports --repeat 20 --output imports.json
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+SCENARIOS: Dict[str, str] = {
+    'import nlpiper': "import nlpiper",
+    'BasicTokenizer': "from nlpiper.transformers.tokenizers import BasicTokenizer; BasicTokenizer()",
+    'cleaners': "from nlpiper.transformers.cleaners import CleanNumber, CleanURL; CleanNumber(); CleanURL()",
+    'Compose': ("from nlpiper.core import Compose, Document; from nlpiper.transformers.tokenizers import "
+                "BasicTokenizer; Compose([BasicTokenizer()])(Document('text'))"),
+    'create_from_steps': "from nlpiper.core import Compose; Compose.create_from_steps(['BasicTokenizer()'])",
+}
+
+# Modules slow to import, reported when a scenario loads them.
+HEAVY_MODULES = ('pydantic', 'numpy', 'gensim', 'nltk', 'bs4', 'sacremoses', 'stanza', 'hunspell', 'asyncio',
+                 'multiprocessing', 'sqlite3')
+
+_PROGRAM = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+seconds = time.perf_counter() - start
+print(json.dumps([seconds, len(sys.modules), [name for name in {heavy!r} if name in sys.modules]]))
+"""
+
+
+def measure(statement: str, repeat: int) -> dict:
+    """Median time of a statement run in ``repeat`` new interpreters, and the modules it loaded."""
+    times = []
+    modules = 0
+    heavy: List[str] = []
+    for _ in range(repeat):
+        program = _PROGRAM.format(statement=statement, heavy=HEAVY_MODULES)
+        output = subprocess.run([sys.executable, '-c', program], check=True, capture_output=True, text=True)
+        seconds, modules, heavy = json.loads(output.stdout.splitlines()[-1])
+        times.append(seconds)
+
+    return {'milliseconds': statistics.median(times) * 1000, 'modules': modules, 'heavy_modules': heavy}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.imports', description="Benchmark NLPiper imports.")
+    parser.add_argument('--repeat', type=int, default=10, help="New interpreters per scenario, the median is kept.")
+    parser.add_argument('--output', help="Path of the JSON file where the results are written.")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, statement in SCENARIOS.items():
+        results[name] = result = measure(statement, args.repeat)
+        print(f"{name:<20} {result['milliseconds']:>8.1f} ms {result['modules']:>5} modules "
+              f"{' '.join(result['heavy_modules'])}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
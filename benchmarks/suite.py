@@ -0,0 +1,265 @@
+"""Benchmark Suite Module.
+
+Each case times a transformer, or a pipeline, over a corpus and measures its peak memory. The documents a
+transformer expects, e.g. tokenized documents for normalizers, are prepared before timing.
+"""
+import gc
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+from nlpiper.core import Compose, Document, FastDocument
+from nlpiper.transformers import cleaners, embeddings, normalizers, tokenizers
+
+
+class Case:
+    """Benchmark of a transformer, run on the documents left by its ``setup`` transformers."""
+
+    def __init__(self, name: str, factory: Callable, setup: Optional[List[Callable]] = None,
+                 pipeline: bool = False):
+        """Benchmark of a transformer.
+
+        Args:
+            name (str): Name of the case.
+            factory (Callable): Creates the transformer, or the ``Compose`` when ``pipeline`` is True. It can raise
+                ``ImportError``, or any error loading its resources, when the case can not run.
+            setup (Optional[List[Callable]]): Create the transformers applied to the documents before timing.
+            pipeline (bool): If True the documents are processed with ``Compose.pipe``, from the raw texts,
+                otherwise with the ``batch`` method of the transformer.
+        """
+        self.name = name
+        self.factory = factory
+        self.setup = setup or []
+        self.pipeline = pipeline
+
+
+def _keyed_vectors():
+    import gensim
+    import numpy as np
+
+    from benchmarks.corpora import _ACCENTED, _WORDS
+
+    words = sorted({word.lower() for word in _WORDS + _ACCENTED})
+    vectors = gensim.models.KeyedVectors(100)
+    vectors.add_vectors(words, np.random.default_rng(0).random((len(words), 100), dtype=np.float32))
+    return vectors
+
+
+def _symspell_check() -> normalizers.SpellCheck:
+    import tempfile
+
+    from benchmarks.corpora import _ACCENTED, _WORDS
+
+    words = _WORDS + _ACCENTED
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', encoding='utf-8', delete=False) as f:
+        f.write('\n'.join(f"{word} {len(words) - i}" for i, word in enumerate(words)))
+
+    try:
+        return normalizers.SpellCheck(max_distance=2, engine='symspell', dictionary=f.name)
+    finally:
+        os.unlink(f.name)
+
+
+def _transformer_cases() -> List[Case]:
+    tokenize = [tokenizers.BasicTokenizer]
+    cases = [
+        Case('CleanURL', cleaners.CleanURL),
+        Case('CleanEmail', cleaners.CleanEmail),
+        Case('CleanNumber', cleaners.CleanNumber),
+        Case('CleanPunctuation', cleaners.CleanPunctuation),
+        Case('CleanEOF', cleaners.CleanEOF),
+        Case('CleanMarkup', cleaners.CleanMarkup),
+        Case('CleanAccents', cleaners.CleanAccents),
+        Case('BasicTokenizer', tokenizers.BasicTokenizer),
+        Case('MosesTokenizer', tokenizers.MosesTokenizer),
+        Case('StanzaTokenizer', tokenizers.StanzaTokenizer),
+        Case('CaseTokens', normalizers.CaseTokens, tokenize),
+        Case('RemovePunctuation', normalizers.RemovePunctuation, tokenize),
+        Case('RemoveStopWords', normalizers.RemoveStopWords, tokenize),
+        Case('VocabularyFilter', lambda: normalizers.VocabularyFilter(['the', 'of', 'and', 'document']), tokenize),
+        Case('Stemmer', normalizers.Stemmer, tokenize),
+        Case('SpellCheck', normalizers.SpellCheck, tokenize),
+        Case('SpellCheck[symspell]', _symspell_check, tokenize),
+        Case('GensimEmbeddings', lambda: embeddings.GensimEmbeddings(_keyed_vectors()),
+             tokenize + [normalizers.CaseTokens]),
+    ]
+
+    return cases
+
+
+def _pipeline_cases() -> List[Case]:
+    def cleaning(compiled: bool) -> Callable[[], Compose]:
+        def factory() -> Compose:
+            pipe = Compose([cleaners.CleanURL(), cleaners.CleanEmail(), cleaners.CleanNumber(),
+                            cleaners.CleanPunctuation(), cleaners.CleanEOF(), tokenizers.BasicTokenizer(),
+                            normalizers.CaseTokens(), normalizers.RemovePunctuation()])
+            return pipe.compile() if compiled else pipe
+        return factory
+
+    return [
+        Case('Compose[clean+tokenize+normalize]', cleaning(False), pipeline=True),
+        Case('Compose[clean+tokenize+normalize].compile', cleaning(True), pipeline=True),
+        Case('Compose[markup+accents+moses+stem]',
+             lambda: Compose([cleaners.CleanMarkup(), cleaners.CleanAccents(), tokenizers.MosesTokenizer(),
+                              normalizers.CaseTokens(), normalizers.Stemmer()]), pipeline=True),
+    ]
+
+
+CASES: Dict[str, Case] = {case.name: case for case in _transformer_cases() + _pipeline_cases()}
+
+
+def _prepare(case: Case, texts: List[str], document_class: type) -> list:
+    docs = [document_class(text) for text in texts]
+    if case.setup:
+        setup = Compose([factory() for factory in case.setup])
+        docs = list(setup.pipe(docs, batch_size=len(docs) or 1, inplace=True))
+
+    return docs
+
+
+def _inputs(case: Case, texts: List[str], docs: list, document_class: type) -> list:
+    """New documents to be processed by a run, created before it is timed."""
+    if case.pipeline:
+        return [document_class(text) for text in texts]
+
+    return [doc._deepcopy() for doc in docs]
+
+
+def _process(case: Case, transformer, inputs: list) -> None:
+    if case.pipeline:
+        for _ in transformer.pipe(inputs, batch_size=len(inputs) or 1, inplace=True):
+            pass
+    else:
+        transformer.batch(inputs)
+
+
+def measure(case: Case, texts: List[str], repeat: int = 3, document_class: type = Document) -> dict:
+    """Time a case over a corpus, the best of ``repeat`` runs, and measure its peak memory on another run.
+
+    Args:
+        case (Case): Case to be run.
+        texts (List[str]): Texts of the corpus.
+        repeat (int): Number of timed runs.
+        document_class (type): ``Document`` or ``FastDocument``.
+
+    Returns: dict
+    """
+    transformer = case.factory()
+    docs = [] if case.pipeline else _prepare(case, texts, document_class)
+
+    seconds = float('inf')
+    out: list = []
+    for _ in range(repeat):
+        out = _inputs(case, texts, docs, document_class)
+        gc.collect()
+        start = time.perf_counter()
+        _process(case, transformer, out)
+        seconds = min(seconds, time.perf_counter() - start)
+
+    inputs = _inputs(case, texts, docs, document_class)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        _process(case, transformer, inputs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    tokens = sum(len(doc.tokens) for doc in out if doc.tokens is not None)
+    return {
+        'documents': len(texts),
+        'tokens': tokens,
+        'characters': sum(len(text) for text in texts),
+        'seconds': seconds,
+        'documents_per_second': len(texts) / seconds if seconds else 0.0,
+        'tokens_per_second': tokens / seconds if seconds else 0.0,
+        'peak_memory_bytes': peak,
+    }
+
+
+def run_suite(corpora: Dict[str, List[str]], cases: Optional[List[str]] = None, repeat: int = 3,
+              document_class: type = Document, log: Callable[[str], None] = print) -> dict:
+    """Run the benchmark cases over the corpora.
+
+    The cases that can not run, e.g. when an optional dependency or its models are missing, are reported as
+    skipped.
+
+    Args:
+        corpora (Dict[str, List[str]]): Texts of each corpus by name.
+        cases (Optional[List[str]]): Names of the cases to be run, by default all of them.
+        repeat (int): Number of timed runs of each case.
+        document_class (type): ``Document`` or ``FastDocument``.
+        log (Callable[[str], None]): Called with a line for each result.
+
+    Returns: dict
+    """
+    results = []
+    skipped = []
+    for name in cases or list(CASES):
+        case = CASES[name]
+        for corpus, texts in corpora.items():
+            try:
+                result = measure(case, texts, repeat, document_class)
+            except Exception as e:  # Missing optional backends raise many kinds of errors, e.g. LookupError.
+                skipped.append({'case': name, 'reason': f"{type(e).__name__}: {e}".splitlines()[0]})
+                log(f"{name:<45} skipped ({skipped[-1]['reason']})")
+                break
+
+            results.append({'case': name, 'corpus': corpus, **result})
+            log(f"{name:<45} {corpus:<8} {result['documents_per_second']:>12.1f} docs/s "
+                f"{result['tokens_per_second']:>12.1f} tokens/s {result['peak_memory_bytes'] / 2 ** 20:>8.2f} MiB")
+
+    return {'meta': _meta(corpora, repeat, document_class), 'results': results, 'skipped': skipped}
+
+
+def _meta(corpora: Dict[str, List[str]], repeat: int, document_class: type) -> dict:
+    return {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'document_class': document_class.__name__,
+        'repeat': repeat,
+        'corpora': {name: len(texts) for name, texts in corpora.items()},
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.2) -> List[Tuple[str, str, str, float, float]]:
+    """Regressions of the results against a baseline.
+
+    A case regresses when its documents throughput drops, or its peak memory grows, by more than ``tolerance``.
+    Cases missing from either run are ignored.
+
+    Args:
+        results (dict): Results of ``run_suite``.
+        baseline (dict): Stored results of a previous ``run_suite``.
+        tolerance (float): Relative change allowed, by default 0.2.
+
+    Returns: List[Tuple[str, str, str, float, float]], the case, corpus, metric, baseline and current values.
+    """
+    base = {(r['case'], r['corpus']): r for r in baseline['results']}
+    regressions = []
+    for result in results['results']:
+        previous = base.get((result['case'], result['corpus']))
+        if previous is None:
+            continue
+
+        if result['documents_per_second'] < previous['documents_per_second'] * (1 - tolerance):
+            regressions.append((result['case'], result['corpus'], 'documents_per_second',
+                                previous['documents_per_second'], result['documents_per_second']))
+        if result['peak_memory_bytes'] > previous['peak_memory_bytes'] * (1 + tolerance):
+            regressions.append((result['case'], result['corpus'], 'peak_memory_bytes',
+                                previous['peak_memory_bytes'], result['peak_memory_bytes']))
+
+    return regressions
+
+
+DOCUMENT_CLASSES = {'document': Document, 'fast': FastDocument}
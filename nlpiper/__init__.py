@@ -1,3 +1,17 @@
 """NLPiper."""
-import nlpiper.core
-import nlpiper.transformers
+from importlib import import_module
+
+# The subpackages are imported on first use, which keeps `import nlpiper` fast for the programs that only need a
+# few transformers.
+_SUBPACKAGES = ('core', 'transformers')
+
+
+def __getattr__(name: str):
+    if name in _SUBPACKAGES:
+        return import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_SUBPACKAGES))
@@ -1,3 +1,36 @@
 """Core Module."""
-from nlpiper.core.document import Document
-from nlpiper.core.composition import Compose
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Module of each exported name, imported on first use, which keeps `import nlpiper` fast.
+_EXPORTS = {
+    'Document': 'nlpiper.core.document',
+    'FastDocument': 'nlpiper.core.document',
+    'ResultCache': 'nlpiper.core.cache',
+    'Compose': 'nlpiper.core.composition',
+    'Threaded': 'nlpiper.core.parallel',
+    'DocumentBatch': 'nlpiper.core.batch',
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from nlpiper.core.document import Document, FastDocument
+    from nlpiper.core.cache import ResultCache
+    from nlpiper.core.composition import Compose
+    from nlpiper.core.parallel import Threaded
+    from nlpiper.core.batch import DocumentBatch
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,263 @@
+"""Document Batch Module."""
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union
+)
+
+from nlpiper.core.document import Document, FastDocument
+
+
+class DocumentBatch:
+    """Batch of documents with its tokens stored column-wise.
+
+    The fields of all the tokens in the batch are stored in flat lists, one per field, and ``offsets`` delimits the
+    tokens of each document, the tokens of the document ``i`` are in ``offsets[i]:offsets[i + 1]``. The token
+    embeddings are stored in a single array with one row per token.
+
+    Normalizers and embeddings are applied column-wise with ``apply``, and the documents can be accessed through
+    views, ``batch[i]``, which read and write the batch columns, or materialized with ``to_documents``.
+
+    Example:
+        >>> batch = DocumentBatch.from_documents(tokenizer.pipe(texts))
+        >>> batch.apply(CaseTokens())
+        >>> batch[0].tokens[0].cleaned
+        'text'
+    """
+
+    TOKEN_FIELDS = ('original', 'cleaned', 'lemma', 'stem', 'ner')
+
+    def __init__(self, texts: Iterable[str]) -> None:
+        """Batch of documents with its tokens stored column-wise.
+
+        Args:
+            texts (Iterable[str]): Text of each document.
+        """
+        self.original: List[str] = list(texts)
+        self.cleaned: List[str] = list(self.original)
+        self.steps: List[List[str]] = [[] for _ in self.original]
+        self.embedded: Optional[Any] = None
+        self.offsets: Optional[List[int]] = None
+        # Columns of the token fields, a missing column means the field is None for every token.
+        self.columns: Dict[str, List[Optional[str]]] = {}
+        self.token_embedded: Optional[Any] = None
+
+    @classmethod
+    def from_documents(cls, docs: Iterable[Union[Document, FastDocument]]) -> 'DocumentBatch':
+        """Create a batch from documents, which must all have tokens or all be without them.
+
+        Args:
+            docs (Iterable[Union[Document, FastDocument]]): Documents of the batch.
+
+        Returns: DocumentBatch
+        """
+        docs = list(docs)
+        batch = cls(doc.original for doc in docs)
+        batch.cleaned = [doc.cleaned for doc in docs]
+        batch.steps = [list(doc.steps) for doc in docs]
+
+        tokenized = {doc.tokens is not None for doc in docs}
+        if len(tokenized) > 1:
+            raise ValueError("Documents must all have tokens or all be without them")
+
+        if docs and docs[0].tokens is not None:
+            batch.offsets = [0]
+            for doc in docs:
+                batch.offsets.append(batch.offsets[-1] + len(doc.tokens))
+
+            tokens = [token for doc in docs for token in doc.tokens]
+            for field in cls.TOKEN_FIELDS:
+                column = [getattr(token, field) for token in tokens]
+                if field in ('original', 'cleaned') or any(value is not None for value in column):
+                    batch.columns[field] = column
+
+            batch.token_embedded = _stack([token.embedded for token in tokens])
+
+        batch.embedded = _stack([doc.embedded for doc in docs])
+
+        return batch
+
+    def to_documents(self, document_class: type = Document) -> List[Union[Document, FastDocument]]:
+        """Materialize the documents of the batch.
+
+        Args:
+            document_class (type): Class of the created documents, ``Document`` or ``FastDocument``.
+
+        Returns: List[Union[Document, FastDocument]]
+        """
+        return [self._to_document(i, document_class) for i in range(len(self))]
+
+    def _to_document(self, i: int, document_class: type) -> Union[Document, FastDocument]:
+        tokens = None
+        if self.offsets is not None:
+            tokens = [TokenView(self, j).dict() for j in range(self.offsets[i], self.offsets[i + 1])]
+
+        embedded = None if self.embedded is None else self.embedded[i]
+        return document_class._load({'original': self.original[i], 'cleaned': self.cleaned[i], 'tokens': tokens,
+                                     'embedded': embedded, 'steps': list(self.steps[i])})
+
+    def apply(self, transformer) -> None:
+        """Apply a transformer to the whole batch.
+
+        Normalizers and ``GensimEmbeddings`` are applied column-wise. Any other transformer is applied to the
+        materialized documents, through its ``batch`` method, and the batch columns are rebuilt.
+
+        Args:
+            transformer (BaseTransformer): Transformer to be applied.
+        """
+        from nlpiper.transformers.base import BaseNormalizer
+        from nlpiper.transformers.embeddings import GensimEmbeddings
+
+        if isinstance(transformer, (BaseNormalizer, GensimEmbeddings)):
+            name = transformer.__class__.__name__
+            if self.offsets is None:
+                raise RuntimeError(f"{name} can not be applied on documents without tokens")
+            if self.embedded is not None:
+                raise RuntimeError(f"{name} can not be applied on documents with embeddings")
+
+        if isinstance(transformer, BaseNormalizer):
+            column = [transformer._normalize(token) for token in self.columns['cleaned']]
+            for i, field in enumerate(transformer.token_fields):
+                self.columns[field] = column if i == 0 else list(column)
+        elif isinstance(transformer, GensimEmbeddings):
+            self.token_embedded = transformer._embed_tokens(self.columns['cleaned'])
+            self.embedded = transformer._embed_documents(self.token_embedded, self.offsets)
+        else:
+            docs = self.to_documents(FastDocument)
+            transformer.batch(docs)
+            self.__dict__.update(DocumentBatch.from_documents(docs).__dict__)
+            return
+
+        step = transformer.step
+        for steps in self.steps:
+            steps.append(step)
+
+    def __len__(self) -> int:
+        return len(self.original)
+
+    def __getitem__(self, i: int) -> 'DocumentView':
+        if not -len(self) <= i < len(self):
+            raise IndexError("DocumentBatch index out of range")
+
+        return DocumentView(self, i % len(self))
+
+    def __iter__(self) -> Iterator['DocumentView']:
+        return (DocumentView(self, i) for i in range(len(self)))
+
+    def __repr__(self) -> str:
+        tokens = 0 if self.offsets is None else self.offsets[-1]
+        return "%s(documents=%d, tokens=%d)" % (self.__class__.__name__, len(self), tokens)
+
+
+class DocumentView:
+    """View of a document of a ``DocumentBatch``, reading and writing the batch columns."""
+
+    __slots__ = ('batch', 'index')
+
+    def __init__(self, batch: DocumentBatch, index: int) -> None:
+        self.batch = batch
+        self.index = index
+
+    @property
+    def original(self) -> str:
+        return self.batch.original[self.index]
+
+    @property
+    def cleaned(self) -> str:
+        return self.batch.cleaned[self.index]
+
+    @cleaned.setter
+    def cleaned(self, value: str) -> None:
+        self.batch.cleaned[self.index] = value
+
+    @property
+    def tokens(self) -> Optional[List['TokenView']]:
+        offsets = self.batch.offsets
+        if offsets is None:
+            return None
+
+        return [TokenView(self.batch, j) for j in range(offsets[self.index], offsets[self.index + 1])]
+
+    @property
+    def embedded(self) -> Optional[Any]:
+        return None if self.batch.embedded is None else self.batch.embedded[self.index]
+
+    @property
+    def steps(self) -> List[str]:
+        return self.batch.steps[self.index]
+
+    def dict(self) -> dict:
+        """Fields of the document, and of its tokens, as a dictionary."""
+        tokens = self.tokens
+        return {'original': self.original, 'cleaned': self.cleaned,
+                'tokens': None if tokens is None else [token.dict() for token in tokens],
+                'embedded': self.embedded, 'steps': self.steps}
+
+    def __eq__(self, other) -> bool:
+        return self.dict() == other.dict() if hasattr(other, 'dict') else NotImplemented
+
+    def __repr__(self) -> str:
+        return "%s(original=%r, cleaned=%r, tokens=%r, embedded=%r, steps=%r)" % (
+            self.__class__.__name__, self.original, self.cleaned, self.tokens, self.embedded, self.steps)
+
+
+class TokenView:
+    """View of a token of a ``DocumentBatch``, reading and writing the batch columns."""
+
+    __slots__ = ('batch', 'index')
+
+    def __init__(self, batch: DocumentBatch, index: int) -> None:
+        self.batch = batch
+        self.index = index
+
+    def __getattr__(self, name: str) -> Optional[str]:
+        if name not in DocumentBatch.TOKEN_FIELDS:
+            raise AttributeError(name)
+
+        column = self.batch.columns.get(name)
+        return None if column is None else column[self.index]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self.__slots__:
+            object.__setattr__(self, name, value)
+        elif name in DocumentBatch.TOKEN_FIELDS:
+            columns = self.batch.columns
+            if name not in columns:
+                columns[name] = [None] * self.batch.offsets[-1]
+            columns[name][self.index] = value
+        else:
+            raise AttributeError(name)
+
+    @property
+    def embedded(self) -> Optional[Any]:
+        embedded = self.batch.token_embedded
+        return None if embedded is None else embedded[self.index]
+
+    def dict(self) -> dict:
+        """Fields of the token as a dictionary."""
+        values = {field: getattr(self, field) for field in DocumentBatch.TOKEN_FIELDS}
+        values['embedded'] = self.embedded
+        return values
+
+    def __eq__(self, other) -> bool:
+        return self.dict() == other.dict() if hasattr(other, 'dict') else NotImplemented
+
+    def __repr__(self) -> str:
+        return "%s(%s)" % (self.__class__.__name__, ', '.join("%s=%r" % item for item in self.dict().items()))
+
+
+def _stack(values: List[Any]) -> Optional[Any]:
+    """Stack the embeddings in a single array, they must be all set or all missing."""
+    missing = sum(value is None for value in values)
+    if missing == len(values):
+        return None
+
+    if missing:
+        raise ValueError("Embeddings must be set on all the documents and tokens or on none of them")
+
+    import numpy as np
+    return np.stack(values)
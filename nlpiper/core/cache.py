@@ -0,0 +1,259 @@
+"""Result Cache Module."""
+import hashlib
+import pickle
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from nlpiper.core.document import Document, FastDocument
+
+
+class LRUCache:
+    """Bounded in memory cache, evicting the least recently used entries.
+
+    Example:
+        >>> cache = LRUCache(maxsize=2)
+        >>> cache.put('a', 1)
+        >>> cache.get('a')
+        1
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Bounded in memory cache, evicting the least recently used entries.
+
+        Args:
+            maxsize (int): Maximum number of entries, by default 1024.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        """Value of a key, or ``default`` when the key is not cached."""
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value) -> None:
+        """Cache the value of a key, evicting the least recently used entry when the cache is full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def items(self) -> List[Tuple]:
+        """Entries of the cache, from the least to the most recently used."""
+        with self._lock:
+            return list(self._entries.items())
+
+    def clear(self) -> None:
+        """Remove every entry, the statistics are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hits, misses and evictions of the cache, and its current size."""
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'size': len(self)}
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+
+class DiskCache:
+    """Cache of bytes values stored in a sqlite database, shared between runs and processes."""
+
+    def __init__(self, path: str):
+        """Cache of bytes values stored in a sqlite database.
+
+        Args:
+            path (str): Path of the sqlite database, created when it does not exist.
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        import sqlite3
+
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB)")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Value of a key, or None when the key is not cached."""
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, value: bytes) -> None:
+        """Cache the value of a key."""
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)", (key, value))
+
+    def clear(self) -> None:
+        """Remove every entry, the statistics are kept."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM cache")
+
+    def stats(self) -> Dict[str, int]:
+        """Hits and misses of the cache, and its current size."""
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self)}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def __getstate__(self) -> dict:
+        return {'path': self.path, 'hits': self.hits, 'misses': self.misses}
+
+    def __setstate__(self, state: dict) -> None:
+        hits, misses = state['hits'], state['misses']
+        self.__init__(state['path'])
+        self.hits, self.misses = hits, misses
+
+
+class ResultCache:
+    """Cache of the documents processed by a pipeline, see ``Compose``.
+
+    The documents are cached by the hash of their text and of a fingerprint of the pipeline, built from the steps
+    of its transformers, so the cache can be shared by different pipelines. It has a bounded in memory tier and
+    an optional on disk tier, a sqlite database, which is checked when a document is not in memory. Only the
+    documents not processed yet, without steps, are cached.
+
+    Example:
+        >>> pipe = Compose([BasicTokenizer(), SpellCheck()], cache=ResultCache(maxsize=10000, path='cache.db'))
+        >>> docs = list(pipe.pipe(texts))
+        >>> pipe.cache.stats()
+        {'hits': 812, 'misses': 188, 'evictions': 0, 'memory_hits': 790, 'disk_hits': 22, 'size': 188}
+    """
+
+    def __init__(self, maxsize: int = 1024, path: Optional[str] = None):
+        """Cache of the documents processed by a pipeline.
+
+        Args:
+            maxsize (int): Maximum number of documents in memory, by default 1024.
+            path (Optional[str]): Path of the sqlite database of the on disk tier, by default there is no on disk
+                tier.
+        """
+        self.memory = LRUCache(maxsize)
+        self.disk = None if path is None else DiskCache(path)
+
+    @staticmethod
+    def key(fingerprint: str, doc: Union[Document, FastDocument]) -> Optional[str]:
+        """Key of a document, None when the document can not be cached.
+
+        Args:
+            fingerprint (str): Fingerprint of the pipeline.
+            doc (Union[Document, FastDocument]): Document to be processed.
+
+        Returns: Optional[str]
+        """
+        if not is_fresh(doc):
+            return None
+
+        return _hash(fingerprint, type(doc).__name__, doc.original)
+
+    def get(self, key: str) -> Optional[Union[Document, FastDocument]]:
+        """Processed document of a key, a new object on each call, or None when it is not cached."""
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.put(key, value)
+
+        return None if value is None else _loads(value)
+
+    def put(self, key: str, doc: Union[Document, FastDocument]) -> None:
+        """Cache a processed document."""
+        value = _dumps(doc)
+        self.memory.put(key, value)
+        if self.disk is not None:
+            self.disk.put(key, value)
+
+    def clear(self) -> None:
+        """Remove every document, from memory and from disk."""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hits, misses and evictions of the cache, hits by tier, and the number of documents in memory."""
+        memory_hits = self.memory.hits
+        disk_hits = 0 if self.disk is None else self.disk.hits
+        hits = memory_hits + disk_hits
+        return {'hits': hits, 'misses': self.memory.misses - disk_hits, 'evictions': self.memory.evictions,
+                'memory_hits': memory_hits, 'disk_hits': disk_hits, 'size': len(self.memory)}
+
+
+def is_fresh(doc: Union[Document, FastDocument]) -> bool:
+    """Whether a document is not processed yet, so its output only depends on its text and on the pipeline."""
+    return not doc.steps and doc.tokens is None and doc.embedded is None and doc.cleaned == doc.original
+
+
+def fingerprint(steps: Iterable[str]) -> str:
+    """Fingerprint of a pipeline, the hash of the steps of its transformers."""
+    return _hash(*steps)
+
+
+def _hash(*values: str) -> str:
+    digest = hashlib.sha256()
+    for value in values:
+        digest.update(value.encode('utf-8', 'surrogatepass'))
+        digest.update(b'\0')
+
+    return digest.hexdigest()
+
+
+def _dumps(doc: Union[Document, FastDocument]) -> bytes:
+    return pickle.dumps((type(doc), doc._dump()), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _loads(value: bytes) -> Union[Document, FastDocument]:
+    cls, state = pickle.loads(value)
+    return cls._load(state)
+
+
+def assign(doc: Union[Document, FastDocument], other: Union[Document, FastDocument]) -> None:
+    """Assign the values, and the snapshots, of a document of the same type to a document, changing it inplace."""
+    if isinstance(doc, FastDocument):
+        for name in FastDocument.__slots__:
+            setattr(doc, name, getattr(other, name))
+    else:
+        doc.__dict__.update(other.__dict__)
+        object.__setattr__(doc, '__fields_set__', set(other.__fields_set__))
+        doc._snapshots = other._snapshots
@@ -0,0 +1,293 @@
+"""Pipeline Compiler Module."""
+from functools import partial
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+
+from nlpiper.core.cache import fingerprint
+from nlpiper.core.document import Document, FastDocument
+from nlpiper.core.parallel import Threaded
+from nlpiper.transformers.base import (
+    BaseCleaner,
+    BaseNormalizer,
+    BaseTransformer,
+    TransformersType,
+    check_state,
+    get_transformer_type,
+    unchecked_batch,
+    unchecked_call,
+    validate
+)
+
+
+def compile_transformers(transformers: List[BaseTransformer]) -> List[BaseTransformer]:
+    """Fuse the runs of consecutive cleaners, and of consecutive normalizers, of a pipeline in single stages.
+
+    Args:
+        transformers (List[BaseTransformer]): Transformers of the pipeline.
+
+    Returns: List[BaseTransformer]
+    """
+    stages: List[BaseTransformer] = []
+    run: List[BaseTransformer] = []
+
+    for t in transformers + [None]:
+        base = _fusable(t)
+        if run and base is _fusable(run[0]):
+            run.append(t)
+            continue
+
+        stages.extend(_fuse(run))
+        run = []
+
+        if base is not None:
+            run.append(t)
+        elif t is not None:
+            stages.append(t)
+
+    return stages
+
+
+def _fusable(t: Optional[BaseTransformer]) -> Optional[type]:
+    for base in (BaseCleaner, BaseNormalizer):
+        if isinstance(t, base):
+            return base
+
+    return None
+
+
+def stage_steps(stage: BaseTransformer) -> List[str]:
+    """Steps registered by a stage of a pipeline."""
+    if isinstance(stage, Threaded):
+        # The documents record the steps of the wrapped transformer, whatever the number of threads.
+        return stage_steps(stage.transformer)
+    if isinstance(stage, FusedCleaners):
+        return [cleaner.step for cleaner in stage.cleaners]
+    if isinstance(stage, FusedNormalizers):
+        return [normalizer.step for normalizer in stage.normalizers]
+
+    return [stage.step if hasattr(stage, 'step') else repr(stage)]
+
+
+def _fuse(run: List[BaseTransformer]) -> List[BaseTransformer]:
+    if len(run) < 2:
+        return run
+
+    return [FusedCleaners(run) if isinstance(run[0], BaseCleaner) else FusedNormalizers(run)]
+
+
+class FusedCleaners(BaseTransformer):
+    """Consecutive cleaners applied as a single stage.
+
+    The document is validated and copied once, and the consecutive character wise cleaners, e.g. ``CleanNumber``
+    and ``CleanPunctuation``, are merged in a single ``str.translate`` over the document text. Other cleaners,
+    e.g. the regex based ``CleanURL``, are applied one after the other, since merging their patterns in a single
+    regex would not give the same output when a removal creates a new match. The documents record the steps of
+    the fused cleaners.
+    """
+
+    def __init__(self, cleaners: List[BaseCleaner]):
+        """Consecutive cleaners applied as a single stage.
+
+        Args:
+            cleaners (List[BaseCleaner]): Cleaners to be fused, in the order they are applied.
+        """
+        super().__init__(*cleaners)
+        self.cleaners = cleaners
+        self.operations = []
+
+        for cleaner in cleaners:
+            last = self.operations[-1] if self.operations else None
+            if not cleaner.character_wise:
+                self.operations.append(cleaner._clean)
+            elif isinstance(last, CharacterMap):
+                last.cleaners.append(cleaner)
+            else:
+                self.operations.append(CharacterMap([cleaner]))
+
+    @validate(TransformersType.CLEANERS)
+    def __call__(self, doc: Union[Document, FastDocument], inplace: bool = False) -> Optional[Document]:
+        """Clean the document with every fused cleaner.
+
+        Args:
+            doc (Document): document to be cleaned.
+            inplace (bool): if False will return a new doc object,
+                            otherwise will change the object passed as parameter.
+
+        Returns: Document
+        """
+        d = doc if inplace else doc._deepcopy()
+
+        d.cleaned = self._clean(d.cleaned)
+        d.steps.extend(cleaner.step for cleaner in self.cleaners)
+
+        return None if inplace else d
+
+    def _clean(self, text: str) -> str:
+        for operation in self.operations:
+            text = operation(text) if callable(operation) else text.translate(operation)
+
+        return text
+
+
+class CharacterMap(dict):
+    """Translation table of consecutive character wise cleaners, to be used with ``str.translate``.
+
+    The translation of each character is computed by the cleaners the first time the character is found
+    and then stored in the table.
+    """
+
+    def __init__(self, cleaners: List[BaseCleaner]):
+        super().__init__()
+        self.cleaners = cleaners
+
+    def __missing__(self, key: int) -> Union[str, int]:
+        text = chr(key)
+        for cleaner in self.cleaners:
+            text = cleaner._clean(text)
+
+        # Characters left unchanged are mapped to themselves, which avoids building a new string.
+        value = key if text == chr(key) else text
+        self[key] = value
+        return value
+
+
+class FusedNormalizers(BaseTransformer):
+    """Consecutive normalizers applied as a single stage.
+
+    The document is validated and copied once, and each token string goes through every normalizer in a single
+    loop over the tokens, with one assignment per token field at the end, which saves most of the validated
+    assignments of ``Token`` and of the writes to ``TokenSpans``. The documents record the steps of the fused
+    normalizers.
+    """
+
+    def __init__(self, normalizers: List[BaseNormalizer]):
+        """Consecutive normalizers applied as a single stage.
+
+        Args:
+            normalizers (List[BaseNormalizer]): Normalizers to be fused, in the order they are applied.
+        """
+        super().__init__(*normalizers)
+        self.normalizers = normalizers
+
+        # Each token field is only assigned once, with the token string left by the last normalizer assigning it.
+        last = {}
+        for i, normalizer in enumerate(normalizers):
+            for field in normalizer.token_fields:
+                last[field] = i
+        self.chain = [(normalizer._normalize, tuple(field for field, j in last.items() if j == i))
+                      for i, normalizer in enumerate(normalizers)]
+        self.passes = [unchecked_call(normalizer) or partial(normalizer, inplace=True) for normalizer in normalizers]
+
+    @validate(TransformersType.NORMALIZERS)
+    def __call__(self, doc: Union[Document, FastDocument], inplace: bool = False) -> Optional[Document]:
+        """Normalize the document tokens with every fused normalizer.
+
+        Args:
+            doc (Document): document to be normalized.
+            inplace (bool): if False will return a new doc object,
+                            otherwise will change the object passed as parameter.
+
+        Returns: Document
+        """
+        d = doc if inplace else doc._deepcopy()
+
+        if isinstance(d, FastDocument) and isinstance(d.tokens, list):
+            # Assigning the fields of a `FastToken` is as cheap as reading them, so there is nothing to save,
+            # and a pass per normalizer runs faster than the fused loop.
+            for run in self.passes:
+                run(d)
+
+            return None if inplace else d
+
+        for token in d.tokens:
+            value = token.cleaned
+            for normalize, fields in self.chain:
+                value = normalize(value)
+                for field in fields:
+                    setattr(token, field, value)
+
+        d.steps.extend(normalizer.step for normalizer in self.normalizers)
+
+        return None if inplace else d
+
+
+class TrustedPipeline:
+    """Stages of a pipeline validated once, when the pipeline is created, and called without the per call checks.
+
+    The order of the stages, cleaners, tokenizers, normalizers and embeddings, is checked for every possible state
+    of the input documents, with or without tokens and embeddings, so each document only needs to be checked once,
+    when it enters the pipeline. The stages from the first one of an unknown type, e.g. ``Threaded``, onwards keep
+    their per call checks.
+    """
+
+    STATES = tuple((tokens, embedded) for tokens in (False, True) for embedded in (False, True))
+
+    def __init__(self, stages: List[BaseTransformer]):
+        """Stages of a pipeline validated once, when the pipeline is created.
+
+        Args:
+            stages (List[BaseTransformer]): Stages of the pipeline.
+
+        Raises:
+            RuntimeError: When the stages can not be applied on any document.
+        """
+        self.stages = list(stages)
+        self.types: List[TransformersType] = []
+        self.calls: List[Callable] = []
+        self.batches: List[Callable] = []
+
+        for t in self.stages:
+            transformer_type, call, batch = get_transformer_type(t), unchecked_call(t), unchecked_batch(t)
+            if transformer_type is None or call is None or batch is None:
+                break
+
+            self.types.append(transformer_type)
+            self.calls.append(call)
+            self.batches.append(batch)
+
+        for t in self.stages[len(self.types):]:
+            self.calls.append(partial(t, inplace=True))
+            self.batches.append(t.batch)
+
+        # Fingerprint of the steps applied up to each stage, the keys of the pipeline checkpoints.
+        steps: List[str] = []
+        self.prefixes: List[str] = []
+        for t in self.stages:
+            steps.extend(stage_steps(t))
+            self.prefixes.append(fingerprint(steps))
+
+        # Error raised for the documents of each state, None when the stages can be applied.
+        self.errors: Dict[Tuple[bool, bool], Optional[str]] = {state: self._check(*state) for state in self.STATES}
+        if self.stages and all(self.errors.values()):
+            raise RuntimeError(f"Invalid pipeline, {self.errors[(False, False)]}")
+
+    def _check(self, tokens: bool, embedded: bool) -> Optional[str]:
+        for transformer_type in self.types:
+            try:
+                check_state(transformer_type, tokens, embedded)
+            except RuntimeError as e:
+                return str(e)
+
+            tokens = tokens or transformer_type is TransformersType.TOKENIZERS
+            embedded = embedded or transformer_type is TransformersType.EMBEDDINGS
+
+        return None
+
+    def check(self, doc: Union[Document, FastDocument]) -> None:
+        """Check if a document can be processed by the pipeline.
+
+        Args:
+            doc (Union[Document, FastDocument]): Document to be checked.
+        """
+        if not isinstance(doc, (Document, FastDocument)):
+            raise TypeError("Argument doc is not of type Document")
+
+        error = self.errors[(doc.tokens is not None, doc.embedded is not None)]
+        if error is not None:
+            raise RuntimeError(error)
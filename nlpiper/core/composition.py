@@ -1,43 +1,100 @@
 """Compose Module."""
+import time
+from collections import deque
+from concurrent.futures import Executor
+from itertools import islice
 from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
     Optional,
-    List
+    List,
+    Tuple,
+    Union
 )
 
-from nlpiper.core import Document
+from nlpiper.core.cache import ResultCache, assign, fingerprint, is_fresh
+from nlpiper.core.compiler import TrustedPipeline, compile_transformers, stage_steps
+from nlpiper.core.document import Document, FastDocument
+from nlpiper.core.parallel import process_pipe
+from nlpiper.core.profiling import Profiler
+from nlpiper.core.registry import create_transformer
 from nlpiper.transformers.base import BaseTransformer
 from nlpiper.logger import log
 
-# Needed for create_from_steps method (eval instruction)
-from nlpiper.transformers.cleaners import *  # noqa: F401, F403 (flake8 ignore)
-from nlpiper.transformers.normalizers import *  # noqa: F401, F403 (flake8 ignore)
-from nlpiper.transformers.tokenizers import *  # noqa: F401, F403 (flake8 ignore)
-from nlpiper.transformers.embeddings import *  # noqa: F401, F403 (flake8 ignore)
-
 
 class Compose:
     """Pipeline for process document."""
 
-    def __init__(self, transformers: List[BaseTransformer]) -> None:
+    def __init__(self, transformers: List[BaseTransformer], cache: Optional[ResultCache] = None,
+                 checkpoints: Optional[ResultCache] = None, snapshots: bool = False, profile: bool = False,
+                 copy_on_write: bool = False) -> None:
         """Pipeline for process text.
 
+        The order of the transformers is validated once, when the pipeline is created, and each document is only
+        checked when it enters the pipeline, instead of on every transformer call.
+
         Args:
             transformers (List[BaseTransformer]): List of callable objects with implemented method ```__call__```.
+            cache (Optional[ResultCache]): Cache of the processed documents, keyed by their text and the pipeline
+                fingerprint, so repeated texts are only processed once. By default there is no cache.
+            checkpoints (Optional[ResultCache]): Cache of the intermediate documents, the document left by each
+                stage is cached with the steps applied so far as key, and the documents resume from the deepest
+                cached stage. Shared by pipelines with a common prefix, e.g. the same cleaners and tokenizer followed
+                by different normalizers, it saves the prefix computation. Not available with ``pipe(n_jobs > 1)``,
+                since the stages run in other processes. By default there are no checkpoints.
+            snapshots (bool): If True the documents keep a snapshot of their state after each stage, so
+                ``rollback_document`` restores them instead of running the pipeline again. The snapshots share the
+                document values and only copy the tokens list. They are not kept by the documents processed with
+                ``n_jobs > 1`` or taken from the cache. By default False.
+            profile (bool): If True the wall time, calls, throughput, and input and output sizes of each stage
+                are recorded, see ``stats``. Not available with ``pipe(n_jobs > 1)``, since the stages run in other
+                processes. By default False, which adds no cost to the stages.
+            copy_on_write (bool): If True the documents processed with ``inplace=False`` are copied sharing their
+                unchanged values, e.g. token strings and embedding arrays, with the original documents, instead of
+                being deep copied, which is much faster for documents with tokens and embeddings. The embedding
+                arrays must not be changed inplace. Only the documents of this pipeline are affected.
+                By default False.
+
+        Raises:
+            RuntimeError: When the transformers can not be applied in the given order on any document.
         """
         self.transformers = transformers
+        # Stages run in place of the transformers once the pipeline is compiled.
+        self._stages: Optional[List[BaseTransformer]] = None
+        self._trusted = TrustedPipeline(transformers)
+        self.cache = cache
+        self.checkpoints = checkpoints
+        self.snapshots = snapshots
+        self.profiler = Profiler() if profile else None
+        self.copy_on_write = copy_on_write
+        self._pre_hooks: List[Callable] = []
+        self._post_hooks: List[Callable] = []
+        self._fingerprint: Tuple[Optional[List[BaseTransformer]], str] = (None, "")
+        # Documents seen, and processed, by `pipe` with `dedupe=True`.
+        self._dedupe_counts = {'documents': 0, 'processed': 0}
         log.info("[Created] %s", repr(self))
 
     @classmethod
-    def create_from_steps(cls, steps: List[str]):
+    def create_from_steps(cls, steps: List[str], cached: bool = True):
         """Create a Compose instance from a list of steps.
 
+        The steps are parsed, not evaluated, and each one must be a call of a registered transformer, see
+        ``nlpiper.core.registry``. The transformers are shared by the whole process, so recreating a pipeline
+        from the steps of a document does not load its models again.
+
         Args:
             steps (List[str]): List of steps applied on a document.
+            cached (bool): If False new transformers are created instead of the shared ones, by default True.
 
         Returns: Compose
         """
         try:
-            transformers = [eval(step) for step in steps]
+            transformers = [create_transformer(step, cached) for step in steps]
         except NameError as e:
             log.error("Unable to create Compose object from steps: %s", steps)
             raise e
@@ -48,7 +105,10 @@ class Compose:
     def rollback_document(cls, doc: Document, num_steps: int = 1) -> Document:
         """Rollback the steps applied to a document.
 
-        The method will return a new document with the steps applied to the rollback point.
+        The method will return a new document with the steps applied to the rollback point. Documents processed
+        by a pipeline with ``snapshots=True`` are restored from the snapshot of the rollback point, without
+        creating the transformers again. The steps after the deepest snapshot before the rollback point, if any,
+        are applied again.
 
         Args:
             doc (Document): Document instance that will have the steps rolled back.
@@ -62,11 +122,50 @@ class Compose:
         if not (0 < num_steps <= len(doc.steps)):
             raise ValueError(f"Number of steps to rollback must be between 1 and {len(doc.steps)} steps")
 
-        out = Document(doc.original)
+        steps = len(doc.steps) - num_steps
+        out = doc._restore(steps)
+        if len(out.steps) < steps:
+            cls.create_from_steps(doc.steps[len(out.steps):steps])(out, inplace=True)
+
+        return out
+
+    def compile(self) -> 'Compose':
+        """Compile the pipeline, fusing the runs of consecutive cleaners, and normalizers, in single stages.
+
+        Each run of cleaners is applied with one validation and one copy of the document, and the character wise
+        cleaners of the run, e.g. ``CleanNumber``, ``CleanPunctuation``, ``CleanEOF`` and ``CleanAccents``, with a
+        single ``str.translate`` over the document text. Each run of normalizers is applied with a single loop over
+        the tokens, each token string going through every normalizer before being assigned once.
+        The output and the steps recorded in the documents are the same of the pipeline not compiled.
+        The pipeline must be compiled again if its transformers change.
+
+        Example:
+            >>> pipe = Compose([CleanURL(), CleanEmail(), CleanNumber(), CleanPunctuation(), CleanEOF()]).compile()
+
+        Returns: Compose
+        """
+        self._stages = compile_transformers(self.transformers)
+        self._trusted = TrustedPipeline(self._stages)
+        return self
+
+    def _pipeline(self) -> List[BaseTransformer]:
+        return self.transformers if self._stages is None else self._stages
 
-        steps = cls.create_from_steps(doc.steps[:-num_steps])
+    def _trusted_pipeline(self) -> TrustedPipeline:
+        # Validated again when the transformers are changed after the pipeline is created.
+        stages = self._pipeline()
+        if self._trusted.stages != stages:
+            self._trusted = TrustedPipeline(stages)
 
-        return steps(out, inplace=False)
+        return self._trusted
+
+    def fingerprint(self) -> str:
+        """Fingerprint of the pipeline, the hash of the steps of its transformers."""
+        if self._fingerprint[0] != self.transformers:
+            steps = [step for t in self.transformers for step in stage_steps(t)]
+            self._fingerprint = list(self.transformers), fingerprint(steps)
+
+        return self._fingerprint[1]
 
     def __repr__(self) -> str:
         params = ', '.join([repr(t) for t in self.transformers])
@@ -82,9 +181,367 @@ class Compose:
 
         Returns: Document
         """
-        d = doc if inplace else doc._deepcopy()
+        pipeline = self._trusted_pipeline()
+        pipeline.check(doc)
+
+        d = doc if inplace else doc._deepcopy(self.copy_on_write)
 
-        for t in self.transformers:
-            t(d, True)
+        key = None if self.cache is None else self.cache.key(self.fingerprint(), d)
+        cached = None if key is None else self.cache.get(key)
+        if cached is not None:
+            assign(d, cached)
+            return None if inplace else d
+
+        if self.checkpoints is None:
+            observed = self._observed()
+            for stage, call in zip(pipeline.stages, pipeline.calls):
+                if observed:
+                    self._observe(stage, call, d, [d])
+                else:
+                    call(d)
+                if self.snapshots:
+                    d._snapshot()
+        else:
+            self._run_from_checkpoints(pipeline, [d])
+
+        if key is not None:
+            self.cache.put(key, d)
 
         return None if inplace else d
+
+    def pipe(self, docs: Iterable[Union[str, Document]], batch_size: int = 1000, inplace: bool = False,
+             n_jobs: int = 1, chunksize: Optional[int] = None, ordered: bool = True,
+             dedupe: bool = False) -> Iterator[Document]:
+        """Process a stream of documents in batches.
+
+        The documents are consumed lazily from ``docs`` and yielded as soon as their batch is processed, so only
+        ``batch_size`` documents are held in memory at a time. Each transformer processes the whole batch
+        through its ``batch`` method.
+
+        With ``n_jobs > 1`` the documents are processed by a pool of worker processes, each one receiving the
+        transformers once when it starts, so they must be picklable or recreatable from their steps.
+        The cache of the pipeline, if any, is not used by the worker processes.
+
+        Args:
+            docs (Iterable[Union[str, Document]]): Texts or Document objects to be processed.
+            batch_size (int): Number of documents processed together, by default 1000.
+            inplace (bool): if False Document objects are copied before being processed,
+                            otherwise will change the objects passed as parameter. Not available with
+                            ``n_jobs > 1``, since the documents are processed in other processes.
+            n_jobs (int): Number of worker processes, `-1` uses all the available CPUs, by default 1.
+            chunksize (Optional[int]): Number of documents sent to a worker per task, by default ``batch_size``.
+            ordered (bool): If False, with ``n_jobs > 1``, the documents are yielded as soon as they are processed
+                            instead of in the input order.
+            dedupe (bool): If True the documents of a batch with the same text, not processed yet, are processed
+                           once and the others get a copy of the result, see ``dedupe_stats``. With ``n_jobs > 1``
+                           each worker deduplicates its own batches and the statistics are not collected.
+                           By default False.
+
+        Returns: Iterator[Document]
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        if n_jobs != 1:
+            self._check_n_jobs(inplace)
+            yield from process_pipe(self.transformers, docs, n_jobs=n_jobs, chunksize=chunksize or batch_size,
+                                    batch_size=batch_size, ordered=ordered, compiled=self._stages is not None,
+                                    dedupe=dedupe)
+            return
+
+        docs = iter(docs)
+        pipeline = self._trusted_pipeline()
+        while True:
+            batch = [self._as_document(doc, inplace) for doc in islice(docs, batch_size)]
+            if not batch:
+                return
+
+            for doc in batch:
+                pipeline.check(doc)
+
+            unique, duplicates = self._dedupe(batch) if dedupe else (batch, [])
+
+            if self.cache is None:
+                self._run_batch(pipeline, unique)
+            else:
+                self._run_cached_batch(pipeline, unique)
+
+            for doc, processed in duplicates:
+                assign(doc, processed._copy())
+
+            yield from batch
+
+    def _check_n_jobs(self, inplace: bool) -> None:
+        """Reject the options of ``pipe`` that the worker processes can not honour."""
+        if inplace:
+            raise ValueError("inplace is not available when processing documents with n_jobs > 1")
+        if self.profiler is not None or self._pre_hooks or self._post_hooks:
+            raise ValueError("Profiling and hooks are not available when processing documents with n_jobs > 1")
+        if self.checkpoints is not None:
+            raise ValueError("checkpoints are not available when processing documents with n_jobs > 1")
+
+    def _dedupe(self, batch: List[Document]) -> Tuple[List[Document], List[Tuple[Document, Document]]]:
+        """Split a batch in the documents to be processed and the duplicates paired with their processed twin."""
+        unique: List[Document] = []
+        duplicates: List[Tuple[Document, Document]] = []
+        seen = {}
+        for doc in batch:
+            twin = seen.setdefault((type(doc), doc.original), doc) if is_fresh(doc) else doc
+            if twin is doc:
+                unique.append(doc)
+            else:
+                duplicates.append((doc, twin))
+
+        self._dedupe_counts['documents'] += len(batch)
+        self._dedupe_counts['processed'] += len(unique)
+        return unique, duplicates
+
+    def dedupe_stats(self) -> dict:
+        """Documents seen and processed by ``pipe`` with ``dedupe=True``, and the ratio of duplicates among them.
+
+        Example:
+            >>> docs = list(pipe.pipe(texts, dedupe=True))
+            >>> pipe.dedupe_stats()
+            {'documents': 1000, 'processed': 700, 'duplicates': 300, 'ratio': 0.3}
+        """
+        documents, processed = self._dedupe_counts['documents'], self._dedupe_counts['processed']
+        duplicates = documents - processed
+        return {'documents': documents, 'processed': processed, 'duplicates': duplicates,
+                'ratio': duplicates / documents if documents else 0.0}
+
+    def _run_batch(self, pipeline: TrustedPipeline, batch: List[Document]) -> None:
+        if self.checkpoints is not None:
+            self._run_from_checkpoints(pipeline, batch)
+            return
+
+        observed = self._observed()
+        for stage, run_batch in zip(pipeline.stages, pipeline.batches):
+            if observed:
+                self._observe(stage, run_batch, batch, batch)
+            else:
+                run_batch(batch)
+            self._record_snapshots(batch)
+
+    def _run_from_checkpoints(self, pipeline: TrustedPipeline, batch: List[Document]) -> None:
+        # Keys of the document left by each stage, None for the documents that can not be cached.
+        keys = []
+        for doc in batch:
+            doc_keys = [self.checkpoints.key(prefix, doc) for prefix in pipeline.prefixes]
+            keys.append(None if not doc_keys or doc_keys[0] is None else doc_keys)
+
+        # Stage each document resumes from, after its deepest cached stage.
+        starts = []
+        for doc, doc_keys in zip(batch, keys):
+            start = 0
+            for i in reversed(range(len(doc_keys or []))):
+                cached = self.checkpoints.get(doc_keys[i])
+                if cached is not None:
+                    assign(doc, cached)
+                    start = i + 1
+                    break
+            starts.append(start)
+
+        observed = self._observed()
+        for i, (stage, run_batch) in enumerate(zip(pipeline.stages, pipeline.batches)):
+            pending = [(doc, doc_keys) for doc, doc_keys, start in zip(batch, keys, starts) if start <= i]
+            if not pending:
+                continue
+
+            docs = [doc for doc, _ in pending]
+            if observed:
+                self._observe(stage, run_batch, docs, docs)
+            else:
+                run_batch(docs)
+            self._record_snapshots(docs)
+            for doc, doc_keys in pending:
+                if doc_keys is not None:
+                    self.checkpoints.put(doc_keys[i], doc)
+
+    def add_hook(self, callback: Callable, when: str = 'post') -> None:
+        """Add a callback called before or after each stage of the pipeline.
+
+        The callbacks called before a stage receive the stage and the list of documents it will process,
+        the ones called after also receive the wall time of the stage, in seconds. The stages run by other
+        processes, ``pipe(n_jobs > 1)``, can not call them, so ``pipe`` raises ``ValueError`` in that case.
+
+        Example:
+            >>> pipe.add_hook(lambda stage, docs, seconds: print(stage, len(docs), seconds), when='post')
+
+        Args:
+            callback (Callable): Function called with ``(stage, docs)``, or ``(stage, docs, seconds)`` after the
+                stage.
+            when (str): ``'pre'`` to call it before each stage or ``'post'`` to call it after, by default
+                ``'post'``.
+        """
+        if when not in ('pre', 'post'):
+            raise ValueError("when must be 'pre' or 'post'")
+
+        (self._pre_hooks if when == 'pre' else self._post_hooks).append(callback)
+
+    def stats(self) -> dict:
+        """Statistics of each stage of the pipeline, recorded when it is created with ``profile=True``.
+
+        Example:
+            >>> pipe = Compose([CleanMarkup(), BasicTokenizer(), SpellCheck()], profile=True)
+            >>> docs = list(pipe.pipe(texts))
+            >>> pipe.stats()['stages'][2]
+            {'name': "SpellCheck(language='en_GB', max_distance=None)", 'calls': 1, 'documents': 1000,
+             'seconds': 3.2, 'chars_in': 81250, 'chars_out': 81250, 'tokens_in': 14200, 'tokens_out': 14200,
+             'documents_per_second': 312.5, 'tokens_per_second': 4437.5}
+
+        Returns: dict
+        """
+        if self.profiler is None:
+            raise RuntimeError("Profiling is not enabled, create the pipeline with profile=True")
+
+        return self.profiler.report()
+
+    def _observed(self) -> bool:
+        return self.profiler is not None or bool(self._pre_hooks) or bool(self._post_hooks)
+
+    def _observe(self, stage: BaseTransformer, run: Callable, arg: Any, docs: List[Document]) -> None:
+        """Run a stage calling the hooks and recording its statistics."""
+        for hook in self._pre_hooks:
+            hook(stage, docs)
+
+        before = None if self.profiler is None else Profiler.measure(docs)
+        start = time.perf_counter()
+        run(arg)
+        seconds = time.perf_counter() - start
+
+        if self.profiler is not None:
+            name = stage.step if isinstance(stage, BaseTransformer) else repr(stage)
+            self.profiler.record(name, docs, seconds, before)
+
+        for hook in self._post_hooks:
+            hook(stage, docs, seconds)
+
+    def _record_snapshots(self, batch: List[Document]) -> None:
+        if self.snapshots:
+            for doc in batch:
+                doc._snapshot()
+
+    def _run_cached_batch(self, pipeline: TrustedPipeline, batch: List[Document]) -> None:
+        fingerprint = self.fingerprint()
+        missing = []
+        for doc in batch:
+            key = self.cache.key(fingerprint, doc)
+            cached = None if key is None else self.cache.get(key)
+            if cached is None:
+                missing.append((key, doc))
+            else:
+                assign(doc, cached)
+
+        self._run_batch(pipeline, [doc for _, doc in missing])
+
+        for key, doc in missing:
+            if key is not None:
+                self.cache.put(key, doc)
+
+    async def acall(self, doc: Document, inplace: bool = False,
+                    executor: Optional[Executor] = None) -> Optional[Document]:
+        """Process document with transformers pipeline without blocking the event loop.
+
+        The pipeline runs in ``executor``, so the event loop is free while the transformers are working.
+        The default executor, a pool of threads, runs the stages from several threads at once, so the stages that
+        are not thread safe, e.g. the Hunspell based ``SpellCheck`` or a ``Stemmer`` with a shared cache, must be
+        wrapped in ``Threaded`` or run in a ``ProcessPoolExecutor``, which receives a copy of the pipeline and of
+        the document on each call.
+
+        Args:
+            doc (Document): Document object to be processed.
+            inplace (bool): if False will return a new doc object,
+                            otherwise will change the object passed as parameter.
+            executor (Optional[Executor]): Executor where the pipeline runs, by default the event loop default
+                                           executor.
+
+        Returns: Document
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        # The document is processed out of place, since a process executor only changes a copy of it.
+        out = await loop.run_in_executor(executor, self.__call__, doc, False)
+        if not inplace:
+            return out
+
+        assign(doc, out)
+        return None
+
+    async def apipe(self, docs: Union[AsyncIterable[Union[str, Document]], Iterable[Union[str, Document]]],
+                    max_concurrency: int = 8, inplace: bool = False,
+                    executor: Optional[Executor] = None) -> AsyncIterator[Document]:
+        """Process a stream of documents without blocking the event loop.
+
+        Up to ``max_concurrency`` documents are in flight at a time, counting the ones already processed but not
+        yet consumed, and no more documents are read from ``docs`` until one of them is consumed. The documents
+        are yielded in the input order. As with ``acall``, the stages that are not thread safe must be wrapped in
+        ``Threaded`` or run in a ``ProcessPoolExecutor`` instead of the default pool of threads.
+
+        Example:
+            >>> async for doc in pipe.apipe(texts, max_concurrency=16, executor=ThreadPoolExecutor(4)):
+            ...     await store(doc)
+
+        Args:
+            docs (Union[AsyncIterable[Union[str, Document]], Iterable[Union[str, Document]]]): Texts or Document
+                objects to be processed.
+            max_concurrency (int): Maximum number of documents in flight, by default 8.
+            inplace (bool): if False Document objects are copied before being processed,
+                            otherwise will change the objects passed as parameter.
+            executor (Optional[Executor]): Executor where the pipeline runs, by default the event loop default
+                                           executor.
+
+        Returns: AsyncIterator[Document]
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        pending: Deque[Tuple[Document, asyncio.Future]] = deque()
+
+        async def first_processed() -> Document:
+            doc, future = pending.popleft()
+            out = await future
+            semaphore.release()
+            if not inplace:
+                return out
+
+            assign(doc, out)
+            return doc
+
+        try:
+            async for item in _aiterate(docs):
+                if semaphore.locked():
+                    yield await first_processed()
+
+                await semaphore.acquire()
+                # The document is copied by the call, in the executor, and by a process executor anyway.
+                doc = self._as_document(item, inplace=True)
+                pending.append((doc, loop.run_in_executor(executor, self.__call__, doc, False)))
+
+            while pending:
+                yield await first_processed()
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+    def _as_document(self, doc: Union[str, Document], inplace: bool) -> Document:
+        if isinstance(doc, str):
+            return Document(doc)
+
+        if not isinstance(doc, (Document, FastDocument)):
+            raise TypeError("Argument doc is not of type Document or str")
+
+        return doc if inplace else doc._deepcopy(self.copy_on_write)
+
+
+async def _aiterate(docs: Union[AsyncIterable, Iterable]) -> AsyncIterator:
+    if hasattr(docs, '__aiter__'):
+        async for doc in docs:
+            yield doc
+    else:
+        for doc in docs:
+            yield doc
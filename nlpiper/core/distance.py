@@ -0,0 +1,78 @@
+"""Edit Distance Module."""
+from typing import Optional
+
+
+def levenshtein(source: str, target: str, max_distance: Optional[int] = None) -> int:
+    """Levenshtein distance between two strings, the number of insertions, deletions and substitutions.
+
+    When ``max_distance`` is given the computation stops as soon as the distance is known to exceed it, and
+    ``max_distance + 1`` is returned, which makes ranking many candidates against a threshold cheap.
+
+    Example:
+        >>> levenshtein('kitten', 'sitting')
+        3
+        >>> levenshtein('kitten', 'sitting', max_distance=1)
+        2
+
+    Args:
+        source (str): First string.
+        target (str): Second string.
+        max_distance (Optional[int]): Largest distance of interest, by default the exact distance is computed.
+
+    Returns: int
+    """
+    if source == target:
+        return 0
+
+    limit = len(source) + len(target) if max_distance is None else max_distance
+    if abs(len(source) - len(target)) > limit:
+        return limit + 1
+
+    # The common suffix and prefix do not change the distance.
+    size = min(len(source), len(target))
+    suffix = 0
+    while suffix < size and source[-1 - suffix] == target[-1 - suffix]:
+        suffix += 1
+    prefix = 0
+    while prefix < size - suffix and source[prefix] == target[prefix]:
+        prefix += 1
+    source = source[prefix:len(source) - suffix]
+    target = target[prefix:len(target) - suffix]
+
+    if len(source) > len(target):
+        source, target = target, source
+    if not source:
+        return min(len(target), limit + 1)
+
+    return _banded(source, target, limit)
+
+
+def _banded(source: str, target: str, limit: int) -> int:
+    """Levenshtein distance of a source not longer than the target, or ``limit + 1`` when it exceeds ``limit``."""
+    # Only the cells within `limit` of the diagonal can hold a distance up to `limit`, the others are `limit + 1`.
+    exceeded = limit + 1
+    size = len(target)
+    previous = [j if j <= limit else exceeded for j in range(size + 1)]
+    for i, char in enumerate(source, 1):
+        low = max(1, i - limit)
+        high = min(size, i + limit)
+        current = [exceeded] * (size + 1)
+        current[0] = smallest = i if i <= limit else exceeded
+        for j in range(low, high + 1):
+            value = previous[j - 1] if char == target[j - 1] else previous[j - 1] + 1
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if value > exceeded:
+                value = exceeded
+            current[j] = value
+            if value < smallest:
+                smallest = value
+
+        # The distance can only grow from the smallest value of the row.
+        if smallest > limit:
+            return exceeded
+        previous = current
+
+    return previous[-1]
@@ -1,9 +1,11 @@
 """Document Module."""
 
+from array import array
+from collections.abc import Sequence
 from copy import deepcopy
-from typing import Any, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, validator, Extra
+from pydantic import BaseModel, Extra, PrivateAttr, validate_model, validator
 
 from nlpiper.logger import log
 
@@ -21,6 +23,44 @@ def _check_if_embedded_in_numpy_array(v):
     return v
 
 
+def _dump_values(model: BaseModel, values: dict) -> Union[tuple, dict]:
+    # Values are kept in the fields order, so the field names are only needed when there are extra fields.
+    return tuple(values.values()) if len(values) == len(model.__fields__) else values
+
+
+def _load_values(cls, state: Union[tuple, dict]):
+    return cls.construct(**(state if isinstance(state, dict) else dict(zip(cls.__fields__, state))))
+
+
+def _copy_tokens(tokens):
+    if tokens is None:
+        return None
+
+    return tokens.copy() if isinstance(tokens, TokenSpans) else [token.copy() for token in tokens]
+
+
+def _record_snapshot(doc) -> None:
+    if doc._snapshots is None:
+        doc._snapshots = {}
+
+    # Transformers never change a value inplace, so the snapshot only copies the tokens and shares the values.
+    doc._snapshots[len(doc.steps)] = (doc.cleaned, _copy_tokens(doc.tokens), doc.embedded)
+
+
+def _find_snapshot(doc, num_steps: int) -> Tuple[int, Optional[tuple]]:
+    """Deepest snapshot of a document with at most ``num_steps`` steps, and its number of steps."""
+    snapshots = doc._snapshots or {}
+    steps = max((n for n in snapshots if n <= num_steps), default=0)
+    return steps, snapshots.get(steps)
+
+
+def _kept_snapshots(doc, num_steps: int) -> Optional[Dict[int, tuple]]:
+    if doc._snapshots is None:
+        return None
+
+    return {n: snapshot for n, snapshot in doc._snapshots.items() if n <= num_steps}
+
+
 class Token(BaseModel):
     original: str
     cleaned: Optional[str] = None
@@ -36,6 +76,13 @@ class Token(BaseModel):
     def check_if_embedded_in_numpy_array(cls, v):
         return _check_if_embedded_in_numpy_array(v)
 
+    def _dump(self) -> Union[tuple, dict]:
+        return _dump_values(self, self.__dict__)
+
+    @classmethod
+    def _load(cls, state: Union[tuple, dict]) -> 'Token':
+        return _load_values(cls, state)
+
     class Config:
         validate_assignment = True
         extra = Extra.allow
@@ -48,11 +95,85 @@ class Document(BaseModel):
     embedded: Optional[Any] = None
     steps: List[str] = []
 
+    # State of the document after each step, by number of steps, recorded by ``Compose(snapshots=True)``.
+    _snapshots: Optional[Dict[int, tuple]] = PrivateAttr(default=None)
+
+    token_class: ClassVar[type] = Token
+
     def __init__(self, original: str, **data) -> None:
         super().__init__(original=original, cleaned=original, **data)
 
-    def _deepcopy(self):
-        return deepcopy(self)
+    def _deepcopy(self, copy_on_write: bool = False):
+        """Copy of the document, sharing its unchanged values with ``copy_on_write``, see ``_copy``."""
+        return self._copy() if copy_on_write else deepcopy(self)
+
+    def _make_tokens(self, texts: Optional[List[str]], spans: Optional[List[Tuple[int, int]]] = None) -> List[Token]:
+        """Create the tokens of the document.
+
+        Args:
+            texts (Optional[List[str]]): Text of each token.
+            spans (Optional[List[Tuple[int, int]]]): Offsets of each token in ``cleaned``, only supported by
+                ``FastDocument``, since the tokens of a ``Document`` would store them besides their text.
+
+        Returns: List[Token]
+        """
+        if spans is not None:
+            raise TypeError("Tokenizers created with offsets=True can only be applied on FastDocument documents")
+
+        return [self.token_class(text) for text in texts]
+
+    def _copy(self) -> 'Document':
+        """Copy the document sharing its values.
+
+        Transformers only assign new values to the document and its tokens, they never change a value inplace,
+        so only the document, its tokens and the steps list are new objects. Values like strings and embedding
+        arrays are shared with the original document.
+        """
+        tokens = None if self.tokens is None else [token.copy() for token in self.tokens]
+        other = self.copy(update={'tokens': tokens, 'steps': list(self.steps)})
+        other._snapshots = _kept_snapshots(self, len(self.steps))
+        return other
+
+    def _snapshot(self) -> None:
+        """Record the state of the document after its last step, so it can be rolled back without running again."""
+        _record_snapshot(self)
+
+    def _restore(self, num_steps: int) -> 'Document':
+        """New document in the state recorded by its deepest snapshot with at most ``num_steps`` steps.
+
+        Args:
+            num_steps (int): Number of steps of the restored document, the steps of the snapshot are kept when
+                there is no snapshot with that number of steps. Without snapshots the document is created again.
+
+        Returns: Document
+        """
+        steps, snapshot = _find_snapshot(self, num_steps)
+        if snapshot is None:
+            return type(self)(self.original)
+
+        cleaned, tokens, embedded = snapshot
+        other = self.copy(update={'cleaned': cleaned, 'tokens': _copy_tokens(tokens), 'embedded': embedded,
+                                  'steps': self.steps[:steps]})
+        other._snapshots = _kept_snapshots(self, steps)
+        return other
+
+    def _dump(self) -> Union[tuple, dict]:
+        """Compact representation of the document made of builtin types, used to send it between processes."""
+        values = dict(self.__dict__)
+        values['steps'] = list(self.steps)
+        if self.tokens is not None:
+            values['tokens'] = [token._dump() for token in self.tokens]
+
+        return _dump_values(self, values)
+
+    @classmethod
+    def _load(cls, state: Union[tuple, dict]) -> 'Document':
+        """Rebuild a document from its compact representation without validating it again."""
+        doc = _load_values(cls, state)
+        if doc.tokens is not None:
+            doc.__dict__['tokens'] = [Token._load(token) for token in doc.tokens]
+
+        return doc
 
     @validator('embedded', pre=True)
     def check_if_embedded_in_numpy_array(cls, v):
@@ -61,3 +182,352 @@ class Document(BaseModel):
     class Config:
         validate_assignment = True
         extra = Extra.allow
+
+
+def _validated(cls, values: dict):
+    # Unset values are left to their defaults, the validators of optional fields do not expect None.
+    values, fields_set, error = validate_model(cls, {name: v for name, v in values.items() if v is not None})
+    if error:
+        raise error
+
+    return cls.construct(_fields_set=fields_set, **values)
+
+
+class _FastModel:
+    """Base of the fast backend models, plain objects with their fields stored in ``__slots__``."""
+
+    __slots__: tuple = ()
+    # Fields of the model, the slots besides them hold internal state.
+    _fields: tuple = ()
+
+    def _set_fields(self, data: dict) -> None:
+        for name, value in data.items():
+            setattr(self, name, value)
+
+    def dict(self) -> dict:
+        """Fields of the model as a dictionary."""
+        return {name: getattr(self, name) for name in self._fields}
+
+    def copy(self):
+        """Shallow copy of the model."""
+        other = self.__class__.__new__(self.__class__)
+        for name in self.__slots__:
+            setattr(other, name, getattr(self, name))
+
+        return other
+
+    def _dump(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._fields)
+
+    @classmethod
+    def _load(cls, state: Union[tuple, dict]):
+        other = cls.__new__(cls)
+        other._set_fields(state if isinstance(state, dict) else dict(zip(cls._fields, state)))
+
+        return other
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (_FastModel, BaseModel)):
+            return self.dict() == other.dict()
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        values = ', '.join("%s=%r" % (name, getattr(self, name)) for name in self._fields)
+        return "%s(%s)" % (self.__class__.__name__, values)
+
+
+class FastToken(_FastModel):
+    """Token of a ``FastDocument``.
+
+    Plain object with the same fields of ``Token``, which are not validated when assigned.
+    Unlike ``Token`` it does not accept extra attributes.
+    """
+
+    __slots__ = ('original', 'cleaned', 'lemma', 'stem', 'ner', 'embedded')
+    _fields = __slots__
+
+    def __init__(self, original: str, **data) -> None:
+        self.original = original
+        self.cleaned = original
+        self.lemma: Optional[str] = None
+        self.stem: Optional[str] = None
+        self.ner: Optional[str] = None
+        self.embedded: Optional[Any] = None
+        self._set_fields(data)
+
+    def to_token(self) -> Token:
+        """Validate the token and convert it to a ``Token``."""
+        return _validated(Token, self.dict())
+
+
+class TokenSpans(Sequence):
+    """Tokens of a ``FastDocument`` stored as character offsets into the document text.
+
+    The ``(start, end)`` offsets of all the tokens are stored in a single array, instead of a token object and
+    a copy of its text per token, and the token text is read from ``source``, the ``cleaned`` text of the
+    document when it was tokenized. The other token fields are stored in lists, one per field, created on their
+    first assignment. The ``cleaned`` text of a token is only stored once it differs from the token text.
+    Tokens are accessed through ``SpanToken`` views.
+    """
+
+    FIELDS = ('original', 'cleaned', 'lemma', 'stem', 'ner', 'embedded')
+
+    def __init__(self, source: str, spans: List[Tuple[int, int]], texts: Optional[List[str]] = None) -> None:
+        """Tokens of a ``FastDocument`` stored as character offsets into the document text.
+
+        Args:
+            source (str): Text the tokens were extracted from.
+            spans (List[Tuple[int, int]]): Offsets of each token in ``source``.
+            texts (Optional[List[str]]): Text of each token, only needed when it may differ from the text of its
+                span, e.g. tokens escaped by the tokenizer.
+        """
+        self.source = source
+        self.offsets = array('L', [offset for span in spans for offset in span])
+        # Columns of the token fields, a missing column or a None value means the field is not set, which
+        # for `original` and `cleaned` means the text of the span.
+        self.columns: dict = {}
+
+        if texts is not None:
+            for i, (text, (start, end)) in enumerate(zip(texts, spans)):
+                if source[start:end] != text:
+                    self._set(i, 'original', text)
+
+    def span(self, i: int) -> Tuple[int, int]:
+        """Offsets of the token ``i`` in ``source``."""
+        return self.offsets[2 * i], self.offsets[2 * i + 1]
+
+    def _get(self, i: int, field: str) -> Any:
+        column = self.columns.get(field)
+        value = None if column is None else column[i]
+
+        if value is None and field == 'cleaned':
+            return self._get(i, 'original')
+        if value is None and field == 'original':
+            return self.source[self.offsets[2 * i]:self.offsets[2 * i + 1]]
+
+        return value
+
+    def _set(self, i: int, field: str, value: Any) -> None:
+        if field == 'cleaned' and value == self._get(i, 'original'):
+            value = None
+
+        column = self.columns.get(field)
+        if column is None:
+            if value is None:
+                return
+            column = self.columns[field] = [None] * len(self)
+
+        column[i] = value
+
+    def copy(self) -> 'TokenSpans':
+        """Copy of the tokens sharing the source text and the offsets."""
+        other = self.__class__.__new__(self.__class__)
+        other.source = self.source
+        other.offsets = self.offsets
+        other.columns = {field: list(column) for field, column in self.columns.items()}
+
+        return other
+
+    def __len__(self) -> int:
+        return len(self.offsets) // 2
+
+    def __getitem__(self, i: Union[int, slice]) -> Union['SpanToken', List['SpanToken']]:
+        if isinstance(i, slice):
+            return [SpanToken(self, j) for j in range(*i.indices(len(self)))]
+
+        if not -len(self) <= i < len(self):
+            raise IndexError("TokenSpans index out of range")
+
+        return SpanToken(self, i % len(self))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, TokenSpans)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class SpanToken:
+    """View of a token of ``TokenSpans``, reading and writing its fields.
+
+    Besides the fields of ``FastToken`` it has the ``start`` and ``end`` offsets of the token in the text of the
+    document.
+    """
+
+    __slots__ = ('tokens', 'index')
+
+    def __init__(self, tokens: TokenSpans, index: int) -> None:
+        self.tokens = tokens
+        self.index = index
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in TokenSpans.FIELDS:
+            raise AttributeError(name)
+
+        return self.tokens._get(self.index, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self.__slots__:
+            object.__setattr__(self, name, value)
+        elif name in TokenSpans.FIELDS:
+            self.tokens._set(self.index, name, value)
+        else:
+            raise AttributeError(name)
+
+    @property
+    def start(self) -> int:
+        return self.tokens.span(self.index)[0]
+
+    @property
+    def end(self) -> int:
+        return self.tokens.span(self.index)[1]
+
+    def dict(self) -> dict:
+        """Fields of the token as a dictionary."""
+        values = {field: getattr(self, field) for field in TokenSpans.FIELDS}
+        values['start'], values['end'] = self.tokens.span(self.index)
+        return values
+
+    def to_token(self) -> Token:
+        """Validate the token and convert it to a ``Token``, with the offsets as extra fields."""
+        return _validated(Token, self.dict())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (SpanToken, _FastModel, BaseModel)):
+            return self.dict() == other.dict()
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return "%s(%s)" % (self.__class__.__name__, ', '.join("%s=%r" % item for item in self.dict().items()))
+
+
+class FastDocument(_FastModel):
+    """Document without per assignment validation.
+
+    Drop-in replacement of ``Document`` built on ``__slots__``. Its fields and the ones of its tokens are not
+    validated when assigned, which makes token heavy pipelines several times faster and the tokens a fraction of
+    the size. The validation is done once, at the pipeline boundaries, with ``validate`` or ``to_document``.
+    Unlike ``Document`` it does not accept extra attributes.
+
+    Tokenizers created with ``offsets=True`` store its tokens as ``TokenSpans``, offsets into the document text.
+
+    Example:
+        >>> docs = [FastDocument(text) for text in texts]
+        >>> out = [doc.to_document() for doc in pipe.pipe(docs)]
+    """
+
+    _fields = ('original', 'cleaned', 'tokens', 'embedded', 'steps')
+    __slots__ = _fields + ('_snapshots',)
+    token_class = FastToken
+
+    def __init__(self, original: str, **data) -> None:
+        if not isinstance(original, str):
+            raise TypeError("Argument original is not of type str")
+
+        self.original = original
+        self.cleaned = original
+        self.tokens: Optional[Union[List[FastToken], TokenSpans]] = None
+        self.embedded: Optional[Any] = None
+        self.steps: List[str] = []
+        self._snapshots: Optional[Dict[int, tuple]] = None
+        self._set_fields(data)
+
+    @classmethod
+    def from_document(cls, doc: Document) -> 'FastDocument':
+        """Create a fast document from a ``Document``, sharing its values."""
+        return cls._load(doc._dump())
+
+    def to_document(self) -> Document:
+        """Validate the document and convert it to a ``Document``."""
+        values = self.dict()
+        values['steps'] = list(self.steps)
+        if self.tokens is not None:
+            values['tokens'] = [token.to_token() for token in self.tokens]
+
+        return _validated(Document, values)
+
+    def validate(self) -> 'FastDocument':
+        """Validate the document, raising a ``pydantic.ValidationError`` if any of its values is invalid."""
+        self.to_document()
+        return self
+
+    def dict(self) -> dict:
+        """Fields of the document, and of its tokens, as a dictionary."""
+        values = super().dict()
+        if self.tokens is not None:
+            values['tokens'] = [token.dict() for token in self.tokens]
+
+        return values
+
+    def _deepcopy(self, copy_on_write: bool = False):
+        """Copy of the document, sharing its unchanged values with ``copy_on_write``, see ``_copy``."""
+        return self._copy() if copy_on_write else deepcopy(self)
+
+    def _make_tokens(self, texts: Optional[List[str]],
+                     spans: Optional[List[Tuple[int, int]]] = None) -> Union[List[FastToken], TokenSpans]:
+        """Create the tokens of the document, stored as ``TokenSpans`` when the spans are given.
+
+        Args:
+            texts (Optional[List[str]]): Text of each token, it can only be None when the spans are given.
+            spans (Optional[List[Tuple[int, int]]]): Offsets of each token in ``cleaned``.
+
+        Returns: Union[List[FastToken], TokenSpans]
+        """
+        if spans is None:
+            return [self.token_class(text) for text in texts]
+
+        return TokenSpans(self.cleaned, spans, texts)
+
+    def _copy(self) -> 'FastDocument':
+        other = self.copy()
+        other.steps = list(self.steps)
+        other.tokens = _copy_tokens(self.tokens)
+        other._snapshots = _kept_snapshots(self, len(self.steps))
+
+        return other
+
+    def _snapshot(self) -> None:
+        """Record the state of the document after its last step, so it can be rolled back without running again."""
+        _record_snapshot(self)
+
+    def _restore(self, num_steps: int) -> 'FastDocument':
+        """New document in the state recorded by its deepest snapshot with at most ``num_steps`` steps.
+
+        Args:
+            num_steps (int): Number of steps of the restored document, the steps of the snapshot are kept when
+                there is no snapshot with that number of steps. Without snapshots the document is created again.
+
+        Returns: FastDocument
+        """
+        steps, snapshot = _find_snapshot(self, num_steps)
+        other = type(self)(self.original)
+        if snapshot is None:
+            return other
+
+        other.cleaned, tokens, other.embedded = snapshot
+        other.tokens = _copy_tokens(tokens)
+        other.steps = self.steps[:steps]
+        other._snapshots = _kept_snapshots(self, steps)
+        return other
+
+    def _dump(self) -> tuple:
+        # Token spans are already compact, they are sent as they are.
+        tokens = self.tokens
+        if isinstance(tokens, list):
+            tokens = [token._dump() for token in tokens]
+
+        return self.original, self.cleaned, tokens, self.embedded, list(self.steps)
+
+    @classmethod
+    def _load(cls, state: Union[tuple, dict]) -> 'FastDocument':
+        doc = super()._load(state)
+        doc._snapshots = None
+        if isinstance(doc.tokens, list):
+            doc.tokens = [FastToken._load(token) for token in doc.tokens]
+
+        return doc
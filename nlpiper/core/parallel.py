@@ -0,0 +1,272 @@
+"""Parallel Execution Module."""
+import os
+import pickle
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from queue import Empty, SimpleQueue
+from threading import Lock
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+
+from nlpiper.core.document import Document, FastDocument
+from nlpiper.logger import log
+from nlpiper.transformers.base import BaseTransformer
+
+# Pipeline of the current worker process, built once by `_init_worker`.
+_worker_pipeline = None
+
+
+def process_pipe(transformers: list, docs: Iterable[Union[str, Document, FastDocument]], n_jobs: int, chunksize: int,
+                 batch_size: int, ordered: bool = True, compiled: bool = False,
+                 dedupe: bool = False) -> Iterator[Document]:
+    """Process a stream of documents with a pool of worker processes.
+
+    The transformers are sent to each worker once, when the worker starts, and the documents travel between
+    processes in a compact form made of builtin types instead of pickled models. At most ``2 * n_jobs`` chunks
+    are in flight, so the input is consumed lazily.
+
+    Args:
+        transformers (list): Transformers applied by each worker.
+        docs (Iterable[Union[str, Document, FastDocument]]): Texts or Document objects to be processed.
+        n_jobs (int): Number of worker processes, `-1` uses all the available CPUs.
+        chunksize (int): Number of documents sent to a worker per task.
+        batch_size (int): Number of documents processed together inside a worker.
+        ordered (bool): If True the documents are yielded in the input order,
+                        otherwise as soon as their chunk is processed.
+        compiled (bool): If True each worker compiles its pipeline, see ``Compose.compile``.
+        dedupe (bool): If True each worker processes the identical texts of a batch once, see ``Compose.pipe``.
+
+    Returns: Iterator[Document]
+    """
+    n_jobs = (os.cpu_count() or 1) if n_jobs == -1 else n_jobs
+    if n_jobs < 1:
+        raise ValueError("n_jobs must be a positive integer or -1")
+
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+
+    # Imported on first use, it brings multiprocessing, which is slow to import.
+    from concurrent.futures import ProcessPoolExecutor
+
+    initargs = (_worker_spec(transformers), batch_size, compiled, dedupe)
+    max_pending = 2 * n_jobs
+
+    with ProcessPoolExecutor(n_jobs, initializer=_init_worker, initargs=initargs) as executor:
+        pending: Union[deque, set] = deque() if ordered else set()
+
+        for chunk in _chunks(docs, chunksize):
+            if len(pending) >= max_pending:
+                yield from _drain(pending, ordered)
+
+            future = executor.submit(_process_chunk, chunk)
+            if ordered:
+                pending.append(future)
+            else:
+                pending.add(future)
+
+        while pending:
+            yield from _drain(pending, ordered)
+
+
+def _chunks(docs: Iterable[Union[str, Document, FastDocument]], chunksize: int) -> Iterator[list]:
+    docs = iter(docs)
+    while True:
+        chunk = [_dump(doc) for doc in islice(docs, chunksize)]
+        if not chunk:
+            return
+        yield chunk
+
+
+def _dump(doc: Union[str, Document, FastDocument]) -> Union[str, tuple]:
+    if isinstance(doc, str):
+        return doc
+
+    if not isinstance(doc, (Document, FastDocument)):
+        raise TypeError("Argument doc is not of type Document or str")
+
+    return type(doc), doc._dump()
+
+
+def _load(state: Union[str, tuple]) -> Union[str, Document, FastDocument]:
+    if isinstance(state, str):
+        return state
+
+    cls, values = state
+    return cls._load(values)
+
+
+def _drain(pending: Union[deque, set], ordered: bool) -> Iterator[Union[Document, FastDocument]]:
+    if ordered:
+        futures = [pending.popleft()]
+    else:
+        futures, _ = wait(pending, return_when=FIRST_COMPLETED)
+        pending.difference_update(futures)
+
+    for future in futures:
+        for state in future.result():
+            yield _load(state)
+
+
+def _worker_spec(transformers: list) -> Tuple[str, Union[bytes, List[str]]]:
+    """Pickle the transformers, falling back to their steps when some of them can not be pickled."""
+    try:
+        return 'pickle', pickle.dumps(transformers)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        log.warning("Unable to pickle transformers (%s), workers will rebuild them from their steps", e)
+        return 'steps', [repr(t) for t in transformers]
+
+
+def _init_worker(spec: Tuple[str, Union[bytes, List[str]]], batch_size: int, compiled: bool = False,
+                 dedupe: bool = False) -> None:
+    from nlpiper.core.composition import Compose
+
+    global _worker_pipeline
+    kind, payload = spec
+    pipeline = Compose(pickle.loads(payload)) if kind == 'pickle' else Compose.create_from_steps(payload)
+    if compiled:
+        pipeline.compile()
+    _worker_pipeline = pipeline, batch_size, dedupe
+
+
+def _process_chunk(chunk: list) -> list:
+    pipeline, batch_size, dedupe = _worker_pipeline
+    docs = (_load(state) for state in chunk)
+
+    return [_dump(doc) for doc in pipeline.pipe(docs, batch_size=batch_size, inplace=True, dedupe=dedupe)]
+
+
+class Threaded(BaseTransformer):
+    """Run a transformer with a pool of threads.
+
+    Meant for transformers that spend most of their time in native code releasing the GIL, e.g. Hunspell,
+    lxml or torch, where a process pool would duplicate large models in memory. It can wrap any stage of a
+    ``Compose``, when processing a batch (see ``Compose.pipe``) the documents are split among the threads.
+
+    The threads are started on the first batch and stopped by ``close``, or when leaving a ``with`` block.
+
+    Example:
+        >>> with Threaded(SpellCheck(), n_threads=4) as spell:
+        ...     docs = list(Compose([BasicTokenizer(), spell]).pipe(texts, batch_size=256))
+    """
+
+    def __init__(self, transformer: BaseTransformer, n_threads: int = 4, thread_safe: bool = False,
+                 factory: Optional[Callable[[], BaseTransformer]] = None):
+        """Run a transformer with a pool of threads.
+
+        Args:
+            transformer (BaseTransformer): Transformer to be run.
+            n_threads (int): Number of threads, by default 4.
+            thread_safe (bool): If True the same transformer instance is shared by all the threads, otherwise
+                each thread borrows an instance from a pool, which grows up to one instance per thread.
+            factory (Optional[Callable[[], BaseTransformer]]): Creates the extra instances of the pool,
+                by default the transformer is recreated from its step.
+        """
+        if n_threads < 1:
+            raise ValueError("n_threads must be a positive integer")
+
+        super().__init__(transformer, n_threads=n_threads, thread_safe=thread_safe)
+        self.transformer = transformer
+        self.n_threads = n_threads
+        self.thread_safe = thread_safe
+        self.factory = factory
+        self._init_pool()
+
+    def _init_pool(self) -> None:
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = Lock()
+        self._instances: SimpleQueue = SimpleQueue()
+        self._instances.put(self.transformer)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        for attribute in ('_executor', '_lock', '_instances'):
+            del state[attribute]
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._init_pool()
+
+    def __call__(self, doc: Document, inplace: bool = False) -> Optional[Document]:
+        """Process a document with one of the transformer instances.
+
+        Args:
+            doc (Document): Document to be processed.
+            inplace (bool): if False will return a new doc object,
+                            otherwise will change the object passed as parameter.
+
+        Returns: Document
+        """
+        transformer = self._acquire()
+        try:
+            return transformer(doc, inplace)
+        finally:
+            self._release(transformer)
+
+    def batch(self, docs: List[Document]) -> None:
+        """Process a batch of documents inplace, splitting it among the threads.
+
+        Args:
+            docs (List[Document]): Documents to be processed.
+        """
+        size = -(-len(docs) // self.n_threads)
+        if size == 0:
+            return
+
+        # Consume the results so exceptions raised in the threads are propagated.
+        list(self._get_executor().map(self._batch, [docs[i:i + size] for i in range(0, len(docs), size)]))
+
+    def _batch(self, docs: List[Document]) -> None:
+        transformer = self._acquire()
+        try:
+            transformer.batch(docs)
+        finally:
+            self._release(transformer)
+
+    def _acquire(self) -> BaseTransformer:
+        if self.thread_safe:
+            return self.transformer
+
+        try:
+            return self._instances.get_nowait()
+        except Empty:
+            return self.factory() if self.factory is not None else self._rebuild()
+
+    def _release(self, transformer: BaseTransformer) -> None:
+        if not self.thread_safe:
+            self._instances.put(transformer)
+
+    def _rebuild(self) -> BaseTransformer:
+        from nlpiper.core.composition import Compose
+
+        return Compose.create_from_steps([repr(self.transformer)], cached=False).transformers[0]
+
+    def close(self) -> None:
+        """Stop the threads, after the batches being processed. They are started again by the next batch."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'Threaded':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.n_threads, thread_name_prefix=type(self.transformer).__name__)
+
+        return self._executor
@@ -0,0 +1,88 @@
+"""Pipeline Profiling Module."""
+from threading import Lock
+from typing import (
+    Dict,
+    List,
+    Tuple,
+    Union
+)
+
+from nlpiper.core.document import Document, FastDocument
+
+
+class StageStats:
+    """Statistics of a stage of a pipeline, accumulated over its calls."""
+
+    __slots__ = ('name', 'calls', 'documents', 'seconds', 'chars_in', 'chars_out', 'tokens_in', 'tokens_out')
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.documents = 0
+        self.seconds = 0.0
+        self.chars_in = 0
+        self.chars_out = 0
+        self.tokens_in = 0
+        self.tokens_out = 0
+
+    def dict(self) -> dict:
+        """Statistics of the stage as a dictionary, with its throughput in documents and tokens per second."""
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values['documents_per_second'] = self.documents / self.seconds if self.seconds else 0.0
+        values['tokens_per_second'] = self.tokens_out / self.seconds if self.seconds else 0.0
+        return values
+
+
+class Profiler:
+    """Wall time, calls, throughput, and input and output sizes of each stage of a pipeline, see ``Compose``.
+
+    The sizes are the length of the ``cleaned`` text and the number of tokens of the documents, before and after
+    the stage.
+    """
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, StageStats] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def measure(docs: List[Union[Document, FastDocument]]) -> Tuple[int, int]:
+        """Total length of the ``cleaned`` text, and number of tokens, of the documents."""
+        chars = sum(len(doc.cleaned) for doc in docs)
+        tokens = sum(len(doc.tokens) for doc in docs if doc.tokens is not None)
+        return chars, tokens
+
+    def record(self, name: str, docs: List[Union[Document, FastDocument]], seconds: float,
+               before: Tuple[int, int]) -> None:
+        """Record a call of a stage.
+
+        Args:
+            name (str): Name of the stage, its step.
+            docs (List[Union[Document, FastDocument]]): Documents processed by the call.
+            seconds (float): Wall time of the call.
+            before (Tuple[int, int]): Size of the documents before the call, see ``measure``.
+        """
+        chars, tokens = self.measure(docs)
+        with self._lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats(name)
+
+            stats.calls += 1
+            stats.documents += len(docs)
+            stats.seconds += seconds
+            stats.chars_in += before[0]
+            stats.tokens_in += before[1]
+            stats.chars_out += chars
+            stats.tokens_out += tokens
+
+    def report(self) -> dict:
+        """Statistics of each stage, in the order they were first called, and the total time."""
+        with self._lock:
+            stages = [stats.dict() for stats in self.stages.values()]
+
+        return {'stages': stages, 'seconds': sum(stats['seconds'] for stats in stages)}
+
+    def clear(self) -> None:
+        """Remove the statistics of every stage."""
+        with self._lock:
+            self.stages.clear()
@@ -0,0 +1,172 @@
+"""Transformer Registry Module."""
+import ast
+from importlib import import_module
+from threading import Lock
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple
+)
+
+from nlpiper.core.cache import LRUCache
+from nlpiper.logger import log
+from nlpiper.transformers.base import BaseTransformer
+
+# Modules of the built-in transformers and their names, None for the names in `__all__`. They are imported on
+# the first lookup of a transformer, not when the registry is imported.
+_BUILTINS: Tuple[Tuple[str, Optional[Tuple[str, ...]]], ...] = (
+    ('nlpiper.transformers.cleaners', None),
+    ('nlpiper.transformers.tokenizers', None),
+    ('nlpiper.transformers.normalizers', None),
+    ('nlpiper.transformers.embeddings', None),
+    ('nlpiper.core.parallel', ('Threaded',)),
+)
+
+# Transformer classes by name, the names that can be used in the steps.
+TRANSFORMERS: Dict[str, type] = {}
+_builtins_loaded = False
+
+# Maximum number of transformers shared by the whole process, the least recently created or used are released.
+MAX_TRANSFORMERS = 32
+
+# Transformers already built, shared by the whole process, keyed by their class and normalized arguments.
+_instances = LRUCache(MAX_TRANSFORMERS)
+_lock = Lock()
+
+
+def register(cls: type) -> type:
+    """Register a transformer class, so it can be created from its steps, e.g. by ``Compose.create_from_steps``.
+
+    It can be used as a class decorator.
+
+    Args:
+        cls (type): Transformer class, registered with its name.
+
+    Returns: type
+    """
+    if not (isinstance(cls, type) and issubclass(cls, BaseTransformer)):
+        raise TypeError("Only transformer classes can be registered")
+
+    TRANSFORMERS[cls.__name__] = cls
+    return cls
+
+
+def create_transformer(step: str, cached: bool = True) -> BaseTransformer:
+    """Create the transformer of a step, e.g. ``"CaseTokens(mode='lower')"``.
+
+    The step is parsed, not evaluated, so it can only be a call of a registered transformer with literal
+    arguments or other transformers as arguments.
+
+    Args:
+        step (str): Step of the transformer, as recorded in the documents.
+        cached (bool): If True the transformer is shared with the previous calls with the same class and
+            arguments, even when they are written differently, e.g. ``CaseTokens()`` and ``CaseTokens('lower')``.
+            Only the ``MAX_TRANSFORMERS`` most recently used transformers are kept, see ``set_max_transformers``.
+            Otherwise a new transformer is created.
+
+    Returns: BaseTransformer
+
+    Raises:
+        NameError: When the step is not a call of a registered transformer.
+        ValueError: When the step can not be parsed.
+    """
+    try:
+        node = ast.parse(step.strip(), mode='eval').body
+    except SyntaxError as e:
+        raise ValueError(f"Invalid step: {step}") from e
+
+    return _build(node, step, cached)
+
+
+def clear_transformers() -> None:
+    """Remove the transformers shared by ``create_transformer``, releasing them once no pipeline uses them."""
+    with _lock:
+        _instances.clear()
+
+
+def set_max_transformers(maxsize: int) -> None:
+    """Set the maximum number of transformers shared by ``create_transformer``, removing the shared ones.
+
+    Args:
+        maxsize (int): Maximum number of transformers kept, by default ``MAX_TRANSFORMERS``.
+    """
+    global _instances
+
+    with _lock:
+        _instances = LRUCache(maxsize)
+
+
+def _lookup(name: str) -> Optional[type]:
+    global _builtins_loaded
+
+    cls = TRANSFORMERS.get(name)
+    if cls is None and not _builtins_loaded:
+        for module_name, names in _BUILTINS:
+            module = import_module(module_name)
+            for builtin in names or module.__all__:
+                # The classes registered by the user take precedence over the built-in ones.
+                TRANSFORMERS.setdefault(builtin, getattr(module, builtin))
+        _builtins_loaded = True
+        cls = TRANSFORMERS.get(name)
+
+    return cls
+
+
+def _build(node: ast.AST, step: str, cached: bool) -> BaseTransformer:
+    if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Name):
+        raise ValueError(f"Invalid step, it is not a transformer call: {step}")
+
+    name = node.func.id
+    cls = _lookup(name)
+    if cls is None:
+        raise NameError(f"name '{name}' is not defined")
+
+    if any(isinstance(arg, ast.Starred) for arg in node.args) or any(kw.arg is None for kw in node.keywords):
+        raise ValueError(f"Invalid step, unpacked arguments are not supported: {step}")
+
+    args = [_value(arg, step, cached) for arg in node.args]
+    kwargs = {kw.arg: _value(kw.value, step, cached) for kw in node.keywords}
+
+    if not cached:
+        return cls(*args, **kwargs)
+
+    key = name, _normalize(cls, args, kwargs)
+    with _lock:
+        transformer = _instances.get(key)
+
+    if transformer is None:
+        # Built outside the lock, two threads may build the same transformer, only the first one is kept.
+        transformer = cls(*args, **kwargs)
+        with _lock:
+            shared = _instances.get(key)
+            if shared is None:
+                _instances.put(key, transformer)
+            else:
+                transformer = shared
+        log.debug("[Registry] Cached %s", transformer)
+
+    return transformer
+
+
+def _value(node: ast.AST, step: str, cached: bool) -> Any:
+    if isinstance(node, ast.Call):
+        return _build(node, step, cached)
+
+    try:
+        return ast.literal_eval(node)
+    except ValueError as e:
+        raise ValueError(f"Invalid step, arguments must be literals or transformers: {step}") from e
+
+
+def _normalize(cls: type, args: list, kwargs: dict) -> str:
+    """Arguments of a constructor call bound to its parameters, with the defaults of the ones not given."""
+    import inspect
+
+    try:
+        bound = inspect.signature(cls).bind(*args, **kwargs)
+    except TypeError:
+        return repr((args, sorted(kwargs.items())))
+
+    bound.apply_defaults()
+    return repr(sorted(bound.arguments.items()))
@@ -0,0 +1,354 @@
+"""Symmetric Delete Spelling Index Module.
+
+Implements the symmetric delete algorithm of SymSpell: the words of a dictionary are indexed by the strings left
+after deleting up to ``max_distance`` of their characters, so the words close to a token are found by looking up
+the deletes of the token, instead of generating and checking every possible edit.
+
+The index is stored in a flat binary layout, which is memory mapped when loaded from a file, so the processes that
+load the same file share its pages and start without building it.
+"""
+import os
+import struct
+import zlib
+from array import array
+from bisect import bisect_left
+from threading import Lock
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union
+)
+
+from nlpiper.core.distance import levenshtein
+
+_MAGIC = b'NLPSYMS1'
+_BYTE_ORDER = 0x0102030405060708
+# Magic, byte order marker, max distance, prefix length, number of words, keys and postings, size of the words.
+_HEADER = struct.Struct('=8s7Q')
+
+
+def _hash(text: str) -> int:
+    """Hash of a string stable across processes, unlike ``hash``, two strings with the same hash share postings."""
+    data = text.encode('utf-8')
+    return zlib.crc32(data) << 32 | zlib.adler32(data)
+
+
+def _deletes(word: str, max_distance: int) -> List[List[str]]:
+    """The strings left after deleting up to ``max_distance`` characters of the word, by number of deletes."""
+    seen = {word}
+    levels = [[word]]
+    for _ in range(max_distance):
+        level = []
+        for text in levels[-1]:
+            for i in range(len(text)):
+                delete = text[:i] + text[i + 1:]
+                if delete not in seen:
+                    seen.add(delete)
+                    level.append(delete)
+        levels.append(level)
+
+    return levels
+
+
+def _padding(size: int) -> bytes:
+    return b'\0' * (-size % 8)
+
+
+class SymSpellIndex:
+    """Spelling index of a dictionary of words and their frequencies, looked up with the symmetric delete algorithm.
+
+    Example:
+        >>> index = SymSpellIndex.build({'word': 10, 'ward': 2}, max_distance=2)
+        >>> index.lookup('wrd')
+        'word'
+        >>> index.save('words.idx')
+        >>> index = SymSpellIndex.load('words.idx')  # memory mapped
+    """
+
+    def __init__(self, data: bytes, path: Optional[str] = None):
+        """Spelling index stored in ``data``, use ``build`` or ``load`` to create it.
+
+        Args:
+            data (bytes): Index in its binary layout, or the memory map of a file with it.
+            path (Optional[str]): File of the index, when it is memory mapped.
+        """
+        magic, order, max_distance, prefix_length, n_words, n_keys, n_postings, words_size = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("Invalid SymSpell index")
+        if order != _BYTE_ORDER:
+            raise ValueError("The SymSpell index was saved on a machine with a different byte order")
+
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.path = path
+        self._data = data
+
+        view = memoryview(data)
+        start = _HEADER.size
+        sections: List[memoryview] = []
+        for size, fmt in ((n_words + 1, 'Q'), (n_words, 'Q'), (n_keys, 'Q'), (n_keys + 1, 'Q'), (n_postings, 'I')):
+            end = start + size * struct.calcsize(fmt)
+            sections.append(view[start:end].cast(fmt))
+            start = end + len(_padding(end))
+
+        self._offsets, self._counts, self._keys, self._posting_offsets, self._postings = sections
+        self._words_start = start
+        self._size = n_words
+
+    @classmethod
+    def build(cls, words: Union[Dict[str, int], Iterable[Tuple[str, int]]], max_distance: int = 2,
+              prefix_length: int = 7) -> 'SymSpellIndex':
+        """Index a dictionary of words and their frequencies.
+
+        Args:
+            words (Union[Dict[str, int], Iterable[Tuple[str, int]]]): Frequency of each word, the frequencies of
+                repeated words are added.
+            max_distance (int): Maximum edit distance of the lookups, by default 2.
+            prefix_length (int): Only the deletes of the first ``prefix_length`` characters of the words are
+                indexed, which bounds the size of the index for long words, as in SymSpell, by default 7.
+
+        Returns: SymSpellIndex
+        """
+        if max_distance < 0:
+            raise ValueError("max_distance must be a non negative integer")
+        if prefix_length <= max_distance:
+            raise ValueError("prefix_length must be greater than max_distance")
+
+        frequencies: Dict[bytes, int] = {}
+        for word, count in (words.items() if isinstance(words, dict) else words):
+            key = word.encode('utf-8')
+            frequencies[key] = frequencies.get(key, 0) + count
+
+        encoded = sorted(frequencies)
+        offsets = array('Q', [0])
+        postings: Dict[int, List[int]] = {}
+        for word_id, word in enumerate(encoded):
+            offsets.append(offsets[-1] + len(word))
+            for level in _deletes(word.decode('utf-8')[:prefix_length], max_distance):
+                for delete in level:
+                    postings.setdefault(_hash(delete), []).append(word_id)
+
+        keys = array('Q', sorted(postings))
+        posting_offsets = array('Q', [0])
+        flat = array('I')
+        for key in keys:
+            flat.extend(postings[key])
+            posting_offsets.append(len(flat))
+
+        words_data = b''.join(encoded)
+        parts = [_HEADER.pack(_MAGIC, _BYTE_ORDER, max_distance, prefix_length, len(encoded), len(keys), len(flat),
+                              len(words_data))]
+        for section in (offsets, array('Q', (frequencies[word] for word in encoded)), keys, posting_offsets, flat):
+            data = section.tobytes()
+            parts.append(data + _padding(len(data)))
+        parts.append(words_data)
+
+        return cls(b''.join(parts))
+
+    @classmethod
+    def from_frequencies(cls, path: str, max_distance: int = 2, prefix_length: int = 7,
+                         encoding: str = 'utf-8') -> 'SymSpellIndex':
+        """Index a word frequency list, a word and optionally its frequency, separated by spaces, per line.
+
+        Args:
+            path (str): Path of the list.
+            max_distance (int): Maximum edit distance of the lookups, by default 2.
+            prefix_length (int): Length of the indexed prefixes of the words, see ``build``, by default 7.
+            encoding (str): Encoding of the file, by default utf-8.
+
+        Returns: SymSpellIndex
+        """
+        def read() -> Iterator[Tuple[str, int]]:
+            with open(path, encoding=encoding) as f:
+                for line in f:
+                    fields = line.split()
+                    if fields:
+                        yield fields[0], int(fields[1]) if len(fields) > 1 else 1
+
+        return cls.build(read(), max_distance, prefix_length)
+
+    def save(self, path: str) -> None:
+        """Save the index in a file, which can be memory mapped by ``load``.
+
+        Args:
+            path (str): Path of the file.
+        """
+        with open(path, 'wb') as f:
+            f.write(self._data)
+
+    @classmethod
+    def load(cls, path: str) -> 'SymSpellIndex':
+        """Memory map an index saved by ``save``.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns: SymSpellIndex
+        """
+        import mmap
+
+        with open(path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return cls(data, path=os.path.abspath(path))
+
+    @staticmethod
+    def is_index(path: str) -> bool:
+        """If the file is an index saved by ``save``, otherwise it is expected to be a word frequency list."""
+        with open(path, 'rb') as f:
+            return f.read(len(_MAGIC)) == _MAGIC
+
+    def _word(self, word_id: int) -> str:
+        start = self._words_start
+        return self._data[start + self._offsets[word_id]:start + self._offsets[word_id + 1]].decode('utf-8')
+
+    def _find(self, word: str) -> int:
+        """Id of a word, or -1 when it is not in the dictionary."""
+        key = word.encode('utf-8')
+        start = self._words_start
+        low, high = 0, self._size
+        while low < high:
+            middle = (low + high) // 2
+            value = self._data[start + self._offsets[middle]:start + self._offsets[middle + 1]]
+            if value < key:
+                low = middle + 1
+            elif value > key:
+                high = middle
+            else:
+                return middle
+
+        return -1
+
+    def _words_of(self, delete: str) -> Sequence[int]:
+        """Ids of the words with a delete, and of the words whose deletes have the same hash."""
+        key = _hash(delete)
+        i = bisect_left(self._keys, key)
+        if i == len(self._keys) or self._keys[i] != key:
+            return ()
+
+        return self._postings[self._posting_offsets[i]:self._posting_offsets[i + 1]]
+
+    def count(self, word: str) -> int:
+        """Frequency of a word, 0 when it is not in the dictionary."""
+        word_id = self._find(word)
+        return self._counts[word_id] if word_id >= 0 else 0
+
+    def spell(self, token: str) -> bool:
+        """If the token is a word of the dictionary."""
+        return self._find(token) >= 0
+
+    def lookup(self, token: str, max_distance: Optional[int] = None) -> Optional[str]:
+        """Word of the dictionary closest to the token, within ``max_distance``.
+
+        The ties are broken by the most frequent word, and then alphabetically.
+
+        Args:
+            token (str): Token to be looked up.
+            max_distance (Optional[int]): Maximum edit distance, at most the one of the index, by default the one
+                of the index.
+
+        Returns: Optional[str], None when no word is within ``max_distance``.
+        """
+        if max_distance is None:
+            max_distance = self.max_distance
+        elif max_distance > self.max_distance:
+            raise ValueError(f"max_distance must be at most {self.max_distance}, the one of the index")
+
+        return token if self.spell(token) else self._closest(token, max_distance)
+
+    def _closest(self, token: str, max_distance: int) -> Optional[str]:
+        # Distance, negated frequency and closest word, the sentinel is further than any word within max_distance.
+        best: Tuple[int, int, Optional[str]] = (max_distance + 1, 0, None)
+        seen: Set[int] = set()
+        for deletes, level in enumerate(_deletes(token[:self.prefix_length], max_distance)):
+            # A word at distance d shares a delete of at most d characters with the token, so once a word is found
+            # the deeper levels can not have a closer one.
+            if deletes > best[0]:
+                break
+
+            for delete in level:
+                for word_id in self._words_of(delete):
+                    if word_id in seen:
+                        continue
+                    seen.add(word_id)
+
+                    limit = min(best[0], max_distance)
+                    word = self._word(word_id)
+                    if abs(len(word) - len(token)) > limit:
+                        continue
+
+                    distance = levenshtein(token, word, limit)
+                    if distance <= limit and (distance, -self._counts[word_id], word) < best:
+                        best = (distance, -self._counts[word_id], word)
+
+        return best[2]
+
+    def __contains__(self, token: object) -> bool:
+        return isinstance(token, str) and self.spell(token)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._word(i) for i in range(self._size))
+
+    def __repr__(self) -> str:
+        return "%s(words=%d, max_distance=%d, prefix_length=%d)" % (
+            self.__class__.__name__, len(self), self.max_distance, self.prefix_length)
+
+    def __getstate__(self) -> dict:
+        # A memory mapped index is mapped again, e.g. by the worker processes, instead of being copied.
+        return {'path': self.path} if self.path else {'data': bytes(self._data)}
+
+    def __setstate__(self, state: dict) -> None:
+        if state.get('path'):
+            self.__dict__.update(self.load(state['path']).__dict__)
+        else:
+            self.__init__(state['data'])  # type: ignore[misc]
+
+
+# Indexes shared by the whole process, see `load_index`.
+_shared: Dict[Hashable, SymSpellIndex] = {}
+_lock = Lock()
+
+
+def load_index(path: str, max_distance: int = 2, prefix_length: int = 7) -> SymSpellIndex:
+    """Index of a file, loaded once and shared by the whole process, and loaded again when the file changes.
+
+    Args:
+        path (str): Index saved by ``SymSpellIndex.save``, which is memory mapped, or a word frequency list, see
+            ``SymSpellIndex.from_frequencies``.
+        max_distance (int): Maximum edit distance of the index built from a word frequency list, by default 2.
+        prefix_length (int): Length of the indexed prefixes of the index built from a word frequency list,
+            by default 7.
+
+    Returns: SymSpellIndex
+    """
+    path = os.path.abspath(path)
+    is_index = SymSpellIndex.is_index(path)
+    key = (path, os.stat(path).st_mtime_ns) + (() if is_index else (max_distance, prefix_length))
+    with _lock:
+        index = _shared.get(key)
+
+    if index is None:
+        if is_index:
+            index = SymSpellIndex.load(path)
+        else:
+            index = SymSpellIndex.from_frequencies(path, max_distance, prefix_length)
+        with _lock:
+            index = _shared.setdefault(key, index)
+
+    return index
+
+
+def clear_indexes() -> None:
+    """Remove the indexes shared by the whole process."""
+    with _lock:
+        _shared.clear()
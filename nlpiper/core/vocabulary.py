@@ -0,0 +1,193 @@
+"""Vocabulary Index Module."""
+import os
+from array import array
+from threading import Lock
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    Union
+)
+
+
+class Vocabulary:
+    """Index of the words of a vocabulary, for fast membership tests of tokens.
+
+    The words are indexed in a ``frozenset``, or in a ``SortedIndex``, which takes a fraction of the memory of a set
+    with lookups in logarithmic time, for the large vocabulary files, by default from ``COMPACT_SIZE`` words.
+    Case insensitive vocabularies are lowercased once, when they are indexed, and the result of looking up each
+    token lowercased is memoized, so each distinct token is only lowercased once.
+
+    Example:
+        >>> vocabulary = Vocabulary(['This', 'is'], case_sensitive=False)
+        >>> 'THIS' in vocabulary
+        True
+    """
+
+    COMPACT_SIZE = 100_000
+    # Maximum number of memoized lookups of a case insensitive vocabulary, the memo is cleared when it is full.
+    MEMO_SIZE = 100_000
+
+    def __init__(self, words: Iterable[str], case_sensitive: bool = True, compact: bool = False):
+        """Index of the words of a vocabulary.
+
+        Args:
+            words (Iterable[str]): Words of the vocabulary.
+            case_sensitive (bool): If False the tokens are looked up lowercased, by default True.
+            compact (bool): If True the words are indexed in a ``SortedIndex``, otherwise in a ``frozenset``,
+                by default False.
+        """
+        self.case_sensitive = case_sensitive
+        unique = set(words) if case_sensitive else {word.lower() for word in words}
+        self.index = SortedIndex(unique) if compact else frozenset(unique)
+        self._lookups = None if case_sensitive else _Lookups(self.index, self.MEMO_SIZE)
+
+    @classmethod
+    def from_file(cls, path: str, case_sensitive: bool = True, compact: Optional[bool] = None,
+                  encoding: str = 'utf-8') -> 'Vocabulary':
+        """Index the words of a file, one word per line, the empty lines are ignored.
+
+        Args:
+            path (str): Path of the file.
+            case_sensitive (bool): If False the tokens are looked up lowercased, by default True.
+            compact (Optional[bool]): If True the words are indexed in a ``SortedIndex``, if False in a
+                ``frozenset``, by default in a ``SortedIndex`` from ``COMPACT_SIZE`` words.
+            encoding (str): Encoding of the file, by default utf-8.
+
+        Returns: Vocabulary
+        """
+        with open(path, encoding=encoding) as f:
+            words = {word for word in (line.strip() for line in f) if word}
+
+        if compact is None:
+            compact = len(words) >= cls.COMPACT_SIZE
+
+        return cls(words, case_sensitive, compact)
+
+    def __contains__(self, token: str) -> bool:
+        return token in self.index if self._lookups is None else self._lookups[token]
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __repr__(self) -> str:
+        return "%s(words=%d, case_sensitive=%r, index=%s)" % (
+            self.__class__.__name__, len(self), self.case_sensitive, type(self.index).__name__)
+
+
+class _Lookups(dict):
+    """Memo of the lookups of the tokens lowercased, each token is lowercased the first time it is looked up."""
+
+    def __init__(self, index: Union[frozenset, 'SortedIndex'], size: int):
+        super().__init__()
+        self.index = index
+        self.size = size
+
+    def __missing__(self, token: str) -> bool:
+        found = token.lower() in self.index
+        if len(self) >= self.size:
+            self.clear()
+        self[token] = found
+        return found
+
+
+class SortedIndex:
+    """Compact set of strings, stored sorted in a single UTF-8 buffer and looked up by binary search.
+
+    The words take their UTF-8 size plus 8 bytes each, instead of a string object and a hash table slot per word.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        """Compact set of strings.
+
+        Args:
+            words (Iterable[str]): Words of the set.
+        """
+        encoded = sorted({word.encode('utf-8') for word in words})
+        self.data = b''.join(encoded)
+        self.offsets = array('Q', [0])
+        for word in encoded:
+            self.offsets.append(self.offsets[-1] + len(word))
+
+    def _word(self, i: int) -> bytes:
+        return self.data[self.offsets[i]:self.offsets[i + 1]]
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+
+        key = word.encode('utf-8')
+        # UTF-8 bytes sort in the same order as the code points of the strings.
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            value = self._word(middle)
+            if value < key:
+                low = middle + 1
+            elif value > key:
+                high = middle
+            else:
+                return True
+
+        return False
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._word(i).decode('utf-8') for i in range(len(self)))
+
+
+# Vocabularies shared by the whole process, see `shared`.
+_shared: Dict[Hashable, Vocabulary] = {}
+_lock = Lock()
+
+
+def shared(key: Hashable, factory: Callable[[], Vocabulary]) -> Vocabulary:
+    """Vocabulary shared by the whole process, created by ``factory`` the first time its key is used.
+
+    Args:
+        key (Hashable): Key of the vocabulary.
+        factory (Callable[[], Vocabulary]): Creates the vocabulary.
+
+    Returns: Vocabulary
+    """
+    with _lock:
+        vocabulary = _shared.get(key)
+
+    if vocabulary is None:
+        vocabulary = factory()
+        with _lock:
+            vocabulary = _shared.setdefault(key, vocabulary)
+
+    return vocabulary
+
+
+def load_vocabulary(path: str, case_sensitive: bool = True, compact: Optional[bool] = None) -> Vocabulary:
+    """Vocabulary of a file, see ``Vocabulary.from_file``, indexed once and shared by the whole process.
+
+    The file is indexed again when it changes.
+
+    Args:
+        path (str): Path of the file, one word per line.
+        case_sensitive (bool): If False the tokens are looked up lowercased, by default True.
+        compact (Optional[bool]): If True the words are indexed in a ``SortedIndex``, if False in a ``frozenset``,
+            by default it depends on the number of words.
+
+    Returns: Vocabulary
+    """
+    path = os.path.abspath(path)
+    key = ('file', path, os.stat(path).st_mtime_ns, case_sensitive, compact)
+    return shared(key, lambda: Vocabulary.from_file(path, case_sensitive, compact))
+
+
+def clear_vocabularies() -> None:
+    """Remove the vocabularies shared by the whole process."""
+    with _lock:
+        _shared.clear()
@@ -1,3 +1,16 @@
 """Transformers Module."""
+from importlib import import_module
 
-from nlpiper.transformers import cleaners, tokenizers, normalizers, embeddings
+# The transformer modules are imported on first use, e.g. `nlpiper.transformers.tokenizers`.
+_MODULES = ('cleaners', 'tokenizers', 'normalizers', 'embeddings')
+
+
+def __getattr__(name: str):
+    if name in _MODULES:
+        return import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_MODULES))
@@ -1,8 +1,10 @@
 """Base Transformer Module."""
 
 from enum import Enum, auto
+from functools import wraps
+from typing import Callable, List, Optional, Tuple
 
-from nlpiper.core import Document
+from nlpiper.core.document import Document, FastDocument
 from nlpiper.logger import log
 
 
@@ -12,7 +14,20 @@ class BaseTransformer:
     def __init__(self, *args, **kwargs):
         self.args = args
         self.kwargs = kwargs
-        log.info("[Created] %s", repr(self))
+        log.info("[Created] %s", self)
+
+    @property
+    def step(self) -> str:
+        """Step registered in the processed documents, the representation of the transformer.
+
+        It is computed once, on first use, and the same string is shared by the steps of all the documents,
+        which keeps large representations, e.g. the vocabulary of ``VocabularyFilter``, stored only once.
+        """
+        step = self.__dict__.get('_step')
+        if step is None:
+            step = self._step = repr(self)
+
+        return step
 
     def __repr__(self) -> str:
         """Create a string representation including init params."""
@@ -25,6 +40,61 @@ class BaseTransformer:
     def __call__(self, doc: Document, inplace: bool = False) -> Document:
         raise NotImplementedError
 
+    def batch(self, docs: List[Document]) -> None:
+        """Process a batch of documents inplace.
+
+        By default each document is processed on its own, transformers can override this method to amortize
+        the per-call overhead across the whole batch.
+
+        Args:
+            docs (List[Document]): Documents to be processed, they are changed inplace.
+        """
+        for doc in docs:
+            self(doc, True)
+
+
+class BaseCleaner(BaseTransformer):
+    """Base class to the Cleaners that transform the document text on its own.
+
+    Cleaning a text is done by ``_clean``, which allows consecutive cleaners to be fused in a single stage,
+    see ``Compose.compile``.
+    """
+
+    # True when the cleaner maps each character on its own, regardless of its neighbours, which allows
+    # consecutive character wise cleaners to be fused in a single `str.translate`.
+    character_wise: bool = False
+
+    def _clean(self, text: str) -> str:
+        """Clean a text.
+
+        Args:
+            text (str): Text to be cleaned.
+
+        Returns: str
+        """
+        raise NotImplementedError
+
+
+class BaseNormalizer(BaseTransformer):
+    """Base class to the Normalizers that transform each token on its own.
+
+    Normalizing a token is done by ``_normalize``, which allows the token strings to be processed column-wise,
+    e.g. by ``DocumentBatch``.
+    """
+
+    # Token fields assigned with the normalized token.
+    token_fields: Tuple[str, ...] = ('cleaned', )
+
+    def _normalize(self, token: str) -> str:
+        """Normalize a token string.
+
+        Args:
+            token (str): Token to be normalized.
+
+        Returns: str
+        """
+        raise NotImplementedError
+
 
 class TransformersType(Enum):
     CLEANERS = auto()
@@ -40,45 +110,179 @@ def validate(transformer_type: TransformersType):
     Validations:
     - The 'doc' argument must be an instance of Document class.
     - Cleaners can not be called for document with tokens.
+
+    The transformer type is kept in the ``transformer_type`` attribute of the decorated method, which allows
+    ``Compose`` to validate a pipeline once and call the undecorated method, see ``unchecked_call``.
     """
     def inner_validate(func):
+        @wraps(func)
         def wrapper(*args, **kwargs):
-            doc: Document = args[1]
-            if not isinstance(doc, Document):
-                raise TypeError("Argument doc is not of type Document")
-
-            if transformer_type in (TransformersType.CLEANERS, TransformersType.TOKENIZERS):
-                if doc.tokens is not None:
-                    raise RuntimeError(
-                        f"{transformer_type.name.title()} transformer can not be applied on documents with tokens"
-                    )
-            elif transformer_type in (TransformersType.NORMALIZERS, TransformersType.EMBEDDINGS):
-                if doc.tokens is None:
-                    raise RuntimeError(
-                        f"{transformer_type.name.title()} transformer can not be applied on documents without tokens"
-                    )
-                elif doc.embedded is not None:
-                    raise RuntimeError(
-                        f"{transformer_type.name.title()} transformer can not be applied on documents with embeddings"
-                    )
-            else:
-                raise RuntimeError("TransformerType behavior not implemented")
+            _validate_document(args[1], transformer_type)
+            return func(*args, **kwargs)
+        wrapper.transformer_type = transformer_type
+        return wrapper
+    return inner_validate
+
+
+def validate_batch(transformer_type: TransformersType):
+    """Validate a batch transformation call.
 
+    Applies the same validations of :func:`validate` to every document of the batch.
+    """
+    def inner_validate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            for doc in args[1]:
+                _validate_document(doc, transformer_type)
             return func(*args, **kwargs)
+        wrapper.transformer_type = transformer_type
         return wrapper
     return inner_validate
 
 
+def _validate_document(doc: Document, transformer_type: TransformersType) -> None:
+    if not isinstance(doc, (Document, FastDocument)):
+        raise TypeError("Argument doc is not of type Document")
+
+    check_state(transformer_type, doc.tokens is not None, doc.embedded is not None)
+
+
+def check_state(transformer_type: TransformersType, tokens: bool, embedded: bool) -> None:
+    """Check if a transformer can be applied on a document with or without tokens and embeddings.
+
+    Args:
+        transformer_type (TransformersType): Type of the transformer.
+        tokens (bool): If the document has tokens.
+        embedded (bool): If the document has embeddings.
+    """
+    if transformer_type in (TransformersType.CLEANERS, TransformersType.TOKENIZERS):
+        if tokens:
+            raise RuntimeError(
+                f"{transformer_type.name.title()} transformer can not be applied on documents with tokens"
+            )
+    elif transformer_type in (TransformersType.NORMALIZERS, TransformersType.EMBEDDINGS):
+        if not tokens:
+            raise RuntimeError(
+                f"{transformer_type.name.title()} transformer can not be applied on documents without tokens"
+            )
+        elif embedded:
+            raise RuntimeError(
+                f"{transformer_type.name.title()} transformer can not be applied on documents with embeddings"
+            )
+    else:
+        raise RuntimeError("TransformerType behavior not implemented")
+
+
 def add_step(func):
     """Register a transformation into the document object."""
 
+    @wraps(func)
     def wrapper(*args, **kwargs):
         out = func(*args, **kwargs)
         if out is None:
-            args[1].steps.append(repr(args[0]))
+            args[1].steps.append(args[0].step)
         else:
-            out.steps.append(repr(args[0]))
+            out.steps.append(args[0].step)
 
         return out
 
+    wrapper.adds_step = True
     return wrapper
+
+
+def add_batch_step(func):
+    """Register a batch transformation into every document of the batch."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        out = func(*args, **kwargs)
+        step = args[0].step
+        for doc in args[1]:
+            doc.steps.append(step)
+
+        return out
+
+    wrapper.adds_step = True
+    return wrapper
+
+
+def get_transformer_type(transformer: BaseTransformer) -> Optional[TransformersType]:
+    """Type of a transformer, None when its call is not validated with :func:`validate`."""
+    return getattr(type(transformer).__call__, 'transformer_type', None)
+
+
+def unchecked_call(transformer: BaseTransformer) -> Optional[Callable[[Document], None]]:
+    """Transformer call without the validations, which processes a document inplace and registers its step.
+
+    Only to be used when the document is known to be valid, e.g. by ``Compose``, which validates the pipeline once.
+
+    Args:
+        transformer (BaseTransformer): Transformer to be called.
+
+    Returns: Optional[Callable[[Document], None]], None when the call is not validated with :func:`validate`.
+    """
+    return _unchecked(type(transformer).__call__, transformer, batch=False)
+
+
+def unchecked_batch(transformer: BaseTransformer) -> Optional[Callable[[List[Document]], None]]:
+    """Transformer batch without the validations, which processes the documents inplace and registers its step.
+
+    Args:
+        transformer (BaseTransformer): Transformer to be called.
+
+    Returns: Optional[Callable[[List[Document]], None]], None when the batch is not validated.
+    """
+    if type(transformer).batch is BaseTransformer.batch:
+        call = unchecked_call(transformer)
+        return None if call is None else _EachDocument(call)
+
+    return _unchecked(type(transformer).batch, transformer, batch=True)
+
+
+def _unchecked(method: Callable, transformer: BaseTransformer, batch: bool) -> Optional[Callable]:
+    if getattr(method, 'transformer_type', None) is None:
+        return None
+
+    return _Unchecked(transformer, batch)
+
+
+class _Unchecked:
+    """Undecorated call, or batch, of a transformer, which registers its step.
+
+    Unlike a closure it can be pickled, with the pipelines holding it, and it looks the method up again by name
+    when unpickled.
+    """
+
+    def __init__(self, transformer: BaseTransformer, batch: bool):
+        self.transformer = transformer
+        self.batch = batch
+
+        body = getattr(type(transformer), 'batch' if batch else '__call__').__wrapped__
+        # Without `adds_step` the body registers its steps, e.g. the fused stages of a compiled pipeline.
+        self.step = transformer.step if getattr(body, 'adds_step', False) else None
+        self.body = body if self.step is None else body.__wrapped__
+
+    def __call__(self, arg) -> None:
+        if self.batch:
+            self.body(self.transformer, arg)
+            if self.step is not None:
+                for doc in arg:
+                    doc.steps.append(self.step)
+        else:
+            self.body(self.transformer, arg, inplace=True)
+            if self.step is not None:
+                arg.steps.append(self.step)
+
+    def __reduce__(self):
+        return self.__class__, (self.transformer, self.batch)
+
+
+class _EachDocument:
+    """Batch of a transformer without its own ``batch``, which calls it on each document."""
+
+    def __init__(self, call: Callable[[Document], None]):
+        self.call = call
+
+    def __call__(self, docs: List[Document]) -> None:
+        for doc in docs:
+            self.call(doc)
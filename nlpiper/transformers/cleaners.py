@@ -7,7 +7,7 @@ from unicodedata import normalize, combining
 
 from nlpiper.core import Document
 from nlpiper.transformers.base import (
-    BaseTransformer,
+    BaseCleaner,
     TransformersType,
     add_step,
     validate
@@ -25,8 +25,14 @@ __all__ = [
     "CleanURL",
 ]
 
+_URL_PATTERNS = (re.compile(r"http\S+"), re.compile(r"www\S+"))
+_EMAIL_PATTERN = re.compile(r"[a-z0-9\.\-+_]+@[a-z0-9\.\-+_]+\.[a-z]+")
+_NUMBER_PATTERN = re.compile(r'[0-9]+')
+_PUNCTUATION_TABLE = str.maketrans('', '', punctuation)
+_EOF_TABLE = str.maketrans('\n', ' ')
 
-class CleanURL(BaseTransformer):
+
+class CleanURL(BaseCleaner):
     """Remove URLs from a document.
 
     Callable arguments:
@@ -61,13 +67,18 @@ class CleanURL(BaseTransformer):
         """
         d = doc if inplace else doc._deepcopy()
 
-        d.cleaned = re.sub(r"http\S+", "", d.cleaned)
-        d.cleaned = re.sub(r"www\S+", "", d.cleaned)
+        d.cleaned = self._clean(d.cleaned)
 
         return None if inplace else d
 
+    def _clean(self, text: str) -> str:
+        for pattern in _URL_PATTERNS:
+            text = pattern.sub("", text)
+
+        return text
 
-class CleanEmail(BaseTransformer):
+
+class CleanEmail(BaseCleaner):
     """Remove emails from a document.
 
     Callable arguments:
@@ -103,12 +114,15 @@ class CleanEmail(BaseTransformer):
         """
         d = doc if inplace else doc._deepcopy()
 
-        d.cleaned = re.sub(r"[a-z0-9\.\-+_]+@[a-z0-9\.\-+_]+\.[a-z]+", "", d.cleaned)
+        d.cleaned = self._clean(d.cleaned)
 
         return None if inplace else d
 
+    def _clean(self, text: str) -> str:
+        return _EMAIL_PATTERN.sub("", text)
+
 
-class CleanNumber(BaseTransformer):
+class CleanNumber(BaseCleaner):
     """Remove numbers from a document.
 
     Callable arguments:
@@ -129,6 +143,8 @@ class CleanNumber(BaseTransformer):
         "Number "
     """
 
+    character_wise = True
+
     @validate(TransformersType.CLEANERS)
     @add_step
     def __call__(self, doc: Document, inplace: bool = False) -> Optional[Document]:
@@ -143,12 +159,15 @@ class CleanNumber(BaseTransformer):
         """
         d = doc if inplace else doc._deepcopy()
 
-        d.cleaned = re.sub(r'[0-9]+', '', d.cleaned)
+        d.cleaned = self._clean(d.cleaned)
 
         return None if inplace else d
 
+    def _clean(self, text: str) -> str:
+        return _NUMBER_PATTERN.sub('', text)
+
 
-class CleanPunctuation(BaseTransformer):
+class CleanPunctuation(BaseCleaner):
     """Remove punctuation from a document.
 
     Callable arguments:
@@ -169,6 +188,8 @@ class CleanPunctuation(BaseTransformer):
         "Document without punctuation"
     """
 
+    character_wise = True
+
     @validate(TransformersType.CLEANERS)
     @add_step
     def __call__(self, doc: Document, inplace: bool = False) -> Optional[Document]:
@@ -183,12 +204,15 @@ class CleanPunctuation(BaseTransformer):
         """
         d = doc if inplace else doc._deepcopy()
 
-        d.cleaned = d.cleaned.translate(str.maketrans('', '', punctuation))
+        d.cleaned = self._clean(d.cleaned)
 
         return None if inplace else d
 
+    def _clean(self, text: str) -> str:
+        return text.translate(_PUNCTUATION_TABLE)
 
-class CleanEOF(BaseTransformer):
+
+class CleanEOF(BaseCleaner):
     """Remove end of line from a document.
 
     Callable arguments:
@@ -209,6 +233,8 @@ class CleanEOF(BaseTransformer):
         "Line 1 Line 2"
     """
 
+    character_wise = True
+
     @validate(TransformersType.CLEANERS)
     @add_step
     def __call__(self, doc: Document, inplace: bool = False) -> Optional[Document]:
@@ -223,12 +249,15 @@ class CleanEOF(BaseTransformer):
         """
         d = doc if inplace else doc._deepcopy()
 
-        d.cleaned = d.cleaned.translate(str.maketrans('\n', ' '))
+        d.cleaned = self._clean(d.cleaned)
 
         return None if inplace else d
 
+    def _clean(self, text: str) -> str:
+        return text.translate(_EOF_TABLE)
+
 
-class CleanMarkup(BaseTransformer):
+class CleanMarkup(BaseCleaner):
     """Remove HTML and XML from a document using BeautifulSoup4 package.
 
     Callable arguments:
@@ -289,12 +318,15 @@ class CleanMarkup(BaseTransformer):
         """
         d = doc if inplace else doc._deepcopy()
 
-        d.cleaned = self.c(d.cleaned, features=self.features, *self.args, **self.kwargs).get_text(" ")
+        d.cleaned = self._clean(d.cleaned)
 
         return None if inplace else d
 
+    def _clean(self, text: str) -> str:
+        return self.c(text, features=self.features, *self.args, **self.kwargs).get_text(" ")
 
-class CleanAccents(BaseTransformer):
+
+class CleanAccents(BaseCleaner):
     """Strip accents and perform character normalization from a document.
 
     Callable arguments:
@@ -315,6 +347,8 @@ class CleanAccents(BaseTransformer):
         "This is a test"
     """
 
+    character_wise = True
+
     def __init__(self, mode: str = "unicode"):
         """Strip accents and perform character normalization from a document.
 
@@ -345,11 +379,13 @@ class CleanAccents(BaseTransformer):
         """
         d = doc if inplace else doc._deepcopy()
 
-        d.cleaned = (self._strip_accents_unicode(d.cleaned) if self.mode == 'unicode'
-                     else self._strip_accents_ascii(d.cleaned))
+        d.cleaned = self._clean(d.cleaned)
 
         return None if inplace else d
 
+    def _clean(self, text: str) -> str:
+        return self._strip_accents_unicode(text) if self.mode == 'unicode' else self._strip_accents_ascii(text)
+
     @staticmethod
     def _strip_accents_unicode(text):
         """Strip accents using unicode method.
@@ -1,13 +1,16 @@
 """Embeddings Module."""
 
-from typing import Any, Optional
+from bisect import bisect_right
+from typing import Any, List, Optional
 
 from nlpiper.core.document import Document
 from nlpiper.transformers.base import (
     BaseTransformer,
     TransformersType,
+    add_batch_step,
     add_step,
-    validate
+    validate,
+    validate_batch
 )
 from nlpiper.logger import log
 
@@ -19,6 +22,9 @@ __all__ = [
 class GensimEmbeddings(BaseTransformer):
     """Gensim Embedding extraction."""
 
+    # Maximum number of token vectors gathered at once to pool the documents of a batch.
+    CHUNK_SIZE = 16384
+
     def __init__(self, keyed_vectors: Any, apply_doc: str = 'mean'):
         """Stem tokens.
 
@@ -68,13 +74,125 @@ class GensimEmbeddings(BaseTransformer):
         """
         d = doc if inplace else doc._deepcopy()
 
-        for token in d.tokens:
-            try:
-                token.embedded = self.keyed_vectors[token.cleaned]
-            except KeyError:
-                token.embedded = self.np.zeros(self.keyed_vectors.vector_size, dtype=self.np.float32)
-
-        d.embedded = (getattr(self.np, self.apply_doc)([token.embedded for token in d.tokens], axis=0)
-                      if len(d.tokens) != 0 else self.np.zeros(self.keyed_vectors.vector_size))
+        self._embed([d])
 
         return None if inplace else d
+
+    @validate_batch(TransformersType.EMBEDDINGS)
+    @add_batch_step
+    def batch(self, docs: List[Document]) -> None:
+        """Gensim Embedding extraction of a batch of documents inplace, all their tokens are embedded at once.
+
+        Args:
+            docs (List[Document]): Documents to be embedded.
+        """
+        self._embed(docs)
+
+    def _embed(self, docs: List[Document]) -> None:
+        tokens: List[str] = []
+        offsets = [0]
+        for d in docs:
+            tokens.extend(token.cleaned for token in d.tokens)
+            offsets.append(len(tokens))
+
+        rows = self._rows(tokens)
+        embedded = self._pool(rows, offsets)
+
+        # The tokens share the rows of the model, and the out of vocabulary ones a single zero row, as the rows
+        # returned by `KeyedVectors`.
+        vectors = self.keyed_vectors.vectors
+        zeros = self._zeros()
+        token_rows = rows.tolist()
+        for i, d in enumerate(docs):
+            for token, row in zip(d.tokens, token_rows[offsets[i]:offsets[i + 1]]):
+                token.embedded = vectors[row] if row >= 0 else zeros
+
+            # A copy, so a document kept after its batch does not keep the pooled matrix of the whole batch alive.
+            d.embedded = embedded[i].copy() if d.tokens else self.np.zeros(self.keyed_vectors.vector_size)
+
+    def _zeros(self) -> Any:
+        zeros = self.__dict__.get('_zero_row')
+        if zeros is None:
+            model = self.keyed_vectors
+            zeros = self._zero_row = self.np.zeros(model.vector_size, dtype=model.vectors.dtype)
+            zeros.flags.writeable = False
+
+        return zeros
+
+    def _rows(self, tokens: List[str]) -> Any:
+        """Rows of the tokens in the vectors of the model, mapped in a single pass, -1 for out of vocabulary tokens.
+
+        Args:
+            tokens (List[str]): Tokens to be embedded.
+
+        Returns: numpy.ndarray
+        """
+        index = self.keyed_vectors.key_to_index.get
+        return self.np.fromiter((index(token, -1) for token in tokens), dtype=self.np.intp, count=len(tokens))
+
+    def _gather(self, rows: Any) -> Any:
+        """Vectors of the rows, gathered by a single indexing, zeros for out of vocabulary tokens."""
+        np = self.np
+        model = self.keyed_vectors
+        if not model.key_to_index:
+            return np.zeros((len(rows), model.vector_size), dtype=model.vectors.dtype)
+
+        unknown = rows < 0
+        vectors = model.vectors[np.where(unknown, 0, rows)]
+        vectors[unknown] = 0
+        return vectors
+
+    def _pool(self, rows: Any, offsets: List[int]) -> Any:
+        """Embeddings of the documents from the rows of their tokens, gathered by chunks of documents.
+
+        The chunks keep the gathered vectors of a large batch from taking as much memory as the token embeddings.
+        """
+        np = self.np
+        embedded = np.zeros((len(offsets) - 1, self.keyed_vectors.vector_size), dtype=self.keyed_vectors.vectors.dtype)
+        first = 0
+        while first < len(offsets) - 1:
+            # At least one document per chunk, however many tokens it has.
+            last = max(bisect_right(offsets, offsets[first] + self.CHUNK_SIZE) - 1, first + 1)
+            start, end = offsets[first], offsets[last]
+            chunk = [offset - start for offset in offsets[first:last + 1]]
+            embedded[first:last] = self._embed_documents(self._gather(rows[start:end]), chunk)
+            first = last
+
+        return embedded
+
+    def _embed_tokens(self, tokens: List[str]) -> Any:
+        """Embeddings of a list of tokens, one row per token, the out of vocabulary tokens are zeros.
+
+        Args:
+            tokens (List[str]): Tokens to be embedded.
+
+        Returns: numpy.ndarray
+        """
+        return self._gather(self._rows(tokens))
+
+    def _embed_documents(self, vectors: Any, offsets: List[int]) -> Any:
+        """Embeddings of the documents, one row per document, from the embeddings of their tokens.
+
+        The tokens of all the documents are pooled at once with ``numpy.add.reduceat``, the documents without tokens
+        are zeros.
+
+        Args:
+            vectors (numpy.ndarray): Embeddings of the tokens of all the documents.
+            offsets (List[int]): The tokens of the document `i` are in `offsets[i]:offsets[i + 1]`.
+
+        Returns: numpy.ndarray
+        """
+        np = self.np
+        bounds = np.asarray(offsets, dtype=np.intp)
+        lengths = np.diff(bounds)
+        embedded = np.zeros((len(lengths), self.keyed_vectors.vector_size), dtype=vectors.dtype)
+
+        # `reduceat` sums each start up to the next one, so the empty documents, whose start is the one of the next
+        # document, are left out.
+        filled = lengths > 0
+        if filled.any():
+            embedded[filled] = np.add.reduceat(vectors, bounds[:-1][filled], axis=0)
+            if self.apply_doc == 'mean':
+                embedded[filled] /= lengths[filled, None]
+
+        return embedded
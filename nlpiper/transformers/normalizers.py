@@ -1,14 +1,20 @@
 """Normalizer Module."""
 
 from string import punctuation
+from threading import Lock
 from typing import (
+    Dict,
+    Hashable,
     Optional,
     List
 )
 
 from nlpiper.core import Document
+from nlpiper.core.cache import LRUCache
+from nlpiper.core.distance import levenshtein
+from nlpiper.core.vocabulary import Vocabulary, load_vocabulary, shared
 from nlpiper.transformers.base import (
-    BaseTransformer,
+    BaseNormalizer,
     TransformersType,
     add_step,
     validate
@@ -24,8 +30,10 @@ __all__ = [
     "Stemmer"
 ]
 
+_PUNCTUATION_TABLE = str.maketrans('', '', punctuation)
 
-class CaseTokens(BaseTransformer):
+
+class CaseTokens(BaseNormalizer):
     """Uppercase or Lowercase tokens."""
 
     def __init__(self, mode='lower'):
@@ -55,12 +63,15 @@ class CaseTokens(BaseTransformer):
         d = doc if inplace else doc._deepcopy()
 
         for token in d.tokens:
-            token.cleaned = getattr(token.cleaned, self.mode)()
+            token.cleaned = self._normalize(token.cleaned)
 
         return None if inplace else d
 
+    def _normalize(self, token: str) -> str:
+        return getattr(token, self.mode)()
+
 
-class RemovePunctuation(BaseTransformer):
+class RemovePunctuation(BaseNormalizer):
     """Remove Punctuation."""
 
     @validate(TransformersType.NORMALIZERS)
@@ -78,12 +89,15 @@ class RemovePunctuation(BaseTransformer):
         d = doc if inplace else doc._deepcopy()
 
         for token in d.tokens:
-            token.cleaned = token.cleaned.translate(str.maketrans('', '', punctuation))
+            token.cleaned = self._normalize(token.cleaned)
 
         return None if inplace else d
 
+    def _normalize(self, token: str) -> str:
+        return token.translate(_PUNCTUATION_TABLE)
+
 
-class RemoveStopWords(BaseTransformer):
+class RemoveStopWords(BaseNormalizer):
     """Remove Stop Words."""
 
     def __init__(self, language: str = "english", case_sensitive: bool = True):
@@ -98,17 +112,22 @@ class RemoveStopWords(BaseTransformer):
             as a stop word and replaced by an empty string, "".
         """
         super().__init__(language=language, case_sensitive=case_sensitive)
-        self.case_sensitive = "__str__" if case_sensitive else "lower"
+        self.case_sensitive = case_sensitive
         try:
             import nltk
-            nltk.download("stopwords")
-            self.stopwords = nltk.corpus.stopwords.words(language)
 
         except ImportError:
             log.error("Please install NLTK. "
                       "See the docs at https://www.nltk.org/install.html for more information.")
             raise
 
+        def load() -> Vocabulary:
+            nltk.download("stopwords")
+            return Vocabulary(nltk.corpus.stopwords.words(language), case_sensitive)
+
+        # The stop words of each language are indexed once and shared by all the instances.
+        self.stopwords = shared(('nltk-stopwords', language, case_sensitive), load)
+
     @validate(TransformersType.NORMALIZERS)
     @add_step
     def __call__(self, doc: Document, inplace: bool = False) -> Optional[Document]:
@@ -124,29 +143,43 @@ class RemoveStopWords(BaseTransformer):
         d = doc if inplace else doc._deepcopy()
 
         for token in d.tokens:
-            token.cleaned = "" if getattr(token.cleaned, self.case_sensitive)() in self.stopwords else token.cleaned
+            token.cleaned = self._normalize(token.cleaned)
 
         return None if inplace else d
 
+    def _normalize(self, token: str) -> str:
+        return "" if token in self.stopwords else token
+
 
-class VocabularyFilter(BaseTransformer):
+class VocabularyFilter(BaseNormalizer):
     """Only allow tokens from a pre-defined vocabulary."""
 
-    def __init__(self, vocabulary: List[str], case_sensitive: bool = True):
+    def __init__(self, vocabulary: Optional[List[str]] = None, case_sensitive: bool = True,
+                 path: Optional[str] = None):
         """Only allow tokens from a pre-defined vocabulary.
 
         Only accept tokens that are in the vocabulary, otherwise the token will be replace by an empty string, `""`.
 
         Args:
-            vocabulary (str): List of tokens that define the vocabulary.
+            vocabulary (Optional[List[str]]): List of tokens that define the vocabulary.
             case_sensitive (bool): When `True`, the detection of a token in the vocabulary will be case sensitive,
              e.g. `vocab = ['this']`, if `'This'` is a token, since 'T' is upper case and will not be considered as a
              token from the vocabulary and will be replaced by an empty string, `""`, otherwise, will be considered
             as in vocabulary and kept.
+            path (Optional[str]): Path of a file with the tokens that define the vocabulary, one per line, instead of
+             `vocabulary`. Meant for large vocabularies, the file is indexed once, in a compact index when it is
+             large, and shared by all the filters of the process, see `nlpiper.core.vocabulary`.
         """
-        super().__init__(vocabulary=vocabulary, case_sensitive=case_sensitive)
-        self.vocab = vocabulary if case_sensitive else [token.lower() for token in vocabulary]
-        self.case_sensitive = "__str__" if case_sensitive else "lower"
+        if (vocabulary is None) == (path is None):
+            raise ValueError("Exactly one of vocabulary or path must be given.")
+
+        if path is None:
+            super().__init__(vocabulary=vocabulary, case_sensitive=case_sensitive)
+            self.vocab = Vocabulary(vocabulary, case_sensitive)
+        else:
+            super().__init__(case_sensitive=case_sensitive, path=path)
+            self.vocab = load_vocabulary(path, case_sensitive)
+        self.case_sensitive = case_sensitive
 
     @validate(TransformersType.NORMALIZERS)
     @add_step
@@ -163,15 +196,60 @@ class VocabularyFilter(BaseTransformer):
         d = doc if inplace else doc._deepcopy()
 
         for token in d.tokens:
-            token.cleaned = "" if getattr(token.cleaned, self.case_sensitive)() not in self.vocab else token.cleaned
+            token.cleaned = self._normalize(token.cleaned)
 
         return None if inplace else d
 
+    def _normalize(self, token: str) -> str:
+        return "" if token not in self.vocab else token
+
+
+# Caches shared by the normalizers created with `shared_cache=True`, keyed by their backend.
+_shared_caches: Dict[Hashable, LRUCache] = {}
+_shared_caches_lock = Lock()
+
+
+def _create_cache(cache_size: int, key: Optional[Hashable]) -> Optional[LRUCache]:
+    """Cache of a normalizer, shared with the normalizers of the same key when it is given, None when disabled."""
+    if cache_size < 0:
+        raise ValueError("cache_size must be a non negative integer")
+    if not cache_size:
+        return None
+    if key is None:
+        return LRUCache(cache_size)
+
+    with _shared_caches_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = _shared_caches[key] = LRUCache(cache_size)
+
+    return cache
+
+
+def _cache_options(cache_size: int, default_size: int, shared_cache: bool) -> dict:
+    """Cache arguments to be represented, only the ones given, so the steps of the default normalizers are unchanged."""
+    options: dict = {}
+    if cache_size != default_size:
+        options['cache_size'] = cache_size
+    if shared_cache:
+        options['shared_cache'] = shared_cache
+
+    return options
+
 
-class Stemmer(BaseTransformer):
+def _hit_rate(stats: Dict[str, int]) -> Dict[str, float]:
+    lookups = stats['hits'] + stats['misses']
+    return {**stats, 'hit_rate': stats['hits'] / lookups if lookups else 0.0}
+
+
+class Stemmer(BaseNormalizer):
     """Stem tokens."""
 
-    def __init__(self, version: str = 'nltk', language: str = "english", *args, **kwargs):
+    token_fields = ('cleaned', 'stem')
+    CACHE_SIZE = 100_000
+
+    def __init__(self, version: str = 'nltk', language: str = "english", *args, cache_size: int = CACHE_SIZE,
+                 shared_cache: bool = False, cache_path: Optional[str] = None, **kwargs):
         """Stem tokens.
 
         Stemmer currently supports two way to stem the tokens, using NLTK SnowballStemmer or using Hunspell.
@@ -183,8 +261,18 @@ class Stemmer(BaseTransformer):
              "swedish". (Default: `"english"`) For `hunspell`  by default the following languages are available:
              `'en_AU'`, `'en_CA'`, `'en_GB'`, `'en_NZ'`, `'en_US'`, `'en_ZA'`, however is possible to use other
              dictionaries, for this please check https://pypi.org/project/cyhunspell/
+            cache_size (int): Maximum number of stems cached, the least recently used ones are evicted, 0 disables
+             the cache. Token frequencies are very skewed, so most tokens are stemmed from the cache.
+             (Default: `100000`)
+            shared_cache (bool): If True the cache is shared by the stemmers of the process with the same backend,
+             otherwise each stemmer has its own cache. (Default: `False`)
+            cache_path (Optional[str]): Path of a table of precomputed stems, a tab separated token and stem per line,
+             loaded into the cache, see `save_cache`. (Default: `None`)
         """
-        super().__init__(version=version, language=language, *args, **kwargs)
+        options = _cache_options(cache_size, self.CACHE_SIZE, shared_cache)
+        if cache_path is not None:
+            options['cache_path'] = cache_path
+        super().__init__(version=version, language=language, *args, **kwargs, **options)
         if version == 'nltk':
             try:
                 import nltk  # noqa: F401
@@ -210,6 +298,13 @@ class Stemmer(BaseTransformer):
             raise ValueError(f"Currently {repr(version)} is not available."
                              f" You can opt by using 'nltk' or 'hunspell' to stem the tokens.")
 
+        key = ('stem', version, language, repr(args), repr(sorted(kwargs.items()))) if shared_cache else None
+        self.cache = _create_cache(cache_size, key)
+        if cache_path is not None and self.cache is None:
+            raise ValueError("cache_path can not be used with the cache disabled, cache_size=0")
+        if cache_path is not None:
+            self.load_cache(cache_path)
+
     @validate(TransformersType.NORMALIZERS)
     @add_step
     def __call__(self, doc: Document, inplace: bool = False) -> Optional[Document]:
@@ -225,57 +320,142 @@ class Stemmer(BaseTransformer):
         d = doc if inplace else doc._deepcopy()
 
         for token in d.tokens:
-            stem = self.stemmer.stem(token.cleaned)
-            stem = stem[0] if isinstance(stem, tuple) else stem
-            token.cleaned = stem if stem else token.cleaned
-            token.stem = stem if stem else token.cleaned
+            stem = self._normalize(token.cleaned)
+            token.cleaned = stem
+            token.stem = stem
 
         return None if inplace else d
 
+    def _normalize(self, token: str) -> str:
+        cache = self.cache
+        if cache is None:
+            return self._stem(token)
+
+        stem = cache.get(token)
+        if stem is None:
+            stem = self._stem(token)
+            cache.put(token, stem)
+
+        return stem
+
+    def _stem(self, token: str) -> str:
+        stem = self.stemmer.stem(token)
+        stem = stem[0] if isinstance(stem, tuple) else stem
+        return stem if stem else token
+
+    def load_cache(self, path: str) -> None:
+        """Load a table of precomputed stems into the cache, a tab separated token and stem per line.
+
+        Args:
+            path (str): Path of the table, e.g. written by `save_cache`.
+        """
+        if self.cache is None:
+            raise RuntimeError("The cache is disabled, cache_size=0")
+
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                token, sep, stem = line.rstrip('\n').partition('\t')
+                if sep and token:
+                    self.cache.put(token, stem or token)
+
+    def save_cache(self, path: str) -> None:
+        """Save the cached stems in a table, a tab separated token and stem per line, to warm start other stemmers.
+
+        Args:
+            path (str): Path of the table.
+        """
+        if self.cache is None:
+            raise RuntimeError("The cache is disabled, cache_size=0")
+
+        with open(path, 'w', encoding='utf-8') as f:
+            for token, stem in self.cache.items():
+                f.write(f"{token}\t{stem}\n")
+
+    def cache_stats(self) -> Dict[str, float]:
+        """Hits, misses, evictions, size and hit rate of the cache.
+
+        Returns: Dict[str, float]
+        """
+        if self.cache is None:
+            raise RuntimeError("The cache is disabled, cache_size=0")
+
+        return _hit_rate(self.cache.stats())
+
 
-class SpellCheck(BaseTransformer):
+class SpellCheck(BaseNormalizer):
     """Perform Spellcheck on tokens."""
 
-    def __init__(self, language: str = "en_GB", max_distance: Optional[int] = None, *args, **kwargs):
+    CACHE_SIZE = 100_000
+
+    def __init__(self, language: str = "en_GB", max_distance: Optional[int] = None, *args,
+                 cache_size: int = CACHE_SIZE, shared_cache: bool = False, engine: str = 'hunspell',
+                 dictionary: Optional[str] = None, **kwargs):
         """Perform Spellcheck on tokens.
 
-        Uses Hunspell spellchecker engine.
+        Uses Hunspell spellchecker engine, or a SymSpell index of a word frequency list, which suggests the closest
+        word in microseconds instead of milliseconds, see `nlpiper.core.symspell`.
 
         Args:
             language (str): By default the following dictionaries are available: `'en_AU'`, `'en_CA'`, `'en_GB'`,
              `'en_NZ'`, `'en_US'`, `'en_ZA'`, however is possible to use other dictionaries, for this please check
               https://pypi.org/project/cyhunspell/, Default(`"en_GB"`).
             max_distance (Optional[int]): If `None`, the tokens that are not spelt correctly are replaced by
-             an empty string, otherwise will maintain the original token. To use `max_distance` is necessary to install
-              `nltk` package, which will check if a token is correctly spelt or not, if not than it will check the
-              suggested words by Hunspell and calculate the levenshtein distance between the token and the suggestions,
-              and will replace the token by the word with the lower distance if is also lower than the `max_distance`,
-              otherwise will maintain the original token. Default(`None`)
+             an empty string, otherwise will maintain the original token. When `max_distance` is given and a token is
+              not correctly spelt, the levenshtein distance between the token and the words suggested by Hunspell is
+              calculated, and the token is replaced by the word with the lower distance if is also lower than the
+              `max_distance`, otherwise will maintain the original token. Default(`None`)
+            cache_size (int): Maximum number of tokens whose verdict, correctly spelt or not, and suggestion are
+             cached, the least recently used ones are evicted, 0 disables the caches. Default(`100000`)
+            shared_cache (bool): If True the caches are shared by the spellcheckers of the process with the same
+             dictionary and `max_distance`, otherwise each spellchecker has its own caches. Default(`False`)
+            engine (str): `'hunspell'` or `'symspell'`, which spell checks the tokens with the words of `dictionary`
+             and replaces them by the closest word, the most frequent one on ties. Default(`'hunspell'`)
+            dictionary (Optional[str]): Path of the `symspell` dictionary, a word frequency list, a word and its
+             frequency per line, or an index saved by `SymSpellIndex.save`, which is memory mapped and so shared by
+             the processes that use it. It is loaded once per process. Default(`None`)
             args: For further utilities check https://pypi.org/project/cyhunspell/
             kwargs: For further utilities check https://pypi.org/project/cyhunspell/
         """
-        super().__init__(language=language, max_distance=max_distance, *args, **kwargs)
+        options = _cache_options(cache_size, self.CACHE_SIZE, shared_cache)
+        if engine != 'hunspell':
+            options.update(engine=engine, dictionary=dictionary)
+        super().__init__(language=language, max_distance=max_distance, *args, **kwargs, **options)
         self.max_distance = max_distance
-        try:
-            from hunspell import Hunspell
-            self.h = Hunspell(lang=language, *args, **kwargs)
-
-        except ImportError:
-            log.error("Please install cyhunspell. "
-                      "See the docs at https://pypi.org/project/cyhunspell/ for more information.")
-            raise
-
-        if max_distance:
+        self.engine = engine
+        if engine == 'hunspell':
             try:
-                import nltk  # noqa: F401
-                from nltk.metrics.distance import edit_distance
-                self.edit_distance = edit_distance
+                from hunspell import Hunspell
+                self.h = Hunspell(lang=language, *args, **kwargs)
 
             except ImportError:
-                log.error("Please install NLTK. "
-                          "See the docs at https://www.nltk.org/install.html for more information.")
+                log.error("Please install cyhunspell. "
+                          "See the docs at https://pypi.org/project/cyhunspell/ for more information.")
                 raise
 
+        elif engine == 'symspell':
+            self.h = self._load_index(dictionary, max_distance)
+
+        else:
+            raise ValueError(f"Currently {repr(engine)} is not available."
+                             f" You can opt by using 'hunspell' or 'symspell' to spell check the tokens.")
+
+        key = (engine, dictionary, language, repr(args), repr(sorted(kwargs.items())))
+        self.verdicts = _create_cache(cache_size, ('spell',) + key if shared_cache else None)
+        self.suggestions = _create_cache(cache_size, ('suggest', max_distance) + key if shared_cache else None)
+
+    @staticmethod
+    def _load_index(dictionary: Optional[str], max_distance: Optional[int]):
+        from nlpiper.core.symspell import load_index
+
+        if dictionary is None:
+            raise ValueError("The 'symspell' engine needs a dictionary")
+
+        index = load_index(dictionary, max_distance=max_distance or 0)
+        if (max_distance or 0) > index.max_distance:
+            raise ValueError(f"max_distance must be at most {index.max_distance}, the one of the index {dictionary}")
+
+        return index
+
     @validate(TransformersType.NORMALIZERS)
     @add_step
     def __call__(self, doc: Document, inplace: bool = False) -> Optional[Document]:
@@ -290,18 +470,65 @@ class SpellCheck(BaseTransformer):
         """
         d = doc if inplace else doc._deepcopy()
 
-        def suggest(cleaned: str):
-            if self.max_distance:
-                suggestions = self.h.suggest(cleaned)
+        for token in d.tokens:
+            token.cleaned = self._normalize(token.cleaned)
+
+        return None if inplace else d
 
-                distances = [self.edit_distance(cleaned, s) for s in suggestions]
-                min_distance = min(distances)
+    def _normalize(self, token: str) -> str:
+        return token if self._spell(token) else self._suggest(token)
 
-                return suggestions[distances.index(min_distance)] if self.max_distance >= min_distance else cleaned
-            else:
-                return ''
+    def _spell(self, token: str) -> bool:
+        verdicts = self.verdicts
+        if verdicts is None:
+            return self.h.spell(token)
 
-        for token in d.tokens:
-            token.cleaned = token.cleaned if self.h.spell(token.cleaned) else suggest(token.cleaned)
+        verdict = verdicts.get(token)
+        if verdict is None:
+            verdict = bool(self.h.spell(token))
+            verdicts.put(token, verdict)
 
-        return None if inplace else d
+        return verdict
+
+    def _suggest(self, token: str) -> str:
+        if not self.max_distance:
+            return ''
+
+        suggestions = self.suggestions
+        if suggestions is None:
+            return self._closest(token)
+
+        suggestion = suggestions.get(token)
+        if suggestion is None:
+            suggestion = self._closest(token)
+            suggestions.put(token, suggestion)
+
+        return suggestion
+
+    def _closest(self, token: str) -> str:
+        """Suggestion closest to the token within `max_distance`, the first one on ties, or the token itself."""
+        if self.engine == 'symspell':
+            return self.h.lookup(token, self.max_distance) or token
+
+        closest = token
+        limit = self.max_distance
+        for suggestion in self.h.suggest(token):
+            distance = levenshtein(token, suggestion, limit)
+            if distance <= limit:
+                closest = suggestion
+                # Only a closer suggestion can replace this one.
+                limit = distance - 1
+                if limit < 0:
+                    break
+
+        return closest
+
+    def cache_stats(self) -> Dict[str, Dict[str, float]]:
+        """Hits, misses, evictions, size and hit rate of the verdicts and suggestions caches.
+
+        Returns: Dict[str, Dict[str, float]]
+        """
+        if self.verdicts is None or self.suggestions is None:
+            raise RuntimeError("The caches are disabled, cache_size=0")
+
+        return {'verdicts': _hit_rate(self.verdicts.stats()), 'suggestions': _hit_rate(self.suggestions.stats())}
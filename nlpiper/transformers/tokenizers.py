@@ -1,6 +1,9 @@
 """Tokenizer Module."""
 
-from typing import Optional
+import re
+from html import unescape
+from typing import List, Optional, Tuple
+
 from nlpiper.core.document import (
     Document,
     Token
@@ -9,8 +12,10 @@ from nlpiper.logger import log
 from nlpiper.transformers.base import (
     BaseTransformer,
     TransformersType,
+    add_batch_step,
     add_step,
-    validate
+    validate,
+    validate_batch
 )
 
 
@@ -24,6 +29,16 @@ __all__ = [
 class BasicTokenizer(BaseTransformer):
     """Basic tokenizer which tokenizes a document by splitting tokens by its blank spaces."""
 
+    def __init__(self, offsets: bool = False):
+        """Basic tokenizer which tokenizes a document by splitting tokens by its blank spaces.
+
+        Args:
+            offsets (bool): If True the tokens are stored as ``TokenSpans``, the ``start`` and ``end`` offsets of
+                the tokens in the document text, which is only supported by ``FastDocument``.
+        """
+        super().__init__(**_offsets_kwargs(offsets))
+        self.offsets = offsets
+
     @validate(TransformersType.TOKENIZERS)
     @add_step
     def __call__(self, doc: Document, inplace: bool = False) -> Optional[Document]:
@@ -38,7 +53,10 @@ class BasicTokenizer(BaseTransformer):
         """
         d = doc if inplace else doc._deepcopy()
 
-        d.tokens = [Token(token) for token in d.cleaned.split()]
+        if self.offsets:
+            d.tokens = d._make_tokens(None, [match.span() for match in re.finditer(r'\S+', d.cleaned)])
+        else:
+            d.tokens = d._make_tokens(d.cleaned.split())
 
         return None if inplace else d
 
@@ -49,14 +67,17 @@ class MosesTokenizer(BaseTransformer):
     Transformer to tokenize a Document using Sacremoses, https://github.com/alvations/sacremoses
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, offsets: bool = False, **kwargs):
         """SacreMoses tokenizer.
 
         Args:
             *args: See the docs at https://github.com/alvations/sacremoses for more information.
+            offsets (bool): If True the tokens are stored as ``TokenSpans``, the ``start`` and ``end`` offsets of
+                the tokens in the document text, which is only supported by ``FastDocument``.
             **kwargs: See the docs at https://github.com/alvations/sacremoses for more information.
         """
-        super().__init__(*args, **kwargs)
+        super().__init__(*args, **kwargs, **_offsets_kwargs(offsets))
+        self.offsets = offsets
         try:
             from sacremoses import MosesTokenizer
             self.t = MosesTokenizer(*args, **kwargs)
@@ -80,7 +101,8 @@ class MosesTokenizer(BaseTransformer):
         """
         d = doc if inplace else doc._deepcopy()
 
-        d.tokens = [Token(token) for token in self.t.tokenize(d.cleaned)]
+        tokens = self.t.tokenize(d.cleaned)
+        d.tokens = d._make_tokens(tokens, _align(d.cleaned, tokens) if self.offsets else None)
 
         return None if inplace else d
 
@@ -91,15 +113,18 @@ class StanzaTokenizer(BaseTransformer):
     Transformer to tokenize a Document using stanza, https://github.com/stanfordnlp/stanza
     """
 
-    def __init__(self, language: str = 'en', processors='tokenize', *args, **kwargs):
+    def __init__(self, language: str = 'en', processors='tokenize', *args, offsets: bool = False, **kwargs):
         """Stanza tokenizer.
 
         Args:
             language (str): document main language.
             *args: See the docs at https://stanfordnlp.github.io/stanza/tokenize.html add for more information.
+            offsets (bool): If True the tokens are stored as ``TokenSpans``, the ``start`` and ``end`` offsets of
+                the tokens in the document text, which is only supported by ``FastDocument``.
             **kwargs: See the docs at https://stanfordnlp.github.io/stanza/tokenize.html add for more information.
         """
-        super().__init__(language=language, processors=processors, *args, **kwargs)
+        super().__init__(language=language, processors=processors, *args, **kwargs, **_offsets_kwargs(offsets))
+        self.offsets = offsets
         try:
             import stanza
             from stanza import Pipeline
@@ -107,6 +132,7 @@ class StanzaTokenizer(BaseTransformer):
             assert 'tokenize' in processors.lower(), 'StanzaTokenizer needs `"tokenize"` on processors'
             self.p = Pipeline(lang=language, processors=processors, tokenize_pretokenized=False, *args,
                               **kwargs)
+            self.stanza_document = stanza.Document
             self.processors = processors
 
         except ImportError:
@@ -128,18 +154,58 @@ class StanzaTokenizer(BaseTransformer):
         """
         d = doc if inplace else doc._deepcopy()
 
-        tokens = []
-        for sentence in self.p(doc.cleaned).sentences:
-            for word in sentence.words:
-                token = Token(word.parent.text)
+        d.tokens = self._tokens(self.p(doc.cleaned), d)
 
-                if 'lemma' in self.processors.lower():
-                    token.lemma = word.lemma
+        return None if inplace else d
 
-                if 'ner' in self.processors.lower():
-                    token.ner = word.parent.ner
+    @validate_batch(TransformersType.TOKENIZERS)
+    @add_batch_step
+    def batch(self, docs: List[Document]) -> None:
+        """Tokenize a batch of documents inplace with a single call to the stanza pipeline.
 
-                tokens.append(token)
-        d.tokens = tokens
+        Args:
+            docs (List[Document]): Documents to be tokenized.
+        """
+        processed = self.p([self.stanza_document([], text=d.cleaned) for d in docs])
 
-        return None if inplace else d
+        for d, p in zip(docs, processed):
+            d.tokens = self._tokens(p, d)
+
+    def _tokens(self, processed, doc: Document) -> List[Token]:
+        words = [word for sentence in processed.sentences for word in sentence.words]
+        spans = [(word.parent.start_char, word.parent.end_char) for word in words] if self.offsets else None
+        tokens = doc._make_tokens([word.parent.text for word in words], spans)
+
+        for token, word in zip(tokens, words):
+            if 'lemma' in self.processors.lower():
+                token.lemma = word.lemma
+
+            if 'ner' in self.processors.lower():
+                token.ner = word.parent.ner
+
+        return tokens
+
+
+def _offsets_kwargs(offsets: bool) -> dict:
+    # The option is only recorded when set, so the steps of the default tokenizers are unchanged.
+    return {'offsets': offsets} if offsets else {}
+
+
+def _align(text: str, tokens: List[str]) -> List[Tuple[int, int]]:
+    """Offsets of the tokens in the text they were extracted from.
+
+    The tokens are searched in order, unescaping the HTML entities added by the tokenizer, a token not found in
+    the text, e.g. one rewritten by the tokenizer, gets an empty span at the current position.
+    """
+    spans = []
+    position = 0
+    for token in tokens:
+        token = unescape(token)
+        start = text.find(token, position)
+        if start < 0:
+            spans.append((position, position))
+        else:
+            position = start + len(token)
+            spans.append((start, position))
+
+    return spans
@@ -0,0 +1,115 @@
+import pytest
+
+from nlpiper.core.batch import DocumentBatch
+from nlpiper.core.composition import Compose
+from nlpiper.core.document import (
+    Document,
+    FastDocument,
+    FastToken,
+    Token
+)
+from nlpiper.transformers.cleaners import CleanNumber
+from nlpiper.transformers.normalizers import CaseTokens, RemovePunctuation, Stemmer
+from nlpiper.transformers.tokenizers import BasicTokenizer
+
+TEXTS = ["Test random Stuff 1.", "", "Other DOCUMENT."]
+
+
+class TestDocumentBatch:
+
+    def test_same_output_as_documents(self):
+        pipe = Compose([CleanNumber(), BasicTokenizer(), CaseTokens(), RemovePunctuation()])
+        batch = DocumentBatch(TEXTS)
+
+        for t in pipe.transformers:
+            batch.apply(t)
+
+        assert batch.to_documents() == [pipe(Document(text)) for text in TEXTS]
+        assert batch.offsets == [0, 4, 4, 6]
+
+    def test_from_documents(self):
+        docs = [BasicTokenizer()(Document(text)) for text in TEXTS]
+        docs[0].tokens[0].lemma = 'test'
+
+        batch = DocumentBatch.from_documents(docs)
+
+        assert batch.to_documents() == docs
+        assert batch.columns['lemma'] == ['test', None, None, None, None, None]
+        assert 'ner' not in batch.columns
+
+    def test_to_fast_documents(self):
+        batch = DocumentBatch(TEXTS)
+        batch.apply(BasicTokenizer())
+
+        docs = batch.to_documents(FastDocument)
+
+        assert all(isinstance(doc, FastDocument) for doc in docs)
+        assert all(isinstance(token, FastToken) for doc in docs for token in doc.tokens)
+
+    def test_views(self):
+        batch = DocumentBatch(TEXTS)
+        batch.apply(BasicTokenizer())
+        view = batch[-1]
+
+        view.tokens[0].cleaned = 'changed'
+        view.tokens[1].ner = 'O'
+
+        assert view.original == "Other DOCUMENT."
+        assert batch.columns['cleaned'][4] == 'changed'
+        assert batch.columns['ner'] == [None, None, None, None, None, 'O']
+        expected = [Token('Other'), Token('DOCUMENT.', ner='O')]
+        expected[0].cleaned = 'changed'
+        assert view.tokens == expected
+        assert view.steps == ['BasicTokenizer()']
+        assert batch[1].tokens == []
+        assert batch[1].embedded is None
+
+    def test_view_index_out_of_range(self):
+        batch = DocumentBatch(TEXTS)
+        with pytest.raises(IndexError):
+            batch[3]
+
+    def test_stemmer_columns(self):
+        pytest.importorskip('nltk')
+        batch = DocumentBatch(TEXTS)
+        batch.apply(BasicTokenizer())
+
+        batch.apply(Stemmer())
+        batch[0].tokens[0].cleaned = 'changed'
+
+        assert batch.columns['stem'][:3] == ['test', 'random', 'stuff']
+
+    def test_normalizer_without_tokens(self):
+        batch = DocumentBatch(TEXTS)
+        with pytest.raises(RuntimeError):
+            batch.apply(CaseTokens())
+
+    def test_cleaner_with_tokens(self):
+        batch = DocumentBatch(TEXTS)
+        batch.apply(BasicTokenizer())
+        with pytest.raises(RuntimeError):
+            batch.apply(CleanNumber())
+
+    def test_mixed_documents(self):
+        with pytest.raises(ValueError):
+            DocumentBatch.from_documents([Document('test'), BasicTokenizer()(Document('test'))])
+
+    def test_embeddings(self):
+        pytest.importorskip('gensim')
+        import numpy as np
+        from gensim.models import KeyedVectors
+        from nlpiper.transformers.embeddings import GensimEmbeddings
+
+        keyed_vectors = KeyedVectors(2)
+        keyed_vectors.add_vectors(['test', 'other'], np.array([[1, 2], [3, 4]], dtype=np.float32))
+        pipe = Compose([BasicTokenizer(), CaseTokens(), GensimEmbeddings(keyed_vectors, apply_doc='sum')])
+        batch = DocumentBatch(["Test other", "", "Test unknown"])
+
+        for t in pipe.transformers:
+            batch.apply(t)
+
+        assert batch.token_embedded.tolist() == [[1, 2], [3, 4], [1, 2], [0, 0]]
+        assert batch.embedded.tolist() == [[4, 6], [0, 0], [1, 2]]
+        assert batch[2].tokens[0].embedded.tolist() == [1, 2]
+        with pytest.raises(RuntimeError):
+            batch.apply(CaseTokens())
@@ -0,0 +1,186 @@
+import pickle
+
+import pytest
+
+from nlpiper.core.cache import DiskCache, LRUCache, ResultCache, fingerprint
+from nlpiper.core.composition import Compose
+from nlpiper.core.document import Document, FastDocument
+from nlpiper.core.parallel import Threaded
+from nlpiper.transformers import cleaners, normalizers, tokenizers
+
+
+def create_pipeline(cache=None):
+    return Compose([cleaners.CleanNumber(), tokenizers.BasicTokenizer(), normalizers.CaseTokens()], cache=cache)
+
+
+class TestLRUCache:
+
+    def test_eviction(self):
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == 1
+
+        cache.put('c', 3)
+
+        assert 'b' not in cache
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+        assert cache.stats() == {'hits': 2, 'misses': 1, 'evictions': 1, 'size': 2}
+        assert cache.items() == [('a', 1), ('c', 3)]
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            LRUCache(0)
+
+    def test_pickle(self):
+        cache = LRUCache()
+        cache.put('a', 1)
+
+        assert pickle.loads(pickle.dumps(cache)).get('a') == 1
+
+
+class TestDiskCache:
+
+    def test_get_and_put(self, tmp_path):
+        cache = DiskCache(str(tmp_path / 'cache.db'))
+        cache.put('a', b'1')
+
+        assert cache.get('a') == b'1'
+        assert cache.get('b') is None
+        assert cache.stats() == {'hits': 1, 'misses': 1, 'size': 1}
+
+        cache.close()
+        assert DiskCache(str(tmp_path / 'cache.db')).get('a') == b'1'
+
+
+class TestResultCache:
+
+    def test_key(self):
+        doc = Document('Test')
+        key = ResultCache.key('pipeline', doc)
+
+        assert key == ResultCache.key('pipeline', Document('Test'))
+        assert key != ResultCache.key('other', doc)
+        assert key != ResultCache.key('pipeline', FastDocument('Test'))
+        assert ResultCache.key('pipeline', tokenizers.BasicTokenizer()(doc)) is None
+
+    def test_fingerprint(self):
+        assert fingerprint(['BasicTokenizer()']) == Compose([tokenizers.BasicTokenizer()]).fingerprint()
+        assert create_pipeline().fingerprint() == create_pipeline().fingerprint()
+        assert fingerprint(['A()', 'B()']) != fingerprint(['A()B()'])
+
+    def test_fingerprint_threaded(self):
+        pipe = Compose([tokenizers.BasicTokenizer(), normalizers.CaseTokens()])
+        threaded = [Compose([tokenizers.BasicTokenizer(), Threaded(normalizers.CaseTokens(), n_threads=n_threads)])
+                    for n_threads in (2, 4)]
+
+        assert pipe.fingerprint() == threaded[0].fingerprint() == threaded[1].fingerprint()
+        assert [t.prefixes for t in (pipe._trusted, threaded[0]._trusted)] == [pipe._trusted.prefixes] * 2
+
+    @pytest.mark.parametrize('document_class', [Document, FastDocument])
+    def test_call(self, document_class):
+        pipe = create_pipeline(ResultCache())
+        expected = create_pipeline()(document_class('Test 1 test'))
+
+        first = pipe(document_class('Test 1 test'))
+        second = pipe(document_class('Test 1 test'))
+
+        assert first == second == expected
+        assert first.tokens[0] is not second.tokens[0]
+        assert pipe.cache.stats()['hits'] == 1
+        assert pipe.cache.stats()['misses'] == 1
+
+        doc = document_class('Test 1 test')
+        assert pipe(doc, inplace=True) is None
+        assert doc == expected
+        assert pipe.cache.stats()['hits'] == 2
+
+    def test_pipe(self):
+        pipe = create_pipeline(ResultCache(maxsize=2))
+        inputs = ['Test 1', 'Other 2', 'Test 1', 'Test 1', 'Last']
+
+        out = list(pipe.pipe(inputs, batch_size=2))
+
+        assert out == list(create_pipeline().pipe(inputs))
+        assert pipe.cache.stats() == {'hits': 2, 'misses': 3, 'evictions': 1, 'memory_hits': 2, 'disk_hits': 0,
+                                      'size': 2}
+
+    def test_not_cached(self):
+        pipe = Compose([normalizers.CaseTokens()], cache=ResultCache())
+        doc = tokenizers.BasicTokenizer()(Document('Test'))
+
+        pipe(doc)
+        pipe(doc)
+
+        assert pipe.cache.stats()['size'] == 0
+
+    def test_disk_tier(self, tmp_path):
+        path = str(tmp_path / 'cache.db')
+        create_pipeline(ResultCache(path=path))(Document('Test 1'))
+
+        pipe = create_pipeline(ResultCache(path=path))
+        out = pipe(Document('Test 1'))
+
+        assert out == create_pipeline()(Document('Test 1'))
+        assert pipe.cache.stats()['disk_hits'] == 1
+        assert pipe.cache.stats()['misses'] == 0
+
+    def test_pipeline_changed(self):
+        pipe = create_pipeline(ResultCache())
+        pipe(Document('Test'))
+
+        pipe.transformers.append(normalizers.RemovePunctuation())
+        out = pipe(Document('Test'))
+
+        assert len(out.steps) == 4
+        assert pipe.cache.stats()['hits'] == 0
+
+
+class TestCheckpoints:
+
+    def create_pipelines(self, checkpoints):
+        prefix = [cleaners.CleanNumber(), tokenizers.BasicTokenizer()]
+        return (Compose(prefix + [normalizers.CaseTokens()], checkpoints=checkpoints),
+                Compose(prefix + [normalizers.RemovePunctuation()], checkpoints=checkpoints))
+
+    def test_resume_from_shared_prefix(self):
+        checkpoints = ResultCache()
+        first, second = self.create_pipelines(checkpoints)
+        first(Document('Test 1, test'))
+        assert len(checkpoints.memory) == 3
+
+        out = second(Document('Test 1, test'))
+
+        assert out == self.create_pipelines(None)[1](Document('Test 1, test'))
+        assert out.steps == ['CleanNumber()', 'BasicTokenizer()', 'RemovePunctuation()']
+        # The last stage was not cached, the document resumed after the tokenizer.
+        assert checkpoints.stats()['hits'] == 1
+        assert len(checkpoints.memory) == 4
+
+    def test_pipe(self):
+        checkpoints = ResultCache()
+        first, second = self.create_pipelines(checkpoints)
+        inputs = ['Test 1, test', 'Other.']
+        list(first.pipe(inputs[:1]))
+
+        out = list(second.pipe(inputs))
+
+        assert out == list(self.create_pipelines(None)[1].pipe(inputs))
+        assert len(checkpoints.memory) == 7
+
+    def test_pipe_n_jobs(self):
+        first, _ = self.create_pipelines(ResultCache())
+
+        with pytest.raises(ValueError):
+            list(first.pipe(['Test 1, test'], n_jobs=2))
+
+    def test_compiled_pipeline(self):
+        checkpoints = ResultCache()
+        first, second = self.create_pipelines(checkpoints)
+        first.compile()(Document('Test 1, test'))
+
+        out = second(Document('Test 1, test'))
+
+        assert out == self.create_pipelines(None)[1](Document('Test 1, test'))
+        assert checkpoints.stats()['hits'] == 1
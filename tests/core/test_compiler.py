@@ -0,0 +1,155 @@
+import pytest
+
+from nlpiper.core.compiler import (
+    CharacterMap,
+    FusedCleaners,
+    FusedNormalizers,
+    TrustedPipeline,
+    compile_transformers
+)
+from nlpiper.core.parallel import Threaded
+from nlpiper.core.composition import Compose
+from nlpiper.core.document import Document, FastDocument
+from nlpiper.transformers import cleaners, normalizers, tokenizers
+from nlpiper.transformers.base import TransformersType
+
+
+def cleaning_chain():
+    return [cleaners.CleanURL(), cleaners.CleanEmail(), cleaners.CleanNumber(), cleaners.CleanPunctuation(),
+            cleaners.CleanEOF(), cleaners.CleanAccents()]
+
+
+class TestCompileTransformers:
+
+    def test_fuse_runs_of_cleaners(self):
+        tokenizer, normalizer, number = tokenizers.BasicTokenizer(), normalizers.CaseTokens(), cleaners.CleanNumber()
+        transformers = cleaning_chain() + [tokenizer, normalizer]
+
+        stages = compile_transformers(transformers)
+
+        assert len(stages) == 3
+        assert isinstance(stages[0], FusedCleaners)
+        assert stages[0].cleaners == transformers[:6]
+        assert stages[1:] == [tokenizer, normalizer]
+        assert compile_transformers([number, tokenizer]) == [number, tokenizer]
+
+    def test_fuse_runs_of_normalizers(self):
+        tokenizer = tokenizers.BasicTokenizer()
+        transformers = [cleaners.CleanNumber(), tokenizer, normalizers.CaseTokens(), normalizers.RemovePunctuation()]
+
+        stages = compile_transformers(transformers)
+
+        assert stages[:2] == transformers[:2]
+        assert isinstance(stages[2], FusedNormalizers)
+        assert stages[2].normalizers == transformers[2:]
+
+    def test_merge_character_wise_cleaners(self):
+        fused = FusedCleaners(cleaning_chain())
+
+        assert [type(operation) for operation in fused.operations[2:]] == [CharacterMap]
+        assert len(fused.operations[2].cleaners) == 4
+
+
+class TestFusedCleaners:
+
+    @pytest.mark.parametrize('inputs', [
+        'Email: test@test.com, URL: www.web.com and http://web.com',
+        'wwwhttp://web.com',
+        'test@test.cohttp://web.com',
+        'Tomás 2² ﬁ\nÀ 1½, "#$%',
+        '',
+    ])
+    @pytest.mark.parametrize('mode', ['unicode', 'ascii'])
+    def test_same_output(self, inputs, mode):
+        chain = cleaning_chain()[:-1] + [cleaners.CleanAccents(mode=mode)]
+        doc = Document(inputs)
+
+        expected = Compose(chain)(doc)
+        out = FusedCleaners(chain)(doc)
+
+        assert out == expected
+        assert out.steps == [repr(t) for t in chain]
+        assert doc.cleaned == inputs
+        assert doc.steps == []
+
+    def test_inplace(self):
+        doc = FastDocument('Test 123!')
+
+        out = FusedCleaners([cleaners.CleanNumber(), cleaners.CleanPunctuation()])(doc, True)
+
+        assert out is None
+        assert doc.cleaned == 'Test '
+        assert doc.steps == ['CleanNumber()', 'CleanPunctuation()']
+
+    def test_with_doc_tokens(self):
+        doc = tokenizers.BasicTokenizer()(Document('test'))
+
+        with pytest.raises(RuntimeError):
+            FusedCleaners(cleaning_chain())(doc)
+
+
+class TestFusedNormalizers:
+
+    @pytest.mark.parametrize('inputs', ['The Running dogs, of them! run.', ''])
+    @pytest.mark.parametrize('document_class,offsets', [(Document, False), (FastDocument, False),
+                                                        (FastDocument, True)])
+    def test_same_output(self, inputs, document_class, offsets):
+        chain = [normalizers.CaseTokens(), normalizers.RemovePunctuation(),
+                 normalizers.VocabularyFilter(['the', 'running', 'dogs', 'run'])]
+        doc = tokenizers.BasicTokenizer(offsets=offsets)(document_class(inputs))
+
+        expected = Compose(chain)(doc)
+        out = FusedNormalizers(chain)(doc)
+
+        assert out == expected
+        assert out.steps == expected.steps
+        assert doc.steps == ['BasicTokenizer(offsets=True)' if offsets else 'BasicTokenizer()']
+
+    @pytest.mark.parametrize('document_class', [Document, FastDocument])
+    def test_fields_of_last_normalizer(self, document_class):
+        pytest.importorskip('nltk')
+        chain = [normalizers.Stemmer(), normalizers.CaseTokens(mode='upper')]
+        doc = tokenizers.BasicTokenizer()(document_class('running dogs'))
+
+        out = FusedNormalizers(chain)(doc)
+
+        assert [(token.stem, token.cleaned) for token in out.tokens] == [('run', 'RUN'), ('dog', 'DOG')]
+        assert out == Compose(chain)(doc)
+
+    def test_without_tokens(self):
+        with pytest.raises(RuntimeError):
+            FusedNormalizers([normalizers.CaseTokens(), normalizers.RemovePunctuation()])(Document('test'))
+
+
+class TestTrustedPipeline:
+
+    def test_valid_states(self):
+        pipeline = TrustedPipeline([cleaners.CleanNumber(), tokenizers.BasicTokenizer(), normalizers.CaseTokens()])
+
+        assert pipeline.errors[(False, False)] is None
+        assert pipeline.errors[(True, False)] == "Cleaners transformer can not be applied on documents with tokens"
+
+        doc = tokenizers.BasicTokenizer()(Document('test'))
+        with pytest.raises(RuntimeError):
+            pipeline.check(doc)
+
+        with pytest.raises(TypeError):
+            pipeline.check('test')
+
+    def test_invalid_order(self):
+        with pytest.raises(RuntimeError):
+            TrustedPipeline([normalizers.CaseTokens(), tokenizers.BasicTokenizer()])
+
+    def test_checked_after_unknown_stage(self):
+        normalizer = normalizers.CaseTokens()
+        pipeline = TrustedPipeline([tokenizers.BasicTokenizer(), Threaded(normalizer), normalizer])
+
+        assert pipeline.types == [TransformersType.TOKENIZERS]
+        assert pipeline.calls[2].func is normalizer
+
+        doc = Document('Test')
+        for call in pipeline.calls:
+            call(doc)
+
+        assert doc.tokens[0].cleaned == 'test'
+        assert len(doc.steps) == 3
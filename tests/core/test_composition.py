@@ -1,9 +1,14 @@
+import asyncio
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 
 from nlpiper.transformers import cleaners, normalizers, tokenizers
 from nlpiper.core.composition import Compose
 from nlpiper.core.document import (
     Document,
+    FastDocument,
     Token
 )
 
@@ -141,3 +146,280 @@ class TestCompose:
         assert len(doc.steps) == len(pipe.transformers)
         assert len(out.steps) == len(doc.steps) - steps
         assert out.steps == doc.steps[:-steps]
+
+    @pytest.mark.parametrize('document_class', [Document, FastDocument])
+    @pytest.mark.parametrize('steps', [1, 2, 3])
+    def test_rollback_from_snapshots(self, monkeypatch, document_class, steps):
+        transformers = [cleaners.CleanNumber(), tokenizers.BasicTokenizer(), normalizers.CaseTokens()]
+        doc = document_class("Basic Test Document 1 2 3")
+        expected = Compose.rollback_document(Compose(transformers)(doc), steps)
+
+        for pipe_doc in (Compose(transformers, snapshots=True)(doc),
+                         next(Compose(transformers, snapshots=True).pipe([doc]))):
+            monkeypatch.setattr(Compose, 'create_from_steps', None)
+            out = Compose.rollback_document(pipe_doc, steps)
+            monkeypatch.undo()
+
+            assert out == expected
+            assert out.steps == pipe_doc.steps[:-steps]
+            assert len(pipe_doc.steps) == 3
+
+    def test_rollback_from_snapshots_is_independent(self):
+        pipe = Compose([tokenizers.BasicTokenizer(), normalizers.CaseTokens()], snapshots=True)
+        doc = pipe(Document("Basic Test"))
+
+        out = Compose.rollback_document(doc, 1)
+        out.tokens[0].cleaned = 'changed'
+
+        assert [t.cleaned for t in Compose.rollback_document(doc, 1).tokens] == ['Basic', 'Test']
+        assert Compose.rollback_document(out, 1) == Document("Basic Test")
+
+    def test_rollback_from_compiled_snapshots(self):
+        pipe = Compose([cleaners.CleanNumber(), cleaners.CleanPunctuation(), tokenizers.BasicTokenizer()],
+                       snapshots=True).compile()
+        doc = pipe(Document("Basic, Test 1"))
+
+        out = Compose.rollback_document(doc, 2)
+
+        assert out.cleaned == "Basic, Test "
+        assert out.steps == doc.steps[:1]
+
+    @pytest.mark.parametrize('batch_size', [1, 2, 10])
+    def test_pipe(self, batch_size):
+        inputs = ["Basic Test 1", Document("Other Test 2"), "Last Test 3"]
+        pipe = Compose([
+            cleaners.CleanNumber(),
+            tokenizers.BasicTokenizer(),
+            normalizers.CaseTokens()
+        ])
+
+        out = list(pipe.pipe(inputs, batch_size=batch_size))
+
+        assert [d.cleaned for d in out] == ["Basic Test ", "Other Test ", "Last Test "]
+        expected = [['basic', 'test'], ['other', 'test'], ['last', 'test']]
+        assert [[t.cleaned for t in d.tokens] for d in out] == expected
+        assert all(d.steps == [repr(t) for t in pipe.transformers] for d in out)
+        assert inputs[1].tokens is None
+        assert inputs[1].steps == []
+
+    def test_pipe_is_lazy(self):
+        consumed = []
+
+        def generate():
+            for i in range(5):
+                consumed.append(i)
+                yield f"Document {i}"
+
+        pipe = Compose([tokenizers.BasicTokenizer()])
+        out = pipe.pipe(generate(), batch_size=2)
+
+        assert next(out).cleaned == "Document 0"
+        assert consumed == [0, 1]
+
+    def test_pipe_inplace(self):
+        doc = Document("Basic Test")
+        pipe = Compose([tokenizers.BasicTokenizer()])
+
+        out = list(pipe.pipe([doc], inplace=True))
+
+        assert out[0] is doc
+        assert doc.steps == [repr(pipe.transformers[0])]
+
+    @pytest.mark.parametrize('document_class', [Document, FastDocument])
+    def test_pipe_dedupe(self, document_class):
+        calls = []
+
+        class CountingTokenizer(tokenizers.BasicTokenizer):
+            def __call__(self, doc, inplace=False):
+                calls.append(doc.original)
+                return super().__call__(doc, inplace)
+
+        processed = cleaners.CleanEOF()(document_class("Same Text"))
+        inputs = [document_class(text) for text in ["Same Text", "Other Text", "Same Text", "Same Text"]]
+        inputs.append(processed)
+        pipe = Compose([CountingTokenizer(), normalizers.CaseTokens()])
+
+        out = list(pipe.pipe(inputs, batch_size=10, dedupe=False))
+        deduped = list(pipe.pipe(inputs, batch_size=10, dedupe=True))
+
+        assert deduped == out
+        assert calls[len(inputs):] == ["Same Text", "Other Text", "Same Text"]
+        assert len({id(doc.tokens[0]) for doc in deduped}) == len(deduped)
+        assert pipe.dedupe_stats() == {'documents': 5, 'processed': 3, 'duplicates': 2, 'ratio': 0.4}
+
+    def test_pipe_dedupe_n_jobs(self):
+        inputs = ["Basic Test", "Other Test", "Basic Test"]
+        pipe = Compose([tokenizers.BasicTokenizer(), normalizers.CaseTokens()])
+
+        assert list(pipe.pipe(inputs, n_jobs=2, dedupe=True)) == list(pipe.pipe(inputs))
+
+    @pytest.mark.parametrize('batch_size', [0, -1])
+    def test_pipe_invalid_batch_size(self, batch_size):
+        pipe = Compose([tokenizers.BasicTokenizer()])
+        with pytest.raises(ValueError):
+            list(pipe.pipe(["test"], batch_size=batch_size))
+
+    def test_pipe_invalid_input(self):
+        pipe = Compose([tokenizers.BasicTokenizer()])
+        with pytest.raises(TypeError):
+            list(pipe.pipe([1]))
+
+    @pytest.mark.parametrize('ordered', [True, False])
+    def test_pipe_n_jobs(self, ordered):
+        inputs = [f"Basic Test {i}" for i in range(20)] + [Document("Other Test")]
+        pipe = Compose([
+            cleaners.CleanNumber(),
+            tokenizers.BasicTokenizer(),
+            normalizers.CaseTokens()
+        ])
+
+        out = list(pipe.pipe(inputs, batch_size=3, n_jobs=2, chunksize=4, ordered=ordered))
+        expected = list(pipe.pipe(inputs))
+
+        if not ordered:
+            out = sorted(out, key=lambda d: d.original)
+            expected = sorted(expected, key=lambda d: d.original)
+
+        assert out == expected
+
+    def test_invalid_order(self):
+        with pytest.raises(RuntimeError):
+            Compose([normalizers.CaseTokens(), tokenizers.BasicTokenizer()])
+
+    def test_transformers_changed(self):
+        pipe = Compose([tokenizers.BasicTokenizer()])
+        pipe.transformers.append(normalizers.CaseTokens())
+
+        out = pipe(Document('Test'))
+
+        assert out.tokens[0].cleaned == 'test'
+
+        pipe.transformers.append(tokenizers.BasicTokenizer())
+        with pytest.raises(RuntimeError):
+            pipe(Document('Test'))
+
+    def test_compile(self):
+        chain = [cleaners.CleanURL(), cleaners.CleanNumber(), cleaners.CleanPunctuation(), tokenizers.BasicTokenizer(),
+                 normalizers.CaseTokens()]
+        inputs = ['Test 1, www.web.com!', 'An\nother 2.']
+
+        pipe = Compose(chain)
+        compiled = Compose(chain).compile()
+
+        assert len(compiled._stages) == 3
+        assert repr(compiled) == repr(pipe)
+        assert [compiled(Document(text)) for text in inputs] == [pipe(Document(text)) for text in inputs]
+        assert list(compiled.pipe(inputs)) == list(pipe.pipe(inputs))
+        assert list(compiled.pipe(inputs, n_jobs=2)) == list(pipe.pipe(inputs))
+
+    @pytest.mark.parametrize('compiled', [False, True])
+    def test_pickle(self, compiled):
+        chain = [cleaners.CleanURL(), cleaners.CleanNumber(), tokenizers.BasicTokenizer(), normalizers.CaseTokens(),
+                 normalizers.RemovePunctuation()]
+        pipe = Compose(chain).compile() if compiled else Compose(chain)
+        pipe(Document("Warm up"))
+
+        other = pickle.loads(pickle.dumps(pipe))
+
+        assert repr(other) == repr(pipe)
+        assert other(Document("Test 1, www.web.com!")) == pipe(Document("Test 1, www.web.com!"))
+        assert list(other.pipe(["Test 1.", "Other"])) == list(pipe.pipe(["Test 1.", "Other"]))
+
+    def test_pipe_n_jobs_inplace(self):
+        pipe = Compose([tokenizers.BasicTokenizer()])
+        with pytest.raises(ValueError):
+            list(pipe.pipe(["test"], n_jobs=2, inplace=True))
+
+    def test_acall(self):
+        doc = Document("Basic Test 1")
+        pipe = Compose([cleaners.CleanNumber(), tokenizers.BasicTokenizer()])
+
+        out = asyncio.run(pipe.acall(doc))
+
+        assert out == pipe(doc)
+        assert doc.steps == []
+
+    def test_acall_inplace(self):
+        doc = Document("Basic Test 1")
+        pipe = Compose([cleaners.CleanNumber(), tokenizers.BasicTokenizer()])
+
+        out = asyncio.run(pipe.acall(doc, inplace=True))
+
+        assert out is None
+        assert doc.steps == [repr(t) for t in pipe.transformers]
+
+    def test_async_process_executor(self):
+        pipe = Compose([cleaners.CleanNumber(), tokenizers.BasicTokenizer()])
+        inputs = [Document(f"Basic Test {i}") for i in range(4)]
+        expected = [pipe(doc) for doc in inputs]
+
+        async def run(executor):
+            out = await pipe.acall(inputs[0], executor=executor)
+            docs = [doc async for doc in pipe.apipe(inputs, max_concurrency=2, executor=executor)]
+            doc = Document("Basic Test 1")
+            none = await pipe.acall(doc, inplace=True, executor=executor)
+            return out, docs, doc, none
+
+        with ProcessPoolExecutor(2) as executor:
+            out, docs, doc, none = asyncio.run(run(executor))
+
+        assert out == expected[0]
+        assert docs == expected
+        assert all(d.steps == [] for d in inputs)
+        assert none is None
+        assert doc == expected[1]
+
+        async def run_inplace(executor):
+            return [doc async for doc in pipe.apipe(inputs, inplace=True, executor=executor)]
+
+        with ProcessPoolExecutor(2) as executor:
+            docs = asyncio.run(run_inplace(executor))
+
+        assert all(d is i for d, i in zip(docs, inputs))
+        assert inputs == expected
+
+    @pytest.mark.parametrize('max_concurrency', [1, 3, 100])
+    def test_apipe(self, max_concurrency):
+        inputs = [f"Basic Test {i}" for i in range(10)] + [Document("Other Test")]
+        pipe = Compose([cleaners.CleanNumber(), tokenizers.BasicTokenizer()])
+
+        async def source():
+            for doc in inputs:
+                yield doc
+
+        async def run(docs):
+            return [doc async for doc in pipe.apipe(docs, max_concurrency=max_concurrency)]
+
+        expected = list(pipe.pipe(inputs))
+
+        assert asyncio.run(run(source())) == expected
+        assert asyncio.run(run(inputs)) == expected
+        assert inputs[-1].steps == []
+
+    def test_apipe_backpressure(self):
+        consumed = []
+
+        async def source():
+            for i in range(10):
+                consumed.append(i)
+                yield f"Document {i}"
+
+        async def run():
+            docs = pipe.apipe(source(), max_concurrency=2)
+            first = await docs.__anext__()
+            await docs.aclose()
+            return first
+
+        pipe = Compose([tokenizers.BasicTokenizer()])
+
+        assert asyncio.run(run()).cleaned == "Document 0"
+        assert consumed == [0, 1, 2]
+
+    def test_apipe_invalid_max_concurrency(self):
+        pipe = Compose([tokenizers.BasicTokenizer()])
+
+        async def run():
+            return [doc async for doc in pipe.apipe(["test"], max_concurrency=0)]
+
+        with pytest.raises(ValueError):
+            asyncio.run(run())
@@ -0,0 +1,25 @@
+import pytest
+
+from nlpiper.core.distance import levenshtein
+
+
+class TestLevenshtein:
+
+    @pytest.mark.parametrize('source,target,distance', [
+        ('', '', 0),
+        ('', 'abc', 3),
+        ('abc', 'abc', 0),
+        ('kitten', 'sitting', 3),
+        ('flaw', 'lawn', 2),
+        ('ação', 'acao', 2),
+        ('ab', 'ba', 2),
+        ('prefix-a-suffix', 'prefix-bc-suffix', 2),
+    ])
+    def test_distance(self, source, target, distance):
+        assert levenshtein(source, target) == distance
+        assert levenshtein(target, source) == distance
+
+    @pytest.mark.parametrize('max_distance', [0, 1, 2, 3, 4])
+    def test_max_distance(self, max_distance):
+        assert levenshtein('kitten', 'sitting', max_distance) == min(3, max_distance + 1)
+        assert levenshtein('a', 'abcdefgh', max_distance) == min(7, max_distance + 1)
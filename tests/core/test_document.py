@@ -2,7 +2,13 @@ import pytest
 from pydantic import ValidationError
 
 from nlpiper.core.composition import Compose
-from nlpiper.core.document import Document
+from nlpiper.core.document import (
+    Document,
+    FastDocument,
+    FastToken,
+    TokenSpans
+)
+from nlpiper.transformers.normalizers import CaseTokens
 from nlpiper.transformers.tokenizers import BasicTokenizer
 
 
@@ -64,3 +70,207 @@ class TestDocument:
         with pytest.raises(ModuleNotFoundError):
             doc = Document('Test')
             doc.embedded = 1
+
+
+class TestDocumentCopyOnWrite:
+
+    def test_copy_shares_values(self):
+        pytest.importorskip('numpy')
+        import numpy as np
+
+        d = create_document()
+        d.tokens[0].embedded = np.random.rand(2)
+        d.embedded = np.random.rand(2)
+
+        out = d._copy()
+
+        assert out == d
+        assert out.tokens is not d.tokens
+        assert out.tokens[0] is not d.tokens[0]
+        assert out.steps is not d.steps
+        assert out.tokens[0].embedded is d.tokens[0].embedded
+        assert out.embedded is d.embedded
+
+    def test_copy_is_independent(self):
+        d = create_document()
+
+        out = d._copy()
+        out.cleaned = 'other'
+        out.tokens[0].cleaned = 'other'
+        out.steps.append('other')
+
+        assert d.cleaned == 'Random Stuff.'
+        assert d.tokens[0].cleaned == 'Random'
+        assert d.steps == ['BasicTokenizer()']
+
+    def test_deepcopy_uses_copy_on_write(self):
+        pytest.importorskip('numpy')
+        import numpy as np
+
+        d = create_document()
+        d.tokens[0].embedded = np.random.rand(2)
+
+        out = d._deepcopy(copy_on_write=True)
+
+        assert out == d
+        assert out.tokens[0].embedded is d.tokens[0].embedded
+        assert d._deepcopy().tokens[0].embedded is not d.tokens[0].embedded
+
+    def test_pipeline_with_copy_on_write(self):
+        d = Document('Random Stuff.')
+        pipe = Compose([BasicTokenizer(), CaseTokens()], copy_on_write=True)
+
+        out = pipe(d)
+        out2 = CaseTokens(mode='upper')(out)
+
+        assert [t.cleaned for t in out.tokens] == ['random', 'stuff.']
+        assert [t.cleaned for t in out2.tokens] == ['RANDOM', 'STUFF.']
+        assert d.tokens is None
+        assert d.steps == []
+
+    def test_copy_on_write_is_per_pipeline(self):
+        pytest.importorskip('numpy')
+        import numpy as np
+
+        d = create_document()
+        d.tokens[0].embedded = np.random.rand(2)
+        shared = Compose([CaseTokens()], copy_on_write=True)
+        deep = Compose([CaseTokens()])
+
+        assert shared(d).tokens[0].embedded is d.tokens[0].embedded
+        assert deep(d).tokens[0].embedded is not d.tokens[0].embedded
+
+
+class TestFastDocument:
+
+    def test_same_output_as_document(self):
+        pipe = Compose([BasicTokenizer(), CaseTokens()])
+
+        out = pipe(FastDocument('Random Stuff.'))
+
+        assert out == pipe(Document('Random Stuff.'))
+        assert all(isinstance(token, FastToken) for token in out.tokens)
+
+    def test_inplace(self):
+        doc = FastDocument('Random Stuff.')
+        pipe = Compose([BasicTokenizer(), CaseTokens()])
+
+        out = pipe(doc)
+        pipe(doc, inplace=True)
+
+        assert out == doc
+        assert out is not doc
+
+    @pytest.mark.parametrize('copy_on_write', [True, False])
+    def test_copy(self, copy_on_write):
+        doc = BasicTokenizer()(FastDocument('Random Stuff.'))
+
+        out = doc._deepcopy(copy_on_write)
+        out.tokens[0].cleaned = 'other'
+        out.steps.append('other')
+
+        assert doc.tokens[0].cleaned == 'Random'
+        assert doc.steps == ['BasicTokenizer()']
+
+    def test_convert_document(self):
+        doc = create_document()
+
+        fast = FastDocument.from_document(doc)
+
+        assert fast == doc
+        assert fast.to_document() == doc
+        assert isinstance(fast.to_document(), Document)
+
+    def test_validate(self):
+        doc = FastDocument('Random Stuff.')
+        doc.cleaned = ['Random']
+
+        with pytest.raises(ValidationError):
+            doc.validate()
+
+    def test_validate_token_embedding(self):
+        pytest.importorskip('numpy')
+        import numpy as np
+
+        doc = BasicTokenizer()(FastDocument('Random Stuff.'))
+        doc.tokens[0].embedded = np.random.rand(1)
+        assert doc.validate() is doc
+
+        doc.tokens[0].embedded = 1
+        with pytest.raises(ValidationError):
+            doc.validate()
+
+    def test_dump_and_load(self):
+        doc = BasicTokenizer()(FastDocument('Random Stuff.'))
+
+        out = FastDocument._load(doc._dump())
+
+        assert out == doc
+        assert out.tokens[0] is not doc.tokens[0]
+        assert isinstance(out.tokens[0], FastToken)
+
+    def test_no_extra_attributes(self):
+        with pytest.raises(AttributeError):
+            FastDocument('Random Stuff.').extra = 1
+
+    def test_invalid_original(self):
+        with pytest.raises(TypeError):
+            FastDocument(1)
+
+    def test_repr(self):
+        doc = FastDocument('Test', steps=['A()'])
+        assert repr(doc) == "FastDocument(original='Test', cleaned='Test', tokens=None, embedded=None, steps=['A()'])"
+
+
+class TestTokenSpans:
+
+    def test_read_from_source(self):
+        tokens = TokenSpans('Random Stuff.', [(0, 6), (7, 13)])
+
+        assert len(tokens) == 2
+        assert tokens[1].original == tokens[1].cleaned == 'Stuff.'
+        assert (tokens[-1].start, tokens[-1].end) == (7, 13)
+        assert tokens.columns == {}
+
+    def test_cleaned_stored_when_changed(self):
+        tokens = TokenSpans('Random Stuff.', [(0, 6), (7, 13)])
+
+        tokens[0].cleaned = 'Random'
+        assert tokens.columns == {}
+
+        tokens[1].cleaned = 'stuff'
+        tokens[1].stem = 'stuff'
+        assert tokens.columns == {'cleaned': [None, 'stuff'], 'stem': [None, 'stuff']}
+        assert tokens[1].original == 'Stuff.'
+        assert tokens[1].cleaned == 'stuff'
+
+    def test_texts_different_from_span(self):
+        tokens = TokenSpans('a "b"', [(0, 1), (2, 3)], ['a', '&quot;'])
+
+        assert [token.original for token in tokens] == ['a', '&quot;']
+
+    def test_invalid_field(self):
+        tokens = TokenSpans('Random', [(0, 6)])
+
+        with pytest.raises(AttributeError):
+            tokens[0].extra = 1
+
+        with pytest.raises(IndexError):
+            tokens[1]
+
+    def test_copy_on_write(self):
+        doc = BasicTokenizer(offsets=True)(FastDocument('Random Stuff.'))
+
+        out = Compose([CaseTokens()], copy_on_write=True)(doc)
+
+        assert out.tokens.offsets is doc.tokens.offsets
+        assert [token.cleaned for token in out.tokens] == ['random', 'stuff.']
+        assert [token.cleaned for token in doc.tokens] == ['Random', 'Stuff.']
+
+    def test_dump_and_load(self):
+        doc = CaseTokens()(BasicTokenizer(offsets=True)(FastDocument('Random Stuff.')))
+
+        out = FastDocument._load(doc._dump())
+
+        assert out == doc
+        assert isinstance(out.tokens, TokenSpans)
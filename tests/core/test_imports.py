@@ -0,0 +1,29 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _loaded(statement, modules):
+    program = f"import sys; {statement}; print(' '.join(m for m in {modules!r} if m in sys.modules))"
+    return subprocess.run([sys.executable, '-c', program], check=True, capture_output=True, text=True).stdout.split()
+
+
+@pytest.mark.parametrize('statement,modules', [
+    ("import nlpiper", ('nlpiper.core', 'nlpiper.transformers.cleaners', 'pydantic')),
+    ("from nlpiper.transformers.tokenizers import BasicTokenizer",
+     ('nlpiper.transformers.cleaners', 'nlpiper.core.composition', 'sacremoses', 'stanza')),
+    ("from nlpiper.core import Compose; Compose.create_from_steps(['BasicTokenizer()'])",
+     ('asyncio', 'multiprocessing', 'sqlite3', 'bs4', 'nltk', 'sacremoses', 'gensim', 'numpy')),
+])
+def test_lazy_imports(statement, modules):
+    assert _loaded(statement, modules) == []
+
+
+def test_lazy_attributes():
+    import nlpiper
+
+    assert nlpiper.core.Compose is nlpiper.core.composition.Compose
+    assert nlpiper.transformers.tokenizers.BasicTokenizer.__name__ == 'BasicTokenizer'
+    with pytest.raises(AttributeError):
+        nlpiper.core.NotAName
@@ -0,0 +1,154 @@
+import pickle
+
+import pytest
+
+from nlpiper.core.composition import Compose
+from nlpiper.core.document import Document, FastDocument, FastToken
+from nlpiper.core.parallel import Threaded, _worker_spec, process_pipe
+from nlpiper.transformers.base import BaseTransformer
+from nlpiper.transformers.normalizers import CaseTokens
+from nlpiper.transformers.tokenizers import BasicTokenizer
+
+
+class Unpicklable(BaseTransformer):
+    def __init__(self):
+        super().__init__()
+        self.f = lambda x: x
+
+
+class TestProcessPipe:
+
+    def test_worker_spec_pickle(self):
+        kind, _ = _worker_spec([BasicTokenizer()])
+        assert kind == 'pickle'
+
+    def test_worker_spec_steps(self):
+        kind, payload = _worker_spec([Unpicklable()])
+        assert kind == 'steps'
+        assert payload == ['Unpicklable()']
+
+    def test_process_pipe(self):
+        docs = ["Test document", Document("Other document")]
+
+        out = list(process_pipe([BasicTokenizer()], docs, n_jobs=2, chunksize=1, batch_size=1))
+
+        assert [[t.cleaned for t in d.tokens] for d in out] == [['Test', 'document'], ['Other', 'document']]
+        assert all(d.steps == ['BasicTokenizer()'] for d in out)
+
+    def test_process_pipe_fast_document(self):
+        docs = [FastDocument("Test document"), "Other document"]
+
+        out = list(process_pipe([BasicTokenizer()], docs, n_jobs=1, chunksize=2, batch_size=1))
+
+        assert isinstance(out[0], FastDocument)
+        assert isinstance(out[1], Document)
+        assert out[0].tokens == [FastToken('Test'), FastToken('document')]
+
+    @pytest.mark.parametrize('n_jobs,chunksize', [(0, 1), (-2, 1), (1, 0)])
+    def test_invalid_arguments(self, n_jobs, chunksize):
+        with pytest.raises(ValueError):
+            list(process_pipe([BasicTokenizer()], ["test"], n_jobs=n_jobs, chunksize=chunksize, batch_size=1))
+
+    def test_invalid_input(self):
+        with pytest.raises(TypeError):
+            list(process_pipe([BasicTokenizer()], [1], n_jobs=1, chunksize=1, batch_size=1))
+
+
+class TestDocumentDump:
+
+    def test_dump_and_load(self):
+        doc = BasicTokenizer()(Document("Test document"))
+        doc.tokens[0].extra = 1
+
+        out = Document._load(doc._dump())
+
+        assert out == doc
+        assert out.tokens[0].extra == 1
+
+
+class TestThreaded:
+
+    def test_call(self):
+        t = Threaded(BasicTokenizer())
+        doc = Document("Test document")
+
+        out = t(doc)
+
+        assert [token.cleaned for token in out.tokens] == ['Test', 'document']
+        assert out.steps == ['BasicTokenizer()']
+        assert doc.tokens is None
+
+    @pytest.mark.parametrize('thread_safe', [True, False])
+    def test_batch(self, thread_safe):
+        docs = [Document(f"Test document {i}") for i in range(10)]
+        with Threaded(BasicTokenizer(), n_threads=3, thread_safe=thread_safe) as t:
+            t.batch(docs)
+
+        assert [[token.cleaned for token in d.tokens] for d in docs] == \
+            [['Test', 'document', str(i)] for i in range(10)]
+        assert all(d.steps == ['BasicTokenizer()'] for d in docs)
+
+    def test_instance_pool(self):
+        created = []
+
+        def factory():
+            created.append(BasicTokenizer())
+            return created[-1]
+
+        t = Threaded(BasicTokenizer(), n_threads=2, factory=factory)
+        first = t._acquire()
+        second = t._acquire()
+        t._release(first)
+        t._release(second)
+
+        assert first is t.transformer
+        assert created == [second]
+        assert t._acquire() is first
+
+    def test_instance_rebuilt_from_step(self):
+        t = Threaded(CaseTokens(mode='upper'))
+        t._acquire()
+
+        other = t._acquire()
+
+        assert other is not t.transformer
+        assert repr(other) == repr(t.transformer)
+
+    def test_in_compose(self):
+        with Threaded(CaseTokens(), n_threads=2) as t:
+            out = list(Compose([BasicTokenizer(), t]).pipe(["Test Document", "Other Document"], batch_size=2))
+
+        assert [[token.cleaned for token in d.tokens] for d in out] == [['test', 'document'], ['other', 'document']]
+        assert all(d.steps == ['BasicTokenizer()', "CaseTokens(mode='lower')"] for d in out)
+
+    def test_pickle(self):
+        with Threaded(BasicTokenizer(), n_threads=2) as t:
+            t.batch([Document("test")])
+            other = pickle.loads(pickle.dumps(t))
+
+        assert repr(other) == repr(t)
+        assert other(Document("Test document")).tokens is not None
+
+    def test_batch_raises(self):
+        with Threaded(CaseTokens(), n_threads=2) as t, pytest.raises(RuntimeError):
+            t.batch([Document("test"), Document("other")])
+
+    def test_close(self):
+        t = Threaded(BasicTokenizer(), n_threads=2)
+        t.batch([Document("test"), Document("other")])
+        executor = t._executor
+
+        t.close()
+
+        assert t._executor is None
+        assert executor._shutdown
+        assert all(not thread.is_alive() for thread in executor._threads)
+        # A closed stage starts its threads again when it is used.
+        docs = [Document("test")]
+        t.batch(docs)
+        t.close()
+        assert docs[0].tokens is not None
+
+    def test_invalid_n_threads(self):
+        with pytest.raises(ValueError):
+            Threaded(BasicTokenizer(), n_threads=0)
@@ -0,0 +1,87 @@
+import pytest
+
+from nlpiper.core.cache import ResultCache
+from nlpiper.core.composition import Compose
+from nlpiper.core.document import Document, FastDocument
+from nlpiper.core.profiling import Profiler
+from nlpiper.transformers import cleaners, normalizers, tokenizers
+
+
+def _pipeline(**kwargs):
+    return Compose([cleaners.CleanNumber(), tokenizers.BasicTokenizer(), normalizers.CaseTokens()], **kwargs)
+
+
+class TestProfiler:
+
+    def test_record(self):
+        profiler = Profiler()
+        docs = [Document("a b"), Document("c")]
+        profiler.record('Stage()', docs, 0.5, (10, 0))
+        profiler.record('Stage()', docs, 1.5, (10, 0))
+
+        stats = profiler.report()
+
+        assert stats['seconds'] == 2.0
+        assert stats['stages'] == [{'name': 'Stage()', 'calls': 2, 'documents': 4, 'seconds': 2.0,
+                                    'chars_in': 20, 'chars_out': 8, 'tokens_in': 0, 'tokens_out': 0,
+                                    'documents_per_second': 2.0, 'tokens_per_second': 0.0}]
+
+        profiler.clear()
+        assert profiler.report() == {'stages': [], 'seconds': 0}
+
+
+class TestComposeProfiling:
+
+    @pytest.mark.parametrize('document_class', [Document, FastDocument])
+    def test_stats(self, document_class):
+        pipe = _pipeline(profile=True)
+
+        pipe(document_class("Basic Test 1"))
+        list(pipe.pipe([document_class("Other Test 22"), document_class("Last")], batch_size=10))
+
+        stages = pipe.stats()['stages']
+
+        assert [stats['name'] for stats in stages] == [t.step for t in pipe.transformers]
+        assert [stats['calls'] for stats in stages] == [2, 2, 2]
+        assert [stats['documents'] for stats in stages] == [3, 3, 3]
+        assert [(stats['chars_in'], stats['chars_out']) for stats in stages[:2]] == [(29, 26), (26, 26)]
+        assert [(stats['tokens_in'], stats['tokens_out']) for stats in stages] == [(0, 0), (0, 5), (5, 5)]
+        assert all(stats['seconds'] >= 0 for stats in stages)
+
+    def test_stats_w_checkpoints(self):
+        pipe = _pipeline(profile=True, checkpoints=ResultCache())
+
+        list(pipe.pipe(["Basic Test 1", "Basic Test 1"], batch_size=1))
+
+        assert [stats['documents'] for stats in pipe.stats()['stages']] == [1, 1, 1]
+
+    def test_stats_not_enabled(self):
+        with pytest.raises(RuntimeError):
+            _pipeline().stats()
+
+    def test_hooks(self):
+        calls = []
+        pipe = _pipeline()
+        pipe.add_hook(lambda stage, docs: calls.append(('pre', stage, len(docs))), when='pre')
+        pipe.add_hook(lambda stage, docs, seconds: calls.append(('post', stage, docs[0].steps[-1])))
+
+        out = list(pipe.pipe(["Basic Test 1", "Other"]))
+
+        expected = []
+        for t in pipe.transformers:
+            expected.extend([('pre', t, 2), ('post', t, t.step)])
+        assert calls == expected
+        assert out == list(_pipeline().pipe(["Basic Test 1", "Other"]))
+
+    @pytest.mark.parametrize('profile,hook', [(True, None), (False, 'pre'), (False, 'post')])
+    def test_not_available_w_n_jobs(self, profile, hook):
+        pipe = _pipeline(profile=profile)
+        if hook is not None:
+            pipe.add_hook(print, when=hook)
+
+        with pytest.raises(ValueError):
+            list(pipe.pipe(["Basic Test 1"], n_jobs=2))
+
+    def test_invalid_hook(self):
+        with pytest.raises(ValueError):
+            _pipeline().add_hook(print, when='during')
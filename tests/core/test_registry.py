@@ -0,0 +1,102 @@
+import pytest
+
+from nlpiper.core import registry
+from nlpiper.core.composition import Compose
+from nlpiper.core.parallel import Threaded
+from nlpiper.transformers import cleaners, normalizers, tokenizers
+from nlpiper.transformers.base import BaseTransformer
+
+
+@pytest.fixture(autouse=True)
+def clear_transformers():
+    registry.clear_transformers()
+    yield
+    registry.clear_transformers()
+
+
+class TestCreateTransformer:
+
+    @pytest.mark.parametrize('transformer', [
+        cleaners.CleanNumber(),
+        cleaners.CleanAccents(mode='ascii'),
+        tokenizers.BasicTokenizer(offsets=True),
+        normalizers.CaseTokens(mode='upper'),
+        normalizers.VocabularyFilter(['a', 'b'], case_sensitive=False),
+        Threaded(normalizers.CaseTokens(), n_threads=2),
+    ])
+    def test_create_from_step(self, transformer):
+        out = registry.create_transformer(repr(transformer))
+
+        assert type(out) is type(transformer)
+        assert repr(out) == repr(transformer)
+
+    def test_instances_are_shared(self):
+        out = registry.create_transformer("CaseTokens()")
+
+        assert registry.create_transformer("CaseTokens()") is out
+        assert registry.create_transformer("CaseTokens(mode='lower')") is out
+        assert registry.create_transformer("CaseTokens('lower')") is out
+        assert registry.create_transformer("CaseTokens(mode='upper')") is not out
+        assert registry.create_transformer("CaseTokens()", cached=False) is not out
+
+    def test_clear_transformers(self):
+        out = registry.create_transformer("CleanNumber()")
+        registry.clear_transformers()
+
+        assert registry.create_transformer("CleanNumber()") is not out
+
+    def test_max_transformers(self):
+        registry.set_max_transformers(2)
+        try:
+            first = registry.create_transformer("CaseTokens()")
+            registry.create_transformer("CleanNumber()")
+            assert registry.create_transformer("CaseTokens()") is first
+
+            registry.create_transformer("BasicTokenizer()")
+            registry.create_transformer("CleanEOF()")
+
+            assert len(registry._instances) == 2
+            assert registry.create_transformer("CaseTokens()") is not first
+        finally:
+            registry.set_max_transformers(registry.MAX_TRANSFORMERS)
+
+    @pytest.mark.parametrize('step', [
+        "NotTransformer()", "Document('text')", "open('file')", "CaseTokens(mode=__import__('os'))"
+    ])
+    def test_unknown_name(self, step):
+        with pytest.raises(NameError):
+            registry.create_transformer(step)
+
+    @pytest.mark.parametrize('step', [
+        "CleanNumber(", "CleanNumber", "CaseTokens(mode=str.lower)", "CaseTokens(*['lower'])",
+        "nlpiper.CleanNumber()",
+    ])
+    def test_invalid_step(self, step):
+        with pytest.raises(ValueError):
+            registry.create_transformer(step)
+
+    def test_register(self):
+        class Custom(BaseTransformer):
+            def __init__(self, value: int = 1):
+                super().__init__(value=value)
+
+        registry.register(Custom)
+        try:
+            assert registry.create_transformer("Custom(value=2)").step == "Custom(value=2)"
+        finally:
+            del registry.TRANSFORMERS['Custom']
+
+        with pytest.raises(TypeError):
+            registry.register(int)
+
+
+class TestCreateFromSteps:
+
+    def test_pipelines_share_transformers(self):
+        steps = ['CleanNumber()', 'BasicTokenizer()', "CaseTokens(mode='lower')"]
+
+        first, second = Compose.create_from_steps(steps), Compose.create_from_steps(steps)
+
+        assert all(a is b for a, b in zip(first.transformers, second.transformers))
+        others = Compose.create_from_steps(steps, cached=False).transformers
+        assert all(a is not b for a, b in zip(first.transformers, others))
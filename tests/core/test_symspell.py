@@ -0,0 +1,100 @@
+import pickle
+
+import pytest
+
+from nlpiper.core import symspell
+from nlpiper.core.distance import levenshtein
+from nlpiper.core.symspell import SymSpellIndex
+
+WORDS = {'word': 10, 'ward': 2, 'words': 1, 'world': 5, 'sword': 3, 'coração': 4, 'a': 7}
+
+
+@pytest.fixture(autouse=True)
+def clear_indexes():
+    symspell.clear_indexes()
+    yield
+    symspell.clear_indexes()
+
+
+@pytest.fixture
+def index():
+    return SymSpellIndex.build(WORDS, max_distance=2)
+
+
+class TestSymSpellIndex:
+
+    @pytest.mark.parametrize('token,max_distance,result', [
+        ('word', None, 'word'),
+        ('wrd', None, 'word'),
+        ('wards', 1, 'ward'),
+        ('wrld', 1, 'world'),
+        ('wordl', 1, 'word'),
+        ('swrd', 1, 'sword'),
+        ('coracao', 2, 'coração'),
+        ('coracao', 1, None),
+        ('b', 1, 'a'),
+        ('xyzxyz', None, None),
+        ('wrd', 0, None),
+    ])
+    def test_lookup(self, index, token, max_distance, result):
+        assert index.lookup(token, max_distance) == result
+
+    def test_lookup_matches_brute_force(self, index):
+        for token in ['wor', 'wodrs', 'swors', 'xord', 'worlds', 'corção', 'aa', '']:
+            distance, _, word = min((levenshtein(token, w), -c, w) for w, c in WORDS.items())
+            assert index.lookup(token) == (word if distance <= 2 else None)
+
+    def test_invalid_max_distance(self, index):
+        with pytest.raises(ValueError):
+            index.lookup('wrd', 3)
+        with pytest.raises(ValueError):
+            SymSpellIndex.build(WORDS, max_distance=2, prefix_length=2)
+
+    def test_dictionary(self, index):
+        assert len(index) == len(WORDS)
+        assert list(index) == sorted(WORDS)
+        assert 'coração' in index and 'corazon' not in index
+        assert index.count('word') == 10 and index.count('other') == 0
+        assert SymSpellIndex.build([('a', 1), ('a', 2)]).count('a') == 3
+
+    def test_save_and_load(self, index, tmp_path):
+        path = str(tmp_path / 'words.idx')
+        index.save(path)
+
+        loaded = SymSpellIndex.load(path)
+
+        assert SymSpellIndex.is_index(path)
+        assert loaded.path == path
+        assert list(loaded) == list(index)
+        assert loaded.lookup('wrd') == 'word'
+        assert pickle.loads(pickle.dumps(loaded)).lookup('wards') == 'ward'
+        assert pickle.loads(pickle.dumps(index)).lookup('wards') == 'ward'
+
+    def test_invalid_file(self):
+        with pytest.raises(ValueError):
+            SymSpellIndex(b'\0' * 64)
+
+
+class TestLoadIndex:
+
+    def test_from_frequencies(self, tmp_path):
+        path = tmp_path / 'words.txt'
+        path.write_text("word 10\nward 2\n\nsword\n", encoding='utf-8')
+
+        index = symspell.load_index(str(path), max_distance=1)
+
+        assert list(index) == ['sword', 'ward', 'word']
+        assert index.count('sword') == 1
+        assert index.max_distance == 1
+        assert not SymSpellIndex.is_index(str(path))
+        assert symspell.load_index(str(path), max_distance=1) is index
+        assert symspell.load_index(str(path), max_distance=2) is not index
+
+    def test_from_index(self, index, tmp_path):
+        path = str(tmp_path / 'words.idx')
+        index.save(path)
+
+        loaded = symspell.load_index(path, max_distance=1)
+
+        assert loaded.max_distance == 2
+        assert symspell.load_index(path) is loaded
@@ -0,0 +1,97 @@
+import os
+
+import pytest
+
+from nlpiper.core import vocabulary
+from nlpiper.core.vocabulary import SortedIndex, Vocabulary
+
+
+@pytest.fixture(autouse=True)
+def clear_vocabularies():
+    vocabulary.clear_vocabularies()
+    yield
+    vocabulary.clear_vocabularies()
+
+
+class TestVocabulary:
+
+    @pytest.mark.parametrize('compact,index', [(False, frozenset), (True, SortedIndex)])
+    @pytest.mark.parametrize('sensitive,inputs,results', [
+        (True, ['This', 'is', 'a', 'Token', 'são'], [False, True, True, False, True]),
+        (False, ['This', 'is', 'a', 'Token', 'SÃO'], [True, True, True, True, True]),
+    ])
+    def test_contains(self, compact, index, sensitive, inputs, results):
+        vocab = Vocabulary(['this', 'is', 'a', 'token', 'são', 'is'], case_sensitive=sensitive, compact=compact)
+
+        assert isinstance(vocab.index, index)
+        assert len(vocab) == 5
+        assert [token in vocab for token in inputs] == results
+        assert 'other' not in vocab
+        assert '' not in vocab
+
+    def test_compact_size(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(Vocabulary, 'COMPACT_SIZE', 3)
+        small, large = tmp_path / 'small.txt', tmp_path / 'large.txt'
+        small.write_text("a\nb\n", encoding='utf-8')
+        large.write_text("a\nb\nc\n", encoding='utf-8')
+
+        assert isinstance(Vocabulary(['a', 'b', 'c']).index, frozenset)
+        assert isinstance(Vocabulary.from_file(str(small)).index, frozenset)
+        assert isinstance(Vocabulary.from_file(str(large)).index, SortedIndex)
+
+    def test_case_insensitive_memo(self, monkeypatch):
+        monkeypatch.setattr(Vocabulary, 'MEMO_SIZE', 2)
+        vocab = Vocabulary(['this', 'is'], case_sensitive=False)
+
+        assert [token in vocab for token in ['This', 'IS', 'This', 'other']] == [True, True, True, False]
+        assert len(vocab._lookups) <= 2
+        assert 'THIS' in vocab and 'Other' not in vocab
+
+    def test_sorted_index(self):
+        words = ['b', 'a', 'ab', 'ção', 'z', '']
+        index = SortedIndex(words)
+
+        assert list(index) == sorted(set(words))
+        assert all(word in index for word in words)
+        assert not any(word in index for word in ['c', 'aa', 'zz', 'ca', 1])
+        assert len(SortedIndex([])) == 0
+        assert 'a' not in SortedIndex([])
+
+    @pytest.mark.parametrize('compact', [False, True])
+    def test_from_file(self, tmp_path, compact):
+        path = tmp_path / 'vocab.txt'
+        path.write_text("This\nis\n\n  a  \ntoken\n", encoding='utf-8')
+
+        vocab = Vocabulary.from_file(str(path), case_sensitive=False, compact=compact)
+
+        assert sorted(vocab) == ['a', 'is', 'this', 'token']
+        assert 'THIS' in vocab
+
+
+class TestLoadVocabulary:
+
+    def test_shared(self, tmp_path):
+        path = tmp_path / 'vocab.txt'
+        path.write_text("this\nis\n", encoding='utf-8')
+
+        vocab = vocabulary.load_vocabulary(str(path))
+
+        assert vocabulary.load_vocabulary(os.path.relpath(str(path))) is vocab
+        assert vocabulary.load_vocabulary(str(path), case_sensitive=False) is not vocab
+
+    def test_reloaded_when_changed(self, tmp_path):
+        path = tmp_path / 'vocab.txt'
+        path.write_text("this\n", encoding='utf-8')
+        vocab = vocabulary.load_vocabulary(str(path))
+
+        path.write_text("that\n", encoding='utf-8')
+        os.utime(str(path), ns=(0, 0))
+        out = vocabulary.load_vocabulary(str(path))
+
+        assert out is not vocab
+        assert 'that' in out and 'this' not in out
+
+    def test_shared_factory(self):
+        vocab = vocabulary.shared('key', lambda: Vocabulary(['a']))
+
+        assert vocabulary.shared('key', lambda: Vocabulary(['b'])) is vocab
@@ -2,7 +2,13 @@ import pytest
 
 from nlpiper.transformers.base import (
     BaseTransformer,
-    validate
+    TransformersType,
+    add_batch_step,
+    get_transformer_type,
+    unchecked_batch,
+    unchecked_call,
+    validate,
+    validate_batch
 )
 from nlpiper.core import Document
 
@@ -26,6 +32,29 @@ class TestBaseTransformer:
         base = BaseTransformer(**{'a': 2, 'b': 4, 'c': 10})
         assert repr(base) == "BaseTransformer(a=2, b=4, c=10)"
 
+    def test_step_computed_once(self):
+        calls = []
+
+        class Transformer(BaseTransformer):
+            def __repr__(self):
+                calls.append(self)
+                return super().__repr__()
+
+        base = Transformer(a=['str'] * 100)
+
+        assert base.step == "Transformer(a=%r)" % (['str'] * 100)
+        assert base.step is base.step
+        assert len(calls) == 1
+
+    def test_steps_share_the_step(self):
+        from nlpiper.transformers.tokenizers import BasicTokenizer
+
+        t = BasicTokenizer()
+        first, second = t(Document("a")), t(Document("b"))
+
+        assert first.steps == ['BasicTokenizer()']
+        assert first.steps[0] is second.steps[0]
+
     def test_call_raise(self):
         with pytest.raises(NotImplementedError):
             base = BaseTransformer()
@@ -44,3 +73,68 @@ class TestValidateDecorator:
         doc = Document("test")
         with pytest.raises(RuntimeError):
             test_call(None, doc, False)
+
+
+class TestUnchecked:
+
+    def test_transformer_type(self):
+        from nlpiper.transformers.tokenizers import BasicTokenizer, StanzaTokenizer
+
+        assert get_transformer_type(BasicTokenizer()) is TransformersType.TOKENIZERS
+        assert get_transformer_type(BaseTransformer()) is None
+        assert StanzaTokenizer.__call__.__doc__.startswith("Tokenize the document")
+
+    def test_unchecked_call(self):
+        from nlpiper.transformers.tokenizers import BasicTokenizer
+
+        t = BasicTokenizer()
+        doc = Document("test doc")
+
+        assert unchecked_call(t)(doc) is None
+        assert [token.original for token in doc.tokens] == ['test', 'doc']
+        assert doc.steps == ['BasicTokenizer()']
+        assert unchecked_call(BaseTransformer()) is None
+
+    def test_unchecked_batch(self):
+        from nlpiper.transformers.tokenizers import BasicTokenizer
+
+        docs = [Document("test"), Document("other doc")]
+        unchecked_batch(BasicTokenizer())(docs)
+
+        assert [len(d.tokens) for d in docs] == [1, 2]
+        assert all(d.steps == ['BasicTokenizer()'] for d in docs)
+        assert unchecked_batch(BaseTransformer()) is None
+
+
+class TestBatch:
+
+    def test_default_batch_calls_transformer(self):
+        class Upper(BaseTransformer):
+            def __call__(self, doc, inplace=False):
+                doc.cleaned = doc.cleaned.upper()
+
+        docs = [Document("test"), Document("other")]
+        Upper().batch(docs)
+
+        assert [d.cleaned for d in docs] == ["TEST", "OTHER"]
+
+    def test_validate_batch(self):
+
+        @validate_batch(TransformersType.NORMALIZERS)
+        def test_call(self, docs):
+            pass
+
+        with pytest.raises(RuntimeError):
+            test_call(None, [Document("test")])
+
+    def test_add_batch_step(self):
+        base = BaseTransformer(a=1)
+
+        @add_batch_step
+        def test_call(self, docs):
+            pass
+
+        docs = [Document("test"), Document("other")]
+        test_call(base, docs)
+
+        assert all(d.steps == [repr(base)] for d in docs)
@@ -0,0 +1,65 @@
+import pytest
+
+from nlpiper.core.composition import Compose
+from nlpiper.core.document import Document
+from nlpiper.transformers.embeddings import GensimEmbeddings
+from nlpiper.transformers.tokenizers import BasicTokenizer
+
+gensim = pytest.importorskip('gensim')
+np = pytest.importorskip('numpy')
+
+
+class TestGensimEmbeddingsVectorized:
+    texts = ['a b x', '', 'x y', 'c c a']
+
+    @pytest.fixture
+    def keyed_vectors(self):
+        vectors = gensim.models.KeyedVectors(4)
+        vectors.add_vectors(['a', 'b', 'c'], np.arange(12, dtype=np.float32).reshape(3, 4))
+        return vectors
+
+    def expected(self, keyed_vectors, text, apply_doc):
+        rows = [keyed_vectors[token] if token in keyed_vectors.key_to_index else np.zeros(4, dtype='float32')
+                for token in text.split()]
+        return getattr(np, apply_doc)(rows, axis=0) if rows else np.zeros(4)
+
+    @pytest.mark.parametrize('chunk_size', [GensimEmbeddings.CHUNK_SIZE, 2])
+    @pytest.mark.parametrize('apply_doc', ['sum', 'mean'])
+    def test_call_and_batch(self, keyed_vectors, apply_doc, chunk_size, monkeypatch):
+        monkeypatch.setattr(GensimEmbeddings, 'CHUNK_SIZE', chunk_size)
+        e = GensimEmbeddings(keyed_vectors, apply_doc)
+        docs = [BasicTokenizer()(Document(text)) for text in self.texts]
+
+        out = [e(doc) for doc in docs]
+        e.batch(docs)
+
+        for text, o, doc in zip(self.texts, out, docs):
+            expected = self.expected(keyed_vectors, text, apply_doc)
+            assert np.allclose(o.embedded, expected)
+            assert np.allclose(doc.embedded, expected)
+            assert doc.steps == o.steps
+            # The documents do not keep the pooled matrix of their batch alive.
+            assert o.embedded.base is None and doc.embedded.base is None
+            for token, other in zip(doc.tokens, o.tokens):
+                row = (keyed_vectors[token.cleaned] if token.cleaned in keyed_vectors.key_to_index
+                       else np.zeros(4))
+                assert np.array_equal(token.embedded, row)
+                assert np.array_equal(other.embedded, row)
+
+        # The vectors of the model are not changed by the out of vocabulary tokens.
+        assert keyed_vectors['a'].tolist() == [0, 1, 2, 3]
+
+    def test_batch_validation(self, keyed_vectors):
+        e = GensimEmbeddings(keyed_vectors)
+
+        with pytest.raises(RuntimeError):
+            e.batch([Document('a')])
+
+    def test_pipe(self, keyed_vectors):
+        e = GensimEmbeddings(keyed_vectors)
+        pipeline = Compose([BasicTokenizer(), e])
+
+        out = list(pipeline.pipe(self.texts, batch_size=4))
+
+        assert [np.allclose(doc.embedded, self.expected(keyed_vectors, text, 'mean'))
+                for doc, text in zip(out, self.texts)] == [True] * 4
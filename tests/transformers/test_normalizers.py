@@ -1,3 +1,6 @@
+import sys
+import types
+
 import pytest
 
 from nlpiper.transformers.normalizers import (
@@ -36,9 +39,6 @@ class TestNormalizersValidations:
         with pytest.raises(ModuleNotFoundError):
             RemoveStopWords()
 
-        with pytest.raises(ModuleNotFoundError):
-            SpellCheck(max_distance=1)
-
         with pytest.raises(ModuleNotFoundError):
             Stemmer(version='nltk')
 
@@ -196,6 +196,23 @@ class TestVocabularyFilter:
         assert doc.steps == [repr(t), repr(n)]
         assert out is None
 
+    def test_vocabulary_filter_from_path(self, tmp_path):
+        path = tmp_path / 'vocab.txt'
+        path.write_text("\n".join(self.vocabulary), encoding='utf-8')
+        doc = BasicTokenizer()(Document("This is a Token"))
+
+        n = VocabularyFilter(path=str(path), case_sensitive=False)
+        out = n(doc)
+
+        assert [tk.cleaned for tk in out.tokens] == ['This', 'is', 'a', 'Token']
+        assert repr(n) == f"VocabularyFilter(case_sensitive=False, path={str(path)!r})"
+        assert VocabularyFilter(path=str(path), case_sensitive=False).vocab is n.vocab
+
+    @pytest.mark.parametrize('kwargs', [{}, {'vocabulary': ['a'], 'path': 'vocab.txt'}])
+    def test_vocabulary_filter_w_invalid_args(self, kwargs):
+        with pytest.raises(ValueError):
+            VocabularyFilter(**kwargs)
+
 
 class TestSpellCheck:
     @pytest.mark.parametrize('max_distance,inputs,results', [
@@ -233,6 +250,110 @@ class TestSpellCheck:
         assert out is None
 
 
+class FakeHunspell:
+    words = {'this', 'is', 'a', 'word', 'words', 'ward'}
+
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+
+    def spell(self, token):
+        self.calls.append(('spell', token))
+        return token.lower() in self.words
+
+    def suggest(self, token):
+        self.calls.append(('suggest', token))
+        return tuple(w for w in ('ward', 'word', 'words') if w[:2] == token[:2])
+
+
+@pytest.fixture
+def fake_hunspell(monkeypatch):
+    module = types.ModuleType('hunspell')
+    module.Hunspell = FakeHunspell
+    monkeypatch.setitem(sys.modules, 'hunspell', module)
+
+
+@pytest.mark.usefixtures('fake_hunspell')
+class TestSpellCheckCache:
+
+    @pytest.mark.parametrize('max_distance,inputs,results', [
+        (None, ['this', 'wordx', 'wordx', 'xyz'], ['this', '', '', '']),
+        (1, ['this', 'wordx', 'wordx', 'xyz', 'wxyz'], ['this', 'word', 'word', 'xyz', 'wxyz']),
+        (2, ['wrd', 'wods'], ['wrd', 'words']),
+    ])
+    def test_spell_checking(self, max_distance, inputs, results):
+        n = SpellCheck(max_distance=max_distance)
+
+        assert [n._normalize(token) for token in inputs] == results
+        assert repr(n) == f"SpellCheck(language='en_GB', max_distance={max_distance!r})"
+
+    def test_cache(self):
+        n = SpellCheck(max_distance=1)
+
+        out = n(BasicTokenizer()(Document("this wordx this wordx")))
+
+        assert [tk.cleaned for tk in out.tokens] == ['this', 'word', 'this', 'word']
+        assert n.h.calls == [('spell', 'this'), ('spell', 'wordx'), ('suggest', 'wordx')]
+        assert n.cache_stats()['verdicts']['hit_rate'] == 0.5
+        assert n.cache_stats()['suggestions'] == {'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1, 'hit_rate': 0.5}
+
+    def test_cache_disabled(self):
+        n = SpellCheck(max_distance=1, cache_size=0)
+
+        assert [n._normalize(token) for token in ['wordx', 'wordx']] == ['word', 'word']
+        assert len(n.h.calls) == 4
+        assert repr(n) == "SpellCheck(language='en_GB', max_distance=1, cache_size=0)"
+        with pytest.raises(RuntimeError):
+            n.cache_stats()
+
+    def test_shared_cache(self):
+        n = SpellCheck(max_distance=1, shared_cache=True)
+
+        assert SpellCheck(max_distance=1, shared_cache=True).verdicts is n.verdicts
+        assert SpellCheck(max_distance=1, shared_cache=True).suggestions is n.suggestions
+        assert SpellCheck(max_distance=2, shared_cache=True).suggestions is not n.suggestions
+        assert SpellCheck(max_distance=1).verdicts is not n.verdicts
+
+
+class TestSpellCheckSymSpell:
+
+    @pytest.fixture
+    def dictionary(self, tmp_path):
+        path = tmp_path / 'words.txt'
+        path.write_text("this 10\nis 10\na 10\nword 5\nward 1\n", encoding='utf-8')
+        return str(path)
+
+    @pytest.mark.parametrize('max_distance,inputs,results', [
+        (None, ['this', 'wrd', 'xyz'], ['this', '', '']),
+        (1, ['this', 'wrd', 'wardx', 'xyz'], ['this', 'word', 'ward', 'xyz']),
+    ])
+    def test_spell_checking(self, dictionary, max_distance, inputs, results):
+        doc = BasicTokenizer()(Document(" ".join(inputs)))
+
+        n = SpellCheck(max_distance=max_distance, engine='symspell', dictionary=dictionary)
+        out = n(doc)
+
+        assert [tk.cleaned for tk in out.tokens] == results
+        assert out.steps[-1] == (f"SpellCheck(language='en_GB', max_distance={max_distance!r}, engine='symspell', "
+                                 f"dictionary={dictionary!r})")
+
+    def test_index_file(self, dictionary, tmp_path):
+        from nlpiper.core.symspell import load_index
+
+        path = str(tmp_path / 'words.idx')
+        load_index(dictionary, max_distance=1).save(path)
+        n = SpellCheck(max_distance=1, engine='symspell', dictionary=path)
+
+        assert n._normalize('wrd') == 'word'
+        with pytest.raises(ValueError):
+            SpellCheck(max_distance=2, engine='symspell', dictionary=path)
+
+    def test_invalid_engine(self):
+        with pytest.raises(ValueError):
+            SpellCheck(engine='symspell')
+        with pytest.raises(ValueError):
+            SpellCheck(engine='random')
+
+
 class TestStemmer:
 
     @pytest.mark.parametrize('version,language,inputs,results', [
@@ -274,3 +395,53 @@ class TestStemmer:
     def test_unavailable_version(self):
         with pytest.raises(ValueError):
             Stemmer(version='random')
+
+    def test_cache(self):
+        pytest.importorskip('nltk')
+        n = Stemmer()
+        calls = []
+        stem = n.stemmer.stem
+        n.stemmer.stem = lambda token: calls.append(token) or stem(token)
+
+        out = n(BasicTokenizer()(Document("running runs running running runs")))
+
+        assert [tk.stem for tk in out.tokens] == ['run', 'run', 'run', 'run', 'run']
+        assert calls == ['running', 'runs']
+        assert n.cache_stats() == {'hits': 3, 'misses': 2, 'evictions': 0, 'size': 2, 'hit_rate': 0.6}
+        assert repr(n) == "Stemmer(version='nltk', language='english')"
+
+    def test_cache_disabled(self):
+        pytest.importorskip('nltk')
+        n = Stemmer(cache_size=0)
+
+        assert n.cache is None
+        assert n._normalize('running') == 'run'
+        assert repr(n) == "Stemmer(version='nltk', language='english', cache_size=0)"
+        with pytest.raises(RuntimeError):
+            n.cache_stats()
+        with pytest.raises(ValueError):
+            Stemmer(cache_size=-1)
+        with pytest.raises(ValueError):
+            Stemmer(cache_size=0, cache_path='stems.tsv')
+
+    def test_shared_cache(self):
+        pytest.importorskip('nltk')
+
+        assert Stemmer(shared_cache=True).cache is Stemmer(shared_cache=True, cache_size=10).cache
+        assert Stemmer(shared_cache=True).cache is not Stemmer(language='portuguese', shared_cache=True).cache
+        assert Stemmer().cache is not Stemmer().cache
+
+    def test_warm_start(self, tmp_path):
+        pytest.importorskip('nltk')
+        path = str(tmp_path / 'stems.tsv')
+        n = Stemmer()
+        n._normalize('running')
+        n.save_cache(path)
+
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write("Xyz\txy\n\n")
+        warm = Stemmer(cache_path=path)
+
+        assert warm.cache.items() == [('running', 'run'), ('Xyz', 'xy')]
+        assert warm._normalize('Xyz') == 'xy'
+        assert warm.cache_stats()['hit_rate'] == 1.0
@@ -7,7 +7,9 @@ from nlpiper.transformers.tokenizers import (
 )
 from nlpiper.core.document import (
     Document,
-    Token
+    FastDocument,
+    Token,
+    TokenSpans
 )
 
 
@@ -63,6 +65,23 @@ class TestBasicTokenizer:
         assert doc.steps == [repr(t)]
         assert out is None
 
+    @pytest.mark.parametrize('inputs,results', [
+        ('Test to  this test', [('Test', 0, 4), ('to', 5, 7), ('this', 9, 13), ('test', 14, 18)]),
+        (' numbers\n123 ', [('numbers', 1, 8), ('123', 9, 12)]),
+    ])
+    def test_tokenizer_offsets(self, inputs, results):
+        t = BasicTokenizer(offsets=True)
+
+        out = t(FastDocument(inputs))
+
+        assert out.steps == ['BasicTokenizer(offsets=True)']
+        assert isinstance(out.tokens, TokenSpans)
+        assert [(token.original, token.start, token.end) for token in out.tokens] == results
+        assert out.to_document().tokens == [Token(token, start=start, end=end) for token, start, end in results]
+
+        with pytest.raises(TypeError):
+            t(Document(inputs))
+
 
 class TestMosesTokenizer:
     @pytest.mark.parametrize('inputs,results', [
@@ -90,6 +109,18 @@ class TestMosesTokenizer:
         assert doc.steps == [repr(t)]
         assert out is None
 
+    def test_tokenizer_offsets(self):
+        pytest.importorskip('sacremoses')
+
+        t = MosesTokenizer(offsets=True)
+        out = t(FastDocument('say "hi" @ x'))
+
+        assert [(token.original, token.start, token.end) for token in out.tokens] == [
+            ('say', 0, 3), ('&quot;', 4, 5), ('hi', 5, 7), ('&quot;', 7, 8), ('@', 9, 10), ('x', 11, 12)]
+        assert [token.original for token in out.tokens] == [
+            token.original for token in MosesTokenizer()(Document('say "hi" @ x')).tokens]
+        assert out.steps == ['MosesTokenizer(offsets=True)']
+
 
 class TestStanzaTokenizer:
     @pytest.mark.parametrize('inputs,results', [